@@ -1,12 +1,21 @@
+import asyncio
 from typing import AsyncGenerator, Optional
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Query, Request, Security, status
 from fastapi.security import OAuth2PasswordBearer, SecurityScopes
+from sqlalchemy.orm import raiseload
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from jose import JWTError, jwt
+from jose import JWTError
 from uuid import UUID
+from app.core.anonymization import age_band_bounds
+from app.core.revoked_tokens import RevokedTokenStore
 from app.core.security import SecurityConfig, TokenData
+from app.db.cohorts import age_bounds
 from app.db.session import async_session
+from app.models.medical_condition import ConditionCategory, Severity
+from app.models.patient import Gender
 from app.models.user import User, UserRole
+from app.schemas.patient import MAX_AGE, PatientCohort
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="auth/token",
@@ -31,6 +40,56 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+async def get_maintenance_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for a database session with maintenance timeouts.
+    
+    For admin operations such as view refreshes that legitimately run
+    longer than interactive requests are allowed to.
+    
+    Yields:
+        AsyncSession: Database session for async operations
+    """
+    async with async_session("maintenance") as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+async def cancel_on_disconnect(request: Request) -> AsyncGenerator[None, None]:
+    """
+    Cancel the request handler when the client disconnects.
+    
+    A watcher waits for the ``http.disconnect`` message and cancels the
+    handler's task; asyncpg then cancels the running statement on the
+    server, so an abandoned request stops holding its connection. The
+    request body has already been read when dependencies run, so the
+    watcher only ever receives the disconnect.
+    
+    Raises:
+        HTTPException: 499 if the handler was cancelled by a disconnect
+    """
+    task = asyncio.current_task()
+    disconnected = False
+
+    async def watch() -> None:
+        nonlocal disconnected
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
+        disconnected = True
+        task.cancel()
+
+    watcher = asyncio.create_task(watch())
+    try:
+        yield
+    except asyncio.CancelledError:
+        if not disconnected:
+            raise
+        task.uncancel()
+        raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        watcher.cancel()
+
 async def get_current_user(
     security_scopes: SecurityScopes,
     token: str = Depends(oauth2_scheme),
@@ -61,11 +120,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": authenticate_value},
     )
     try:
-        payload = jwt.decode(
-            token,
-            SecurityConfig.SECRET_KEY,
-            algorithms=[SecurityConfig.ALGORITHM]
-        )
+        payload = SecurityConfig.token_service.verify(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -74,16 +129,136 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    user = await db.get(User, username=token_data.username)
-    if user is None:
+    # The user's patients are not needed for authentication; skip loading them.
+    # Revocations made by other workers are checked in the same query.
+    jti = payload.get("jti")
+    result = await db.execute(
+        select(User, RevokedTokenStore.is_revoked(jti))
+        .where(User.username == token_data.username)
+        .options(raiseload(User.patients))
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise credentials_exception
+    user, revoked = row
+    if revoked:
+        SecurityConfig.token_service.revoke(jti, float(payload["exp"]))
         raise credentials_exception
         
-    for scope in security_scopes.scopes:
-        if scope not in token_data.scopes:
+    # Endpoint scopes list the roles allowed in; any one of them suffices
+    if security_scopes.scopes and not set(security_scopes.scopes) & set(token_data.scopes):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+            headers={"WWW-Authenticate": authenticate_value},
+        )
+            
+    return user
+
+def get_cohort(
+    min_age: Optional[int] = Query(default=None, ge=0, le=MAX_AGE),
+    max_age: Optional[int] = Query(default=None, ge=0, le=MAX_AGE),
+    age_band: Optional[str] = None,
+    gender: Optional[Gender] = None,
+    doctor_id: Optional[UUID] = None,
+    condition_category: Optional[ConditionCategory] = None,
+    severity: Optional[Severity] = None
+) -> PatientCohort:
+    """
+    Dependency for cohort criteria given as query parameters.
+    
+    Args:
+        min_age: Minimum age in whole years
+        max_age: Maximum age in whole years
+        age_band: Age band label, e.g. "85+"
+        gender: Patient gender
+        doctor_id: ID of the primary doctor
+        condition_category: Category of an active condition
+        severity: Severity of that active condition
+        
+    Returns:
+        PatientCohort: Cohort criteria
+        
+    Raises:
+        HTTPException: If the age criteria are inconsistent
+    """
+    if min_age is not None and max_age is not None and min_age > max_age:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="min_age cannot be greater than max_age"
+        )
+    cohort = PatientCohort(
+        min_age=min_age,
+        max_age=max_age,
+        age_band=age_band,
+        gender=gender,
+        doctor_id=doctor_id,
+        condition_category=condition_category,
+        severity=severity
+    )
+    try:
+        age_bounds(cohort)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(exc)
+        )
+    return cohort
+
+def get_export_cohort(
+    age_band: Optional[str] = None,
+    gender: Optional[Gender] = None,
+    min_age: Optional[int] = Query(default=None, include_in_schema=False),
+    max_age: Optional[int] = Query(default=None, include_in_schema=False),
+    doctor_id: Optional[UUID] = Query(default=None, include_in_schema=False),
+    condition_category: Optional[ConditionCategory] = Query(default=None, include_in_schema=False),
+    severity: Optional[Severity] = Query(default=None, include_in_schema=False)
+) -> PatientCohort:
+    """
+    Dependency for the cohort of an anonymized export.
+
+    Pseudonyms are stable across exports, so any criterion finer than
+    the released (age band, gender) classes would let exports be
+    compared to recover it, e.g. an exact age or the primary doctor.
+    The cohort is therefore a union of whole classes, and classes counted
+    within it have their size in the whole population.
+
+    Args:
+        age_band: Export age band label, e.g. "85-89" or "90+"
+        gender: Patient gender
+        min_age: Rejected, ages are selected by band
+        max_age: Rejected, ages are selected by band
+        doctor_id: Rejected, not a released attribute
+        condition_category: Rejected, not a released attribute
+        severity: Rejected, not a released attribute
+
+    Returns:
+        PatientCohort: Cohort criteria
+
+    Raises:
+        HTTPException: If a criterion other than the age band and gender
+            is given, or the age band is not an export band
+    """
+    rejected = {
+        "min_age": min_age,
+        "max_age": max_age,
+        "doctor_id": doctor_id,
+        "condition_category": condition_category,
+        "severity": severity,
+    }
+    given = [name for name, value in rejected.items() if value is not None]
+    if given:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Exports can only be restricted by age_band and gender, not {', '.join(given)}"
+        )
+    min_age = max_age = None
+    if age_band is not None:
+        try:
+            min_age, max_age = age_band_bounds(age_band)
+        except ValueError as exc:
             raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not enough permissions",
-                headers={"WWW-Authenticate": authenticate_value},
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=str(exc)
             )
-            
-    return user
\ No newline at end of file
+    return PatientCohort(min_age=min_age, max_age=max_age, gender=gender)
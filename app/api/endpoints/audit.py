@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, Security
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.deps import get_current_user, get_db
+from app.core.audit import AuditStore
+from app.models.user import User
+from app.schemas.audit import AuditEntry
+
+router = APIRouter(prefix="/audit", tags=["audit"])
+
+@router.get("/resources/{resource_type}/{resource_id}", response_model=List[AuditEntry])
+async def read_resource_history(
+    *,
+    db: AsyncSession = Depends(get_db),
+    resource_type: str,
+    resource_id: UUID,
+    current_user: User = Security(get_current_user, scopes=["admin"]),
+    since: Optional[datetime] = None,
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
+    limit: int = Query(default=100, ge=1, le=500)
+) -> List[AuditEntry]:
+    """
+    Retrieve who accessed or changed a resource.
+    
+    Args:
+        db: Database session
+        resource_type: Type of the resource, e.g. "Patient"
+        resource_id: ID of the resource
+        current_user: Authenticated user
+        since: Optional inclusive lower time bound
+        before: Optional exclusive upper time bound, for paging
+        before_id: With ``before``, id of the last entry of the previous
+            page, so entries sharing its timestamp are not skipped
+        limit: Maximum number of entries to return
+        
+    Returns:
+        List[AuditEntry]: Audit entries, newest first
+    """
+    return await AuditStore(db).resource_history(
+        resource_type, resource_id,
+        since=since, before=before, before_id=before_id, limit=limit
+    )
+
+@router.get("/users/{user_id}", response_model=List[AuditEntry])
+async def read_user_activity(
+    *,
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID,
+    current_user: User = Security(get_current_user, scopes=["admin"]),
+    since: Optional[datetime] = None,
+    before: Optional[datetime] = None,
+    before_id: Optional[UUID] = None,
+    limit: int = Query(default=100, ge=1, le=500)
+) -> List[AuditEntry]:
+    """
+    Retrieve what a user accessed or changed.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
+        current_user: Authenticated user
+        since: Optional inclusive lower time bound
+        before: Optional exclusive upper time bound, for paging
+        before_id: With ``before``, id of the last entry of the previous
+            page, so entries sharing its timestamp are not skipped
+        limit: Maximum number of entries to return
+        
+    Returns:
+        List[AuditEntry]: Audit entries, newest first
+    """
+    return await AuditStore(db).user_activity(
+        user_id, since=since, before=before, before_id=before_id, limit=limit
+    )
\ No newline at end of file
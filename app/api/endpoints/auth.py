@@ -1,18 +1,48 @@
 from datetime import timedelta
-from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Form, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.deps import get_current_user, get_db, oauth2_scheme
+from app.core.refresh_tokens import (
+    InvalidRefreshToken,
+    RefreshTokenReuse,
+    RefreshTokenStore,
+)
+from app.core.revoked_tokens import RevokedTokenStore
 from app.core.security import SecurityConfig, Token
-from app.db.session import get_session
-from app.models.user import User
+from app.models.user import User, UserRole
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+def _access_token_for(user: User, refresh_token: str) -> Token:
+    """
+    Build the token response for a user.
+    
+    Args:
+        user: Authenticated user
+        refresh_token: Raw refresh token to hand back to the client
+        
+    Returns:
+        Token: Access and refresh token pair
+    """
+    access_token_expires = timedelta(minutes=SecurityConfig.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = SecurityConfig.create_access_token(
+        data={"sub": user.username, "scopes": [user.role.value]},
+        expires_delta=access_token_expires,
+    )
+    return Token(
+        access_token=access_token,
+        token_type="bearer",
+        expires_in=int(access_token_expires.total_seconds()),
+        refresh_token=refresh_token
+    )
+
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
@@ -23,7 +53,7 @@ async def login_for_access_token(
         form_data: OAuth2 form data with username and password
         
     Returns:
-        Token: Access token if authentication successful
+        Token: Access and refresh tokens if authentication successful
         
     Raises:
         HTTPException: If authentication fails
@@ -41,10 +71,105 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    access_token_expires = timedelta(minutes=SecurityConfig.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = SecurityConfig.create_access_token(
-        data={"sub": user.username, "scopes": [user.role.value]},
-        expires_delta=access_token_expires,
-    )
+    refresh_token, _ = await RefreshTokenStore(db).issue(user.id)
+    return _access_token_for(user, refresh_token)
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+    db: AsyncSession = Depends(get_db),
+    grant_type: str = Form(default="refresh_token", pattern="^refresh_token$"),
+    refresh_token: str = Form(...)
+) -> Any:
+    """
+    OAuth2 refresh token grant.
+    
+    The refresh token is rotated: the presented one is invalidated and a
+    new one is returned with an extended sliding expiry. No password
+    verification is performed.
     
-    return Token(access_token=access_token, token_type="bearer")
\ No newline at end of file
+    Args:
+        db: Database session
+        grant_type: OAuth2 grant type, must be "refresh_token"
+        refresh_token: Refresh token from a previous token response
+        
+    Returns:
+        Token: New access and refresh tokens
+        
+    Raises:
+        HTTPException: If the refresh token is invalid, expired or reused
+    """
+    try:
+        user, new_refresh_token = await RefreshTokenStore(db).rotate(refresh_token)
+    except RefreshTokenReuse:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected, session revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except InvalidRefreshToken:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    return _access_token_for(user, new_refresh_token)
+
+@router.post("/sessions/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_sessions(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Security(get_current_user),
+    user_id: Optional[UUID] = None
+) -> None:
+    """
+    Revoke all refresh tokens of a user.
+    
+    Users can end their own sessions; admins can end anyone's.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated user
+        user_id: User whose sessions to revoke, current user if None
+        
+    Raises:
+        HTTPException: If a non-admin targets another user
+    """
+    target_id = user_id or current_user.id
+    if target_id != current_user.id and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    await RefreshTokenStore(db).revoke_user(target_id)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Security(get_current_user)
+) -> None:
+    """
+    Revoke the access token used for this request on every worker.
+    
+    Args:
+        db: Database session
+        token: JWT token to revoke
+        current_user: Authenticated user
+    """
+    claims = SecurityConfig.token_service.verify(token)
+    if "jti" in claims:
+        await RevokedTokenStore(db).revoke(claims["jti"], float(claims["exp"]))
+
+@router.get("/jwks.json")
+async def read_jwks() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Publish the public token verification keys.
+    
+    Other services use this key set to verify our tokens locally,
+    selecting the key by the ``kid`` token header.
+    
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: JWK set with the public keys
+    """
+    return SecurityConfig.token_service.jwks()
\ No newline at end of file
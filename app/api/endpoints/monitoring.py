@@ -0,0 +1,125 @@
+from dataclasses import asdict
+from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Security, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.deps import get_current_user, get_db
+from app.core.scheduler import run_statistics
+from app.db.query_control import explain_generic, slow_query_log
+from app.models.job_run import JobRun
+from app.models.user import User
+from app.schemas.monitoring import JobRunEntry, JobStatus, SchedulerStatus, SlowQueryEntry
+
+router = APIRouter(prefix="/monitoring", tags=["monitoring"])
+
+@router.get("/slow-queries", response_model=List[SlowQueryEntry])
+async def read_slow_queries(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Security(get_current_user, scopes=["admin"]),
+    limit: int = Query(default=50, ge=1, le=500),
+    explain: bool = False
+) -> List[SlowQueryEntry]:
+    """
+    Retrieve the slowest recent statements captured by this worker.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated user
+        limit: Maximum number of entries to return
+        explain: Whether to attach each statement's generic plan
+        
+    Returns:
+        List[SlowQueryEntry]: Captured statements, most recent first
+    """
+    entries = [SlowQueryEntry(**asdict(entry)) for entry in slow_query_log.entries(limit)]
+    if explain:
+        plans = {}
+        for entry in entries:
+            if entry.statement not in plans:
+                plans[entry.statement] = await explain_generic(db, entry.statement)
+            entry.plan = plans[entry.statement]
+    return entries
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_slow_queries(
+    *,
+    current_user: User = Security(get_current_user, scopes=["admin"])
+) -> None:
+    """
+    Clear the captured statements of this worker.
+    
+    Args:
+        current_user: Authenticated user
+    """
+    slow_query_log.clear()
+
+@router.get("/jobs", response_model=SchedulerStatus)
+async def read_jobs(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Security(get_current_user, scopes=["admin"])
+) -> SchedulerStatus:
+    """
+    Retrieve the background job schedule and run metrics.
+    
+    Args:
+        request: Incoming request, carrying this worker's scheduler
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        SchedulerStatus: Schedule of this worker and metrics of all runs
+    """
+    scheduler = getattr(request.app.state, "scheduler", None)
+    statistics = await run_statistics(db)
+    jobs = {}
+    if scheduler is not None:
+        for job in scheduler.jobs.values():
+            jobs[job.name] = JobStatus(
+                name=job.name,
+                schedule=job.trigger.expression,
+                leader_only=job.leader_only,
+                next_run_at=job.next_run_at
+            )
+    for name, metrics in statistics.items():
+        last_run = metrics.pop("last_run")
+        job = jobs.setdefault(name, JobStatus(name=name))
+        for field, value in metrics.items():
+            setattr(job, field, value)
+        job.last_run = JobRunEntry(**last_run.model_dump())
+    return SchedulerStatus(
+        worker=scheduler.worker if scheduler is not None else None,
+        running=scheduler is not None,
+        leader=scheduler is not None and scheduler.is_leader,
+        jobs=sorted(jobs.values(), key=lambda job: job.name)
+    )
+
+@router.get("/jobs/{name}/runs", response_model=List[JobRunEntry])
+async def read_job_runs(
+    *,
+    name: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Security(get_current_user, scopes=["admin"]),
+    limit: int = Query(default=50, ge=1, le=500)
+) -> List[JobRunEntry]:
+    """
+    Retrieve the recorded runs of a background job.
+    
+    Args:
+        name: Job name
+        db: Database session
+        current_user: Authenticated user
+        limit: Maximum number of runs to return
+        
+    Returns:
+        List[JobRunEntry]: Runs, most recent first
+    """
+    result = await db.execute(
+        select(JobRun)
+        .where(JobRun.job == name)
+        .order_by(JobRun.started_at.desc())
+        .limit(limit)
+    )
+    return [JobRunEntry(**run.model_dump()) for run in result.scalars()]
@@ -1,12 +1,26 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Security, status
+from datetime import datetime, timezone
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Security, status
+from sqlalchemy import Text, Uuid, any_, bindparam, func, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import raiseload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_cohort, get_current_user, get_db
+from app.db.bulk import LiteRows
+from app.db.cohorts import age_bounds, cohort_criteria
 from app.models.patient import Patient
 from app.models.user import User, UserRole
+from app.schemas.patient import PatientBatchRequest, PatientBatchResponse, PatientCohort, PatientUpdate
 from app.core.audit import AuditLog
+from app.core.outbox import record_change
+from app.core.conditional import (
+    is_not_modified,
+    not_modified_response,
+    set_validators,
+    weak_etag,
+)
 
 router = APIRouter(prefix="/patients", tags=["patients"])
 
@@ -14,50 +28,103 @@ router = APIRouter(prefix="/patients", tags=["patients"])
 async def read_patients(
     *,
     db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
     current_user: User = Security(
         get_current_user,
         scopes=["admin", "doctor", "nurse"]
     ),
     skip: int = 0,
     limit: int = Query(default=100, le=100),
-    search: Optional[str] = None
-) -> List[Patient]:
+    search: Optional[str] = None,
+    cohort: PatientCohort = Depends(get_cohort)
+) -> Union[List[Patient], Response]:
     """
-    Retrieve patients with pagination and optional search.
+    Retrieve patients with pagination, optional search and cohort filters.
+    
+    Age criteria are translated into a ``date_of_birth`` range, so
+    filtering by age uses the birth date index instead of computing the
+    age of every patient.
+    
+    The page's validators (row count, id range and latest ``updated_at``)
+    are computed first from narrow columns; if they match the client's
+    ``If-None-Match``/``If-Modified-Since`` a 304 is returned without
+    loading or serializing the patients.
     
     Args:
         db: Database session
+        request: Incoming request, for conditional headers
+        response: Outgoing response, for validator headers
         current_user: Authenticated user
         skip: Number of records to skip
         limit: Maximum number of records to return
         search: Optional search term for patient name
+        cohort: Age, gender, doctor and condition criteria
         
     Returns:
-        List[Patient]: List of patient records
+        List[Patient]: List of patient records, or 304 if unchanged
     """
-    query = select(Patient)
+    conditions = []
     
     if current_user.role == UserRole.DOCTOR:
-        query = query.where(Patient.primary_doctor_id == current_user.id)
+        conditions.append(Patient.primary_doctor_id == current_user.id)
 
     if search:
-        query = query.where(
+        conditions.append(
             (Patient.first_name.ilike(f"%{search}%")) |
             (Patient.last_name.ilike(f"%{search}%"))
         )
+    today = datetime.now(timezone.utc).date()
+    conditions.extend(cohort_criteria(cohort, today))
     
-    query = query.offset(skip).limit(limit)
-    result = await db.exec(query)
-    patients = result.scalars().all()
+    page = (
+        select(Patient.id, Patient.updated_at)
+        .where(*conditions)
+        .order_by(Patient.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    validators = await db.execute(
+        select(
+            func.count(),
+            # Postgres has no min/max over uuid; the text form orders the same way
+            func.min(page.c.id.cast(Text)),
+            func.max(page.c.id.cast(Text)),
+            func.max(page.c.updated_at)
+        )
+    )
+    count, first_id, last_id, last_modified = validators.one()
+    visible_to = current_user.id if current_user.role == UserRole.DOCTOR else "all"
+    filters = cohort.model_dump(mode="json", exclude_none=True)
+    # Ages move with the calendar, so the day is part of an age filter's validators
+    age_day = today if age_bounds(cohort) != (None, None) else None
+    etag = weak_etag(
+        visible_to, search, skip, limit, filters, age_day,
+        count, first_id, last_id, last_modified
+    )
+    not_modified = is_not_modified(request, etag, last_modified)
 
     audit = AuditLog(db)
     await audit.log_action(
         user_id=current_user.id,
         action="READ",
         resource_type="Patient",
-        details={"search": search, "skip": skip, "limit": limit}
+        details={"search": search, "skip": skip, "limit": limit, "cohort": filters}
     )
     
+    if not_modified:
+        return not_modified_response(etag, last_modified)
+
+    query = (
+        LiteRows.select(Patient, *conditions)
+        .order_by(Patient.id)
+        .offset(skip)
+        .limit(limit)
+    )
+    patients = await LiteRows.fetch(db, Patient, query)
+    set_validators(response, etag, last_modified)
+    
     return patients
 
 @router.post("/", response_model=Patient)
@@ -95,39 +162,100 @@ async def create_patient(
     
     return patient
 
+@router.post("/batch", response_model=PatientBatchResponse)
+async def read_patients_batch(
+    *,
+    db: AsyncSession = Depends(get_db),
+    batch: PatientBatchRequest,
+    current_user: User = Security(
+        get_current_user,
+        scopes=["admin", "doctor", "nurse"]
+    )
+) -> PatientBatchResponse:
+    """
+    Retrieve many patients by ID in a single query.
+    
+    Doctors only see their own patients; other IDs are reported as
+    missing, exactly like IDs that do not exist. One audit record lists
+    every patient returned.
+    
+    Args:
+        db: Database session
+        batch: Patient IDs to fetch
+        current_user: Authenticated user
+        
+    Returns:
+        PatientBatchResponse: Patients found and IDs missing
+    """
+    requested = list(dict.fromkeys(batch.ids))
+    query = LiteRows.select(
+        Patient,
+        Patient.id == any_(bindparam("ids", requested, type_=ARRAY(Uuid)))
+    )
+    if current_user.role == UserRole.DOCTOR:
+        query = query.where(Patient.primary_doctor_id == current_user.id)
+    
+    found = {patient.id: patient for patient in await LiteRows.fetch(db, Patient, query)}
+    patients = [found[patient_id] for patient_id in requested if patient_id in found]
+    missing = [patient_id for patient_id in requested if patient_id not in found]
+    
+    audit = AuditLog(db)
+    await audit.log_action(
+        user_id=current_user.id,
+        action="READ",
+        resource_type="Patient",
+        resource_ids=[patient.id for patient in patients],
+        details={"requested": len(requested), "missing": len(missing)}
+    )
+    
+    return PatientBatchResponse(patients=patients, missing=missing)
+
 @router.get("/{patient_id}", response_model=Patient)
 async def read_patient(
     *,
     db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
     patient_id: UUID,
     current_user: User = Security(
         get_current_user,
         scopes=["admin", "doctor", "nurse"]
     )
-) -> Patient:
+) -> Union[Patient, Response]:
     """
     Retrieve a specific patient by ID.
     
+    Access checks and conditional headers are evaluated on the
+    patient's ``updated_at`` alone; the full record is only loaded when
+    the client's copy is stale.
+    
     Args:
         db: Database session
+        request: Incoming request, for conditional headers
+        response: Outgoing response, for validator headers
         patient_id: UUID of the patient
         current_user: Authenticated user
         
     Returns:
-        Patient: Patient record
+        Patient: Patient record, or 304 if unchanged
         
     Raises:
         HTTPException: If patient not found or user lacks permission
     """
-    patient = await db.get(Patient, patient_id)
-    if not patient:
+    result = await db.execute(
+        select(Patient.primary_doctor_id, Patient.updated_at)
+        .where(Patient.id == patient_id)
+    )
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Patient not found"
         )
+    primary_doctor_id, last_modified = row
     
     if (current_user.role == UserRole.DOCTOR and
-        patient.primary_doctor_id != current_user.id):
+        primary_doctor_id != current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this patient"
@@ -141,4 +269,108 @@ async def read_patient(
         resource_id=patient_id
     )
     
-    return patient
\ No newline at end of file
+    etag = weak_etag(patient_id, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    
+    patient = await db.get(Patient, patient_id)
+    set_validators(response, etag, last_modified)
+    return patient
+
+@router.patch("/{patient_id}", response_model=Patient)
+async def update_patient(
+    *,
+    db: AsyncSession = Depends(get_db),
+    response: Response,
+    patient_id: UUID,
+    changes: PatientUpdate,
+    current_user: User = Security(
+        get_current_user,
+        scopes=["admin", "doctor", "nurse"]
+    )
+) -> Patient:
+    """
+    Partially update a patient with optimistic concurrency control.
+    
+    The update is a single ``UPDATE ... WHERE id AND version RETURNING``
+    statement: it applies only if the patient is still at the version
+    the client read, bumps the version, and lets the database set
+    ``updated_at``. No row is locked or read beforehand; the reason a
+    statement matched nothing is only looked up on that failure path.
+    
+    Args:
+        db: Database session
+        response: Outgoing response, for validator headers
+        patient_id: UUID of the patient
+        changes: Fields to change and the version they apply to
+        current_user: Authenticated user
+        
+    Returns:
+        Patient: Updated patient record
+        
+    Raises:
+        HTTPException: If the patient is not found, the user lacks
+            permission, or the patient changed since it was read
+    """
+    values = changes.model_dump(exclude_unset=True, exclude={"version"})
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update"
+        )
+    if "primary_doctor_id" in values and current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can reassign patients"
+        )
+    if values.get("gender") is not None:
+        values["gender"] = values["gender"].value
+    
+    conditions = [Patient.id == patient_id, Patient.version == changes.version]
+    if current_user.role == UserRole.DOCTOR:
+        conditions.append(Patient.primary_doctor_id == current_user.id)
+    
+    result = await db.execute(
+        update(Patient)
+        .where(*conditions)
+        .values(**values, version=Patient.version + 1)
+        .returning(Patient)
+        .options(raiseload(Patient.primary_doctor))
+    )
+    patient = result.scalar_one_or_none()
+    
+    if patient is None:
+        result = await db.execute(
+            select(Patient.primary_doctor_id, Patient.version)
+            .where(Patient.id == patient_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found"
+            )
+        if (current_user.role == UserRole.DOCTOR and
+            row.primary_doctor_id != current_user.id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not authorized to access this patient"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Patient was modified concurrently; current version is {row.version}"
+        )
+    
+    # Core statements bypass the flush listener, so the event is added here
+    record_change(db, patient, "updated")
+    audit = AuditLog(db)
+    await audit.log_action(
+        user_id=current_user.id,
+        action="UPDATE",
+        resource_type="Patient",
+        resource_id=patient_id,
+        details={"fields": sorted(values), "version": patient.version}
+    )
+    
+    set_validators(response, weak_etag(patient_id, patient.updated_at), patient.updated_at)
+    return patient
@@ -0,0 +1,213 @@
+import json
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query, Security
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ColumnElement, Integer, extract, func, literal_column, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.deps import get_current_user, get_db, get_export_cohort
+from app.core.anonymization import (
+    Pseudonymizer,
+    ResearchConfig,
+    age_band_label,
+    generalize_date,
+)
+from app.core.audit import AuditLog
+from app.db.bulk import LiteRows
+from app.db.cohorts import cohort_criteria
+from app.db.session import async_session
+from app.models.medical_condition import MedicalCondition
+from app.models.patient import Patient
+from app.models.user import User
+from app.models.vital_signs import VitalSigns
+from app.schemas.patient import PatientCohort
+
+router = APIRouter(prefix="/research", tags=["research"])
+
+# Constants are inlined so the expression is identical in SELECT and GROUP BY
+_band_years = literal_column(str(ResearchConfig.AGE_BAND_YEARS))
+age_band_start = func.least(
+    func.floor(
+        extract("year", func.age(func.current_date(), Patient.date_of_birth))
+        / _band_years
+    ) * _band_years,
+    literal_column(str(ResearchConfig.AGE_TOP_CODE))
+).cast(Integer).label("age_band_start")
+# Birth dates in the future are data entry errors with no age band; they are
+# left out of the export and of the class sizes alike
+has_age = Patient.date_of_birth <= func.current_date()
+
+async def _suppressed_classes(
+    db: AsyncSession,
+    k: int,
+    criteria: List[ColumnElement[bool]]
+) -> Set[Tuple[int, str]]:
+    """
+    Find quasi-identifier classes with fewer than ``k`` patients.
+
+    Classes are counted within the exported cohort, which is a union of
+    whole classes (see ``get_export_cohort``), so the counts are those of
+    the whole population.
+
+    Args:
+        db: Database session
+        k: Minimum class size
+        criteria: Cohort clauses
+
+    Returns:
+        Set[Tuple[int, str]]: (age band start, gender) pairs to suppress
+    """
+    stmt = (
+        select(age_band_start, Patient.gender)
+        .where(Patient.is_active, has_age, *criteria)
+        .group_by(age_band_start, Patient.gender)
+        .having(func.count() < k)
+    )
+    result = await db.execute(stmt)
+    return {(band, gender) for band, gender in result}
+
+async def _clinical_data(
+    db: AsyncSession,
+    patient_ids: List[UUID]
+) -> Tuple[Dict[UUID, List[Dict[str, Any]]], Dict[UUID, Dict[str, Any]]]:
+    """
+    Load generalized conditions and vitals summaries for a batch of patients.
+
+    Args:
+        db: Database session
+        patient_ids: Patients in the batch
+
+    Returns:
+        Tuple: Conditions and vitals summaries keyed by patient id
+    """
+    conditions: Dict[UUID, List[Dict[str, Any]]] = defaultdict(list)
+    stmt = LiteRows.select(
+        MedicalCondition,
+        MedicalCondition.patient_id.in_(patient_ids),
+        MedicalCondition.is_active,
+        fields=("patient_id", "category", "severity", "diagnosis_date")
+    )
+    for condition in await LiteRows.fetch(db, MedicalCondition, stmt):
+        conditions[condition.patient_id].append({
+            "category": condition.category.value,
+            "severity": condition.severity.value,
+            "diagnosis_year": condition.diagnosis_date.year,
+        })
+
+    vitals: Dict[UUID, Dict[str, Any]] = {}
+    stmt = select(
+        VitalSigns.patient_id,
+        func.count(),
+        func.avg(VitalSigns.blood_pressure_systolic),
+        func.avg(VitalSigns.blood_pressure_diastolic),
+        func.avg(VitalSigns.heart_rate),
+        func.avg(VitalSigns.oxygen_saturation),
+        func.min(VitalSigns.measured_at),
+        func.max(VitalSigns.measured_at)
+    ).where(
+        VitalSigns.patient_id.in_(patient_ids)
+    ).group_by(VitalSigns.patient_id)
+    for row in await db.execute(stmt):
+        patient_id, count, systolic, diastolic, heart_rate, spo2, first, last = row
+        vitals[patient_id] = {
+            "measurements": count,
+            "mean_systolic": round(float(systolic), 1) if systolic is not None else None,
+            "mean_diastolic": round(float(diastolic), 1) if diastolic is not None else None,
+            "mean_heart_rate": round(float(heart_rate), 1) if heart_rate is not None else None,
+            "mean_oxygen_saturation": round(float(spo2), 1) if spo2 is not None else None,
+            "first_measured": generalize_date(first),
+            "last_measured": generalize_date(last),
+        }
+    return conditions, vitals
+
+async def _export_records(
+    k: int,
+    batch_size: int,
+    criteria: List[ColumnElement[bool]]
+) -> AsyncIterator[str]:
+    """
+    Stream the pseudonymized dataset as NDJSON.
+
+    Patients are read through a server-side cursor in batches; each batch
+    is enriched with two set-based queries and written as one chunk, so
+    memory use does not grow with the population size.
+
+    Args:
+        k: Minimum quasi-identifier class size
+        batch_size: Patients per batch
+        criteria: Cohort clauses
+
+    Yields:
+        str: NDJSON chunk for one batch
+    """
+    pseudonymizer = Pseudonymizer()
+    async with async_session("export") as db:
+        # One snapshot for the class sizes and the rows they filter
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        suppressed = await _suppressed_classes(db, k, criteria)
+        stmt = (
+            select(Patient.id, Patient.gender, age_band_start)
+            .where(Patient.is_active, has_age, *criteria)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await db.stream(stmt)
+        async for partition in result.partitions(batch_size):
+            batch = [
+                (patient_id, gender, band)
+                for patient_id, gender, band in partition
+                if (band, gender) not in suppressed
+            ]
+            if not batch:
+                continue
+            conditions, vitals = await _clinical_data(db, [row[0] for row in batch])
+            yield "".join(
+                json.dumps({
+                    "pseudonym": pseudonymizer.pseudonym(patient_id),
+                    "age_band": age_band_label(band),
+                    "gender": gender,
+                    "conditions": conditions.get(patient_id, []),
+                    "vitals": vitals.get(patient_id),
+                }) + "\n"
+                for patient_id, gender, band in batch
+            )
+
+@router.get("/export")
+async def export_research_dataset(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Security(
+        get_current_user,
+        scopes=["admin", "researcher"]
+    ),
+    k: int = Query(default=ResearchConfig.K_ANONYMITY, ge=ResearchConfig.K_ANONYMITY),
+    cohort: PatientCohort = Depends(get_export_cohort)
+) -> StreamingResponse:
+    """
+    Stream an anonymized dataset of patients, conditions and vitals.
+
+    Patients are identified by keyed-hash pseudonyms, ages are
+    generalized to bands and dates to months or years. Patients whose
+    (age band, gender) class has fewer than ``k`` members are suppressed.
+
+    Args:
+        db: Database session
+        current_user: Authenticated user
+        k: Minimum class size for k-anonymity
+        cohort: Age band and gender selecting the exported patients
+
+    Returns:
+        StreamingResponse: NDJSON stream, one patient per line
+    """
+    audit = AuditLog(db)
+    await audit.log_action(
+        user_id=current_user.id,
+        action="EXPORT",
+        resource_type="ResearchDataset",
+        details={"k": k, "cohort": cohort.model_dump(mode="json", exclude_none=True)}
+    )
+
+    return StreamingResponse(
+        _export_records(k, ResearchConfig.BATCH_SIZE, cohort_criteria(cohort)),
+        media_type="application/x-ndjson"
+    )
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, Security, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.deps import get_current_user, get_db, get_maintenance_db
+from app.db.aggregates import PatientAggregates
+from app.models.user import User
+from app.schemas.stats import PatientStats
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+@router.get("/patients", response_model=PatientStats)
+async def read_patient_stats(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Security(
+        get_current_user,
+        scopes=["admin", "doctor", "nurse"]
+    )
+) -> PatientStats:
+    """
+    Retrieve precomputed patient counts for dashboards.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        PatientStats: Patient counts per doctor, age band and condition
+    """
+    return await PatientAggregates.read(db)
+
+@router.post("/refresh", status_code=status.HTTP_204_NO_CONTENT)
+async def refresh_patient_stats(
+    *,
+    db: AsyncSession = Depends(get_maintenance_db),
+    current_user: User = Security(get_current_user, scopes=["admin"])
+) -> None:
+    """
+    Recompute the patient counts.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated user
+    """
+    await PatientAggregates.refresh(db)
\ No newline at end of file
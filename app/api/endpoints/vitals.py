@@ -0,0 +1,209 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Security, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.deps import get_current_user, get_db
+from app.core.audit import AuditLog
+from app.core.live_feed import (
+    FeedUnavailable,
+    LiveFeedConfig,
+    Subscription,
+    VitalsFeed,
+    notify_vitals,
+)
+from app.models.patient import Patient
+from app.models.user import User, UserRole
+from app.models.vital_signs import VitalSigns
+from app.schemas.vitals import VitalSignsCreate
+
+router = APIRouter(prefix="/vitals", tags=["vitals"])
+
+def get_vitals_feed(request: Request) -> VitalsFeed:
+    """
+    Get the worker's vitals feed.
+
+    Args:
+        request: Incoming request, carrying the application state
+
+    Returns:
+        VitalsFeed: Feed shared by the worker's clients
+
+    Raises:
+        HTTPException: If the feed is not running
+    """
+    feed = getattr(request.app.state, "vitals_feed", None)
+    if feed is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live feed is not running"
+        )
+    return feed
+
+def _event(name: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    """Format one server-sent event."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {name}", f"data: {json.dumps(data)}"]
+    return "\n".join(lines) + "\n\n"
+
+async def _relay(feed: VitalsFeed, subscription: Subscription) -> AsyncIterator[str]:
+    """
+    Relay a subscription's events until the client leaves or is dropped.
+
+    A comment line is sent after every heartbeat period without events,
+    so proxies keep the connection open. Events already buffered are
+    delivered before a drop is reported; the None queued by the drop
+    wakes the relay without waiting for the heartbeat.
+
+    Args:
+        feed: Worker's vitals feed
+        subscription: Client's subscription
+
+    Yields:
+        str: Server-sent event
+    """
+    try:
+        yield ": connected\n\n"
+        while True:
+            if subscription.dropped and subscription.queue.empty():
+                yield _event("dropped", {"reason": subscription.reason})
+                return
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), LiveFeedConfig.HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if event is not None:
+                yield _event("vitals", event, event.get("id"))
+    finally:
+        feed.unsubscribe(subscription)
+
+@router.post("/", response_model=VitalSigns)
+async def create_vital_signs(
+    *,
+    db: AsyncSession = Depends(get_db),
+    measurement: VitalSignsCreate,
+    current_user: User = Security(
+        get_current_user,
+        scopes=["admin", "doctor", "nurse"]
+    )
+) -> VitalSigns:
+    """
+    Record a vital signs measurement and push it to live feed subscribers.
+
+    The notification is sent in the inserting transaction, so it is
+    delivered to every worker exactly when the row commits.
+
+    Args:
+        db: Database session
+        measurement: Measured values
+        current_user: Authenticated user, recorded as the measurer
+
+    Returns:
+        VitalSigns: Recorded measurement
+
+    Raises:
+        HTTPException: If patient not found or user lacks permission
+    """
+    result = await db.execute(
+        select(Patient.primary_doctor_id).where(Patient.id == measurement.patient_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Patient not found"
+        )
+    if current_user.role == UserRole.DOCTOR and row[0] != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this patient"
+        )
+
+    vitals = VitalSigns(**measurement.model_dump(), measured_by_id=current_user.id)
+    db.add(vitals)
+    await notify_vitals(db, vitals)
+
+    audit = AuditLog(db)
+    await audit.log_action(
+        user_id=current_user.id,
+        action="CREATE",
+        resource_type="VitalSigns",
+        resource_id=vitals.id,
+        details={"patient_id": str(measurement.patient_id)}
+    )
+
+    return vitals
+
+@router.get("/stream")
+async def stream_vital_signs(
+    *,
+    db: AsyncSession = Depends(get_db),
+    feed: VitalsFeed = Depends(get_vitals_feed),
+    current_user: User = Security(
+        get_current_user,
+        scopes=["admin", "doctor", "nurse"]
+    ),
+    patient_ids: List[UUID] = Query(
+        min_length=1,
+        max_length=LiveFeedConfig.MAX_PATIENTS_PER_SUBSCRIPTION
+    )
+) -> StreamingResponse:
+    """
+    Stream new vital signs of a set of patients as server-sent events.
+
+    Each measurement is a ``vitals`` event whose id is the measurement
+    id. A ``dropped`` event ends the stream when the client falls too
+    far behind; it should reconnect and reload recent measurements.
+
+    Args:
+        db: Database session
+        feed: Worker's vitals feed
+        current_user: Authenticated user
+        patient_ids: Patients to follow, e.g. the beds of a ward
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` response
+
+    Raises:
+        HTTPException: If a patient is not accessible, or the feed
+            cannot take more subscribers
+    """
+    requested = set(patient_ids)
+    query = select(Patient.id).where(Patient.id.in_(requested))
+    if current_user.role == UserRole.DOCTOR:
+        query = query.where(Patient.primary_doctor_id == current_user.id)
+    found = set((await db.execute(query)).scalars())
+    if found != requested:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"{len(requested - found)} patients not found or not accessible"
+        )
+
+    audit = AuditLog(db)
+    await audit.log_action(
+        user_id=current_user.id,
+        action="READ",
+        resource_type="VitalSigns",
+        resource_ids=sorted(requested),
+        details={"stream": True}
+    )
+
+    try:
+        subscription = await feed.subscribe(requested)
+    except FeedUnavailable as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(exc),
+            headers={"Retry-After": "5"}
+        )
+    return StreamingResponse(
+        _relay(feed, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
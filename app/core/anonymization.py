@@ -0,0 +1,97 @@
+import hashlib
+import hmac
+from datetime import date
+from typing import Optional, Tuple
+from uuid import UUID
+from app.core.config import get_settings
+
+class ResearchConfig:
+    """Research export configuration."""
+    _settings = get_settings().research
+    PSEUDONYM_KEY: str = _settings.pseudonym_key.get_secret_value()
+    K_ANONYMITY: int = _settings.k_anonymity
+    AGE_BAND_YEARS: int = _settings.age_band_years
+    AGE_TOP_CODE: int = _settings.age_top_code
+    BATCH_SIZE: int = _settings.batch_size
+
+class Pseudonymizer:
+    """
+    Class for deriving stable pseudonymous identifiers.
+
+    Identifiers are keyed hashes, so the same patient always maps to the
+    same pseudonym across exports while the mapping cannot be reversed or
+    recomputed without the key.
+    """
+
+    def __init__(self, key: Optional[str] = None):
+        """
+        Initialize pseudonymizer.
+
+        Args:
+            key: Secret HMAC key, ``ResearchConfig.PSEUDONYM_KEY`` if None
+        """
+        self.key = (key or ResearchConfig.PSEUDONYM_KEY).encode()
+
+    def pseudonym(self, identifier: UUID) -> str:
+        """
+        Map an identifier to its pseudonym.
+
+        Args:
+            identifier: Real identifier
+
+        Returns:
+            str: Hex HMAC-SHA256 digest truncated to 128 bits
+        """
+        return hmac.new(self.key, identifier.bytes, hashlib.sha256).hexdigest()[:32]
+
+def age_band_label(band_start: int) -> str:
+    """
+    Format a generalized age band.
+
+    Args:
+        band_start: Lower bound of the band, as computed in SQL
+
+    Returns:
+        str: Band label such as "75-79", or "90+" for top-coded ages
+    """
+    if band_start >= ResearchConfig.AGE_TOP_CODE:
+        return f"{ResearchConfig.AGE_TOP_CODE}+"
+    return f"{band_start}-{band_start + ResearchConfig.AGE_BAND_YEARS - 1}"
+
+def age_band_bounds(label: str) -> Tuple[int, Optional[int]]:
+    """
+    Ages covered by a generalized age band.
+
+    Args:
+        label: Band label as formatted by ``age_band_label``
+
+    Returns:
+        Tuple[int, Optional[int]]: Minimum and maximum age, None for the
+            top-coded band
+
+    Raises:
+        ValueError: If the label is not one of the released bands
+    """
+    for band_start in range(0, ResearchConfig.AGE_TOP_CODE, ResearchConfig.AGE_BAND_YEARS):
+        if label == age_band_label(band_start):
+            return band_start, min(
+                band_start + ResearchConfig.AGE_BAND_YEARS, ResearchConfig.AGE_TOP_CODE
+            ) - 1
+    if label == age_band_label(ResearchConfig.AGE_TOP_CODE):
+        return ResearchConfig.AGE_TOP_CODE, None
+    raise ValueError(
+        f"Unknown age band {label!r}, expected a band of the export such as "
+        f"{age_band_label(0)!r} or {age_band_label(ResearchConfig.AGE_TOP_CODE)!r}"
+    )
+
+def generalize_date(value: Optional[date]) -> Optional[str]:
+    """
+    Reduce a date to year and month.
+
+    Args:
+        value: Date to generalize
+
+    Returns:
+        Optional[str]: "YYYY-MM", or None if no date
+    """
+    return value.strftime("%Y-%m") if value is not None else None
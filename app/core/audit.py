@@ -1,7 +1,10 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
+from sqlalchemy import Select, and_, or_, select, union_all
+from sqlalchemy.orm import aliased
 from sqlmodel import Session
 from uuid import UUID
+from app.models.audit import AuditRecord
 from app.schemas.audit import AuditEntry
 
 class AuditLog:
@@ -27,7 +30,8 @@ class AuditLog:
         action: str,
         resource_type: str,
         resource_id: Optional[UUID] = None,
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        resource_ids: Optional[List[UUID]] = None
     ) -> None:
         """
         Log an action in the audit trail.
@@ -38,14 +42,150 @@ class AuditLog:
             resource_type: Type of resource being acted upon
             resource_id: Optional ID of the specific resource
             details: Optional additional details about the action
+            resource_ids: Optional IDs of all resources touched by a batch action
         """
-        audit_entry = AuditEntry(
+        audit_entry = AuditRecord(
             user_id=user_id,
             action=action,
             resource_type=resource_type,
             resource_id=resource_id,
+            resource_ids=resource_ids,
             details=details,
             timestamp=datetime.now(timezone.utc)
         )
         self.db_session.add(audit_entry)
-        await self.db_session.commit()
\ No newline at end of file
+        await self.db_session.commit()
+
+class AuditStore:
+    """
+    Class for querying the audit trail.
+    
+    Queries are served by the ``(resource_type, resource_id, timestamp)``
+    and ``(user_id, timestamp)`` indexes of each monthly partition, and
+    time bounds prune partitions outside the requested range. Results
+    are newest first, ties broken by id; pass the timestamp and id of the
+    last entry as ``before`` and ``before_id`` to page.
+    """
+    
+    def __init__(self, db_session: Session):
+        """
+        Initialize audit store.
+        
+        Args:
+            db_session: SQLModel session for database operations
+        """
+        self.db_session = db_session
+
+    async def resource_history(
+        self,
+        resource_type: str,
+        resource_id: UUID,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        limit: int = 100,
+        before_id: Optional[UUID] = None
+    ) -> List[AuditEntry]:
+        """
+        Who accessed or changed a resource.
+        
+        Batch actions listing the resource in ``resource_ids`` are
+        included, found through the GIN index on that column. The two
+        kinds of entries are read by separate top-N queries, so entries
+        naming the resource directly are still read newest first from
+        the resource index, and only ``limit`` rows of each are merged.
+        
+        Args:
+            resource_type: Type of the resource, e.g. "Patient"
+            resource_id: ID of the resource
+            since: Optional inclusive lower time bound
+            before: Optional exclusive upper time bound
+            limit: Maximum number of entries to return
+            before_id: With ``before``, also return entries at exactly
+                ``before`` whose id is lower
+            
+        Returns:
+            List[AuditEntry]: Matching entries, newest first
+        """
+        direct = self._statement(
+            [
+                AuditRecord.resource_type == resource_type,
+                AuditRecord.resource_id == resource_id,
+            ],
+            since, before, before_id, limit
+        )
+        batch = self._statement(
+            [
+                AuditRecord.resource_type == resource_type,
+                AuditRecord.resource_ids.contains([resource_id]),
+                AuditRecord.resource_id.is_distinct_from(resource_id),
+            ],
+            since, before, before_id, limit
+        )
+        merged = union_all(direct, batch).subquery()
+        entry = aliased(AuditRecord, merged)
+        return await self._entries(
+            select(entry).order_by(entry.timestamp.desc(), entry.id.desc()).limit(limit)
+        )
+
+    async def user_activity(
+        self,
+        user_id: UUID,
+        since: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        limit: int = 100,
+        before_id: Optional[UUID] = None
+    ) -> List[AuditEntry]:
+        """
+        What a user accessed or changed.
+        
+        Args:
+            user_id: ID of the user
+            since: Optional inclusive lower time bound
+            before: Optional exclusive upper time bound
+            limit: Maximum number of entries to return
+            before_id: With ``before``, also return entries at exactly
+                ``before`` whose id is lower
+            
+        Returns:
+            List[AuditEntry]: Matching entries, newest first
+        """
+        return await self._entries(
+            self._statement(
+                [AuditRecord.user_id == user_id], since, before, before_id, limit
+            )
+        )
+
+    @staticmethod
+    def _statement(
+        conditions: List[Any],
+        since: Optional[datetime],
+        before: Optional[datetime],
+        before_id: Optional[UUID],
+        limit: int
+    ) -> Select:
+        """Build an index-ordered audit query with an optional keyset cursor."""
+        if since is not None:
+            conditions.append(AuditRecord.timestamp >= since)
+        if before is not None and before_id is not None:
+            # The first bound alone is served by the timestamp index
+            conditions.append(AuditRecord.timestamp <= before)
+            conditions.append(or_(
+                AuditRecord.timestamp < before,
+                and_(AuditRecord.timestamp == before, AuditRecord.id < before_id)
+            ))
+        elif before is not None:
+            conditions.append(AuditRecord.timestamp < before)
+        return (
+            select(AuditRecord)
+            .where(*conditions)
+            .order_by(AuditRecord.timestamp.desc(), AuditRecord.id.desc())
+            .limit(limit)
+        )
+
+    async def _entries(self, stmt: Select) -> List[AuditEntry]:
+        """Run an audit query and convert its records."""
+        result = await self.db_session.execute(stmt)
+        return [
+            AuditEntry.model_validate(record, from_attributes=True)
+            for record in result.scalars()
+        ]
\ No newline at end of file
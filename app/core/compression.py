@@ -0,0 +1,169 @@
+import zlib
+from typing import Dict, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+class CompressionConfig:
+    """Response compression configuration."""
+    _settings = get_settings().compression
+    MINIMUM_SIZE: int = _settings.minimum_size
+    GZIP_LEVEL: int = _settings.gzip_level
+    BROTLI_QUALITY: int = _settings.brotli_quality
+    EXCLUDED_CONTENT_TYPES: tuple = ("text/event-stream",)
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into encoding -> q-value."""
+    encodings = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            encodings[name.strip().lower()] = quality
+    return encodings
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the response encoding for a request.
+
+    Brotli is preferred when the client accepts it and the optional
+    ``brotli`` package is installed, gzip otherwise.
+
+    Args:
+        accept_encoding: Accept-Encoding request header
+
+    Returns:
+        Optional[str]: "br", "gzip", or None for no compression
+    """
+    encodings = _accepted_encodings(accept_encoding)
+    if brotli is not None and encodings.get("br", 0.0) > 0:
+        return "br"
+    if encodings.get("gzip", 0.0) > 0:
+        return "gzip"
+    return None
+
+class _Encoder:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str):
+        """
+        Initialize encoder.
+
+        Args:
+            encoding: "br" or "gzip"
+        """
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=CompressionConfig.BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(
+                CompressionConfig.GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """
+        Compress a chunk, flushing so streamed chunks reach the client.
+
+        Args:
+            data: Uncompressed chunk
+            final: Whether this is the last chunk
+
+        Returns:
+            bytes: Compressed bytes
+        """
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + (self._brotli.finish() if final else self._brotli.flush())
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip, as negotiated.
+
+    Responses smaller than ``CompressionConfig.MINIMUM_SIZE`` are sent
+    as is, as are bodiless responses (e.g. 304), already encoded ones
+    and server-sent event streams. Streamed responses are compressed
+    chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body to compress, config default if None
+        """
+        self.app = app
+        self.minimum_size = (
+            minimum_size if minimum_size is not None else CompressionConfig.MINIMUM_SIZE
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Wrap ``send`` to compress the response body."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip()
+                passthrough = (
+                    "content-encoding" in headers
+                    or media_type in CompressionConfig.EXCLUDED_CONTENT_TYPES
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if len(body) < self.minimum_size and not more_body:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                encoder = _Encoder(encoding)
+                headers["Content-Encoding"] = encoding
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                body = encoder.compress(body, final=not more_body)
+                if not more_body:
+                    headers["Content-Length"] = str(len(body))
+                await send(start)
+                start = None
+            else:
+                body = encoder.compress(body, final=not more_body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
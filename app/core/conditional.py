@@ -0,0 +1,108 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+from fastapi import Request, Response, status
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values that determine a response.
+
+    Args:
+        parts: Values such as query parameters, row counts and timestamps
+
+    Returns:
+        str: Weak entity tag, e.g. ``W/"1a2b3c..."``
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+def http_date(value: datetime) -> str:
+    """
+    Format a timestamp for the Last-Modified header.
+
+    Naive timestamps are taken as UTC.
+
+    Args:
+        value: Timestamp to format
+
+    Returns:
+        str: IMF-fixdate string
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluate the request's conditional headers.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since``, and
+    entity tags are compared weakly, as RFC 9110 requires for GET.
+
+    Args:
+        request: Incoming request
+        etag: Current entity tag
+        last_modified: Current modification time, if known
+
+    Returns:
+        bool: Whether the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == current
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def set_validators(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> None:
+    """
+    Attach ETag and Last-Modified headers to a response.
+
+    Args:
+        response: Response to update
+        etag: Entity tag
+        last_modified: Modification time, if known
+    """
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """
+    Build a bodiless 304 response carrying the validators.
+
+    Args:
+        etag: Entity tag
+        last_modified: Modification time, if known
+
+    Returns:
+        Response: 304 Not Modified
+    """
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
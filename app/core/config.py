@@ -0,0 +1,259 @@
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field, SecretStr, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from app.core.cron import CronTrigger
+
+class DatabaseSettings(BaseModel):
+    """Database connection and pool settings."""
+    user: str = "silvanoquarto"
+    password: SecretStr = SecretStr("password")
+    server: str = "localhost"
+    port: int = Field(default=5432, ge=1, le=65535)
+    name: str = "healthcare_db"
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=0, ge=0)
+    pool_timeout_seconds: float = Field(default=10.0, gt=0)
+    pool_recycle_seconds: int = 1800
+    echo: bool = False
+
+class SigningKeySettings(BaseModel):
+    """A token signing or verification key."""
+    kid: str
+    algorithm: str
+    # Shared secret or PEM private key; None for keys that only verify
+    private_key: Optional[SecretStr] = None
+    # PEM public key, derived from the private key when omitted
+    public_key: Optional[str] = None
+
+class SecuritySettings(BaseModel):
+    """Token signing, expiry and password hashing settings."""
+    secret_key: SecretStr = SecretStr("your-secret-key-stored-in-env")
+    algorithm: str = "HS256"
+    # Key set for signing and verification; if empty, a single key built
+    # from secret_key and algorithm under active_kid
+    signing_keys: List[SigningKeySettings] = []
+    active_kid: str = "default"
+    access_token_expire_minutes: int = Field(default=30, ge=1)
+    refresh_token_expire_days: int = Field(default=7, ge=1)
+    refresh_session_max_days: int = Field(default=30, ge=1)
+    verified_token_cache_size: int = Field(default=4096, ge=0)
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+
+    @model_validator(mode="after")
+    def _active_key_signs(self) -> "SecuritySettings":
+        """Require unique key ids and an active key able to sign."""
+        if not self.signing_keys:
+            return self
+        kids = [key.kid for key in self.signing_keys]
+        if len(set(kids)) != len(kids):
+            raise ValueError("Signing key ids must be unique")
+        active = next((key for key in self.signing_keys if key.kid == self.active_kid), None)
+        if active is None or active.private_key is None:
+            raise ValueError(
+                f"Active key {self.active_kid!r} must be a configured key with a private key"
+            )
+        return self
+
+class ServerSettings(BaseModel):
+    """Process manager settings used by the launcher."""
+    host: str = "0.0.0.0"
+    port: int = Field(default=8000, ge=1, le=65535)
+    # One per CPU if None, as many as the connection budget can serve
+    workers: Optional[int] = Field(default=None, ge=1)
+    db_connection_budget: int = Field(default=40, ge=1)
+    pool_core_ratio: float = Field(default=0.75, gt=0, le=1)
+    keepalive_seconds: int = Field(default=5, ge=0)
+    graceful_timeout_seconds: int = Field(default=30, ge=0)
+    backlog: int = Field(default=2048, ge=1)
+    max_requests: int = Field(default=10_000, ge=0)
+    max_requests_jitter: int = Field(default=1_000, ge=0)
+
+class LoggingSettings(BaseModel):
+    """Application log settings."""
+    level: str = "INFO"
+    path: Path = Path("logs")
+
+    @field_validator("level")
+    @classmethod
+    def _known_level(cls, value: str) -> str:
+        """Accept only level names the logging module knows."""
+        value = value.upper()
+        if not isinstance(logging.getLevelName(value), int):
+            raise ValueError(f"Unknown log level {value!r}")
+        return value
+
+class RateLimitSettings(BaseModel):
+    """Rate limiting and admission control settings."""
+    enabled: bool = True
+    scope_limits: Dict[str, Tuple[float, int]] = {
+        "admin": (50.0, 100),
+        "doctor": (20.0, 40),
+        "nurse": (20.0, 40),
+        "researcher": (5.0, 10),
+        "anonymous": (5.0, 20),
+    }
+    route_limits: Dict[str, Dict[str, Tuple[float, int]]] = {
+        "POST /auth/token": {"anonymous": (0.2, 5)},
+        "POST /auth/refresh": {"anonymous": (1.0, 10)},
+    }
+    max_buckets: int = Field(default=100_000, ge=1)
+    # Requests in flight per worker; the worker's pool size plus overflow if None
+    max_concurrent_requests: Optional[int] = Field(default=None, ge=1)
+    queue_timeout_seconds: float = Field(default=0.5, ge=0)
+
+    @field_validator("scope_limits")
+    @classmethod
+    def _merge_scope_defaults(
+        cls, value: Dict[str, Tuple[float, int]]
+    ) -> Dict[str, Tuple[float, int]]:
+        """Override the default limits of the given scopes, keeping the others."""
+        return {**cls.model_fields["scope_limits"].default, **value}
+
+class CompressionSettings(BaseModel):
+    """Response compression settings."""
+    minimum_size: int = Field(default=1024, ge=0)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    brotli_quality: int = Field(default=4, ge=0, le=11)
+
+class OutboxSettings(BaseModel):
+    """Outbox dispatcher settings."""
+    batch_size: int = Field(default=500, ge=1)
+    poll_interval_seconds: float = Field(default=1.0, gt=0)
+    ndjson_path: Optional[Path] = None
+    webhook_url: Optional[str] = None
+    webhook_timeout_seconds: float = Field(default=10.0, gt=0)
+    lease_seconds: float = Field(default=60.0, gt=0)
+
+    @model_validator(mode="after")
+    def _lease_outlasts_delivery(self) -> "OutboxSettings":
+        """Require a delivery lease longer than a webhook request."""
+        if self.lease_seconds <= self.webhook_timeout_seconds:
+            raise ValueError("lease_seconds must be greater than webhook_timeout_seconds")
+        return self
+
+class ResearchSettings(BaseModel):
+    """Research export settings."""
+    pseudonym_key: SecretStr = SecretStr("your-pseudonym-key-stored-in-env")
+    k_anonymity: int = Field(default=5, ge=2)
+    age_band_years: int = Field(default=5, ge=1)
+    age_top_code: int = Field(default=90, ge=1)
+    batch_size: int = Field(default=1000, ge=1)
+
+class AuditSettings(BaseModel):
+    """Audit partitioning and retention settings."""
+    partitions_ahead: int = Field(default=3, ge=0)
+    retention_months: int = Field(default=24, ge=1)
+
+class QuerySettings(BaseModel):
+    """Statement limits per query class and slow-query capture settings."""
+    statement_timeout_ms: Dict[str, int] = {
+        "interactive": 5_000,
+        "export": 600_000,
+        "maintenance": 300_000,
+    }
+    lock_timeout_ms: Dict[str, int] = {
+        "interactive": 1_000,
+        "export": 10_000,
+        "maintenance": 30_000,
+    }
+    slow_query_threshold_ms: float = Field(default=250.0, ge=0)
+    slow_query_log_size: int = Field(default=200, ge=1)
+
+    @model_validator(mode="after")
+    def _same_classes(self) -> "QuerySettings":
+        """Require both timeouts for every query class."""
+        if self.statement_timeout_ms.keys() != self.lock_timeout_ms.keys():
+            raise ValueError("Statement and lock timeouts must cover the same query classes")
+        if "interactive" not in self.statement_timeout_ms:
+            raise ValueError("Timeouts for the 'interactive' query class are required")
+        return self
+
+class SchedulerSettings(BaseModel):
+    """Background job schedules and run history settings."""
+    enabled: bool = True
+    jitter_seconds: float = Field(default=30.0, ge=0)
+    history_retention_days: int = Field(default=30, ge=1)
+    schedules: Dict[str, str] = {
+        "audit_partitions": "15 2 * * *",
+        "patient_aggregates": "*/10 * * * *",
+        "refresh_tokens": "30 * * * *",
+        "revoked_tokens": "*/15 * * * *",
+        "job_history": "45 3 * * *",
+    }
+
+    @field_validator("schedules")
+    @classmethod
+    def _valid_schedules(cls, value: Dict[str, str]) -> Dict[str, str]:
+        """Parse every cron expression so a typo fails at startup."""
+        for expression in value.values():
+            CronTrigger(expression)
+        return value
+
+class LiveFeedSettings(BaseModel):
+    """Server-sent vitals feed settings."""
+    channel: str = "vitals_feed"
+    queue_size: int = Field(default=256, ge=1)
+    max_subscribers: int = Field(default=500, ge=1)
+    max_patients_per_subscription: int = Field(default=200, ge=1)
+    heartbeat_seconds: float = Field(default=15.0, gt=0)
+    listen_timeout_seconds: float = Field(default=5.0, gt=0)
+    reconnect_seconds: float = Field(default=2.0, gt=0)
+
+class Settings(BaseSettings):
+    """
+    Application settings.
+
+    Every tunable lives here, grouped by subsystem. Values are read from
+    the environment (and an optional ``.env`` file) with nested fields
+    separated by ``__``, e.g. ``DATABASE__POOL_SIZE=20`` or
+    ``SECURITY__BCRYPT_ROUNDS=10``. The module-level ``*Config`` classes
+    expose these values to the rest of the application.
+    """
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_nested_delimiter="__",
+        extra="ignore"
+    )
+
+    database: DatabaseSettings = DatabaseSettings()
+    security: SecuritySettings = SecuritySettings()
+    server: ServerSettings = ServerSettings()
+    logging: LoggingSettings = LoggingSettings()
+    rate_limit: RateLimitSettings = RateLimitSettings()
+    compression: CompressionSettings = CompressionSettings()
+    outbox: OutboxSettings = OutboxSettings()
+    research: ResearchSettings = ResearchSettings()
+    audit: AuditSettings = AuditSettings()
+    query: QuerySettings = QuerySettings()
+    scheduler: SchedulerSettings = SchedulerSettings()
+    live_feed: LiveFeedSettings = LiveFeedSettings()
+
+    @model_validator(mode="after")
+    def _admission_within_pool(self) -> "Settings":
+        """Admit no more concurrent requests than the pool can serve."""
+        pool = self.database.pool_size + self.database.max_overflow
+        limit = self.rate_limit.max_concurrent_requests
+        if limit is None:
+            self.rate_limit.max_concurrent_requests = pool
+        elif limit > pool:
+            raise ValueError(
+                f"rate_limit.max_concurrent_requests ({limit}) exceeds the "
+                f"database pool of {pool} connections"
+            )
+        return self
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Load and validate the settings once per process.
+
+    Returns:
+        Settings: Application settings
+
+    Raises:
+        pydantic.ValidationError: If a value is missing or invalid
+    """
+    return Settings()
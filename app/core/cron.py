@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+from typing import FrozenSet, List, Tuple
+
+# (name, lowest value, highest value) of the five cron fields
+_FIELDS: List[Tuple[str, int, int]] = [
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 6),
+]
+
+def _parse_field(expression: str, low: int, high: int) -> FrozenSet[int]:
+    """
+    Expand one cron field into the values it matches.
+
+    Supports ``*``, single values, ranges (``1-5``), lists (``1,15``) and
+    steps (``*/10``, ``0-30/5``).
+    """
+    values = set()
+    for part in expression.split(","):
+        body, _, step = part.partition("/")
+        if body == "*":
+            start, end = low, high
+        elif "-" in body:
+            start, end = (int(bound) for bound in body.split("-", 1))
+        else:
+            start = end = int(body)
+        stride = int(step) if step else 1
+        if not (low <= start <= end <= high) or stride < 1:
+            raise ValueError(f"Cron field {part!r} is out of range {low}-{high}")
+        values.update(range(start, end + 1, stride))
+    return frozenset(values)
+
+class CronTrigger:
+    """
+    Five-field cron schedule (minute, hour, day of month, month, day of week).
+
+    Times are evaluated in UTC. As in cron, when both day of month and
+    day of week are restricted a day matching either fires; day of week
+    runs from 0 (Sunday) to 6.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Initialize trigger.
+
+        Args:
+            expression: Cron expression, e.g. ``*/10 * * * *``
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        fields = expression.split()
+        if len(fields) != len(_FIELDS):
+            raise ValueError(f"Cron expression {expression!r} must have 5 fields")
+        try:
+            parsed = [
+                _parse_field(field, low, high)
+                for field, (_, low, high) in zip(fields, _FIELDS)
+            ]
+        except ValueError as exc:
+            raise ValueError(f"Invalid cron expression {expression!r}: {exc}") from exc
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check the day of month and day of week fields."""
+        day = moment.day in self.days
+        weekday = (moment.isoweekday() % 7) in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Get the first fire time strictly after a moment.
+
+        Args:
+            moment: Reference time; naive values are taken as UTC
+
+        Returns:
+            datetime: Next fire time, in UTC
+
+        Raises:
+            ValueError: If the schedule never fires (e.g. February 31st)
+        """
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        candidate = moment.astimezone(timezone.utc).replace(second=0, microsecond=0)
+        candidate += timedelta(minutes=1)
+        # Skip whole days and hours that cannot match instead of every minute
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression {self.expression!r} never fires")
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Set
+from uuid import UUID
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.core.config import get_settings
+from app.models.vital_signs import VitalSigns
+
+logger = logging.getLogger(__name__)
+
+class LiveFeedConfig:
+    """Server-sent vitals feed configuration."""
+    _settings = get_settings().live_feed
+    CHANNEL: str = _settings.channel
+    # Events buffered per client before it is dropped as too slow
+    QUEUE_SIZE: int = _settings.queue_size
+    MAX_SUBSCRIBERS: int = _settings.max_subscribers
+    MAX_PATIENTS_PER_SUBSCRIPTION: int = _settings.max_patients_per_subscription
+    HEARTBEAT_SECONDS: float = _settings.heartbeat_seconds
+    LISTEN_TIMEOUT_SECONDS: float = _settings.listen_timeout_seconds
+    RECONNECT_SECONDS: float = _settings.reconnect_seconds
+
+class FeedUnavailable(Exception):
+    """Raised when a subscription cannot be served."""
+
+async def notify_vitals(db: AsyncSession, vitals: VitalSigns) -> None:
+    """
+    Publish a measurement to every worker's feed when the transaction commits.
+
+    ``NOTIFY`` is transactional: listeners receive the event only if the
+    insert commits, and never before it is visible.
+
+    Args:
+        db: Session of the transaction inserting the measurement
+        vitals: Measurement to publish
+    """
+    payload = json.dumps(vitals.model_dump(mode="json"))
+    await db.execute(select(func.pg_notify(LiveFeedConfig.CHANNEL, payload)))
+
+class Subscription:
+    """
+    A client's interest in the vitals of a set of patients.
+
+    Attributes:
+        patient_ids: Patients whose measurements are delivered
+        queue: Events waiting to be sent to the client, followed by None
+            once the subscription is dropped
+        dropped: Whether the subscription was dropped
+        reason: Why the subscription was dropped
+    """
+
+    def __init__(self, patient_ids: Iterable[UUID], queue_size: int):
+        """
+        Initialize subscription.
+
+        Args:
+            patient_ids: Patients to follow
+            queue_size: Events buffered before the client is dropped
+        """
+        self.patient_ids: FrozenSet[UUID] = frozenset(patient_ids)
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+        self.reason = ""
+
+    def drop(self, reason: str) -> None:
+        """
+        Mark the subscription dropped and wake its reader.
+
+        Args:
+            reason: Why the subscription was dropped, reported to the client
+        """
+        self.dropped = True
+        self.reason = reason
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # The reader is not waiting and sees the flag once it drains the queue
+            pass
+
+class VitalsFeed:
+    """
+    Per-worker fan-out of new vital signs to subscribed clients.
+
+    A worker holds a single ``LISTEN`` connection however many clients
+    are connected, opened on the first subscription and re-opened if it
+    is lost. Each notification is decoded once and handed to the
+    subscriptions following its patient. Client buffers are bounded: a
+    client whose buffer is full is dropped instead of holding events in
+    memory or slowing down the others. Notifications sent while the
+    connection is down are lost, so the subscriptions it served are
+    dropped when it is lost and clients subscribe again.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[AsyncConnection]],
+        queue_size: int = LiveFeedConfig.QUEUE_SIZE,
+        max_subscribers: int = LiveFeedConfig.MAX_SUBSCRIBERS
+    ):
+        """
+        Initialize feed.
+
+        Args:
+            connect: Callable opening the listening connection, ideally
+                outside the request pool
+            queue_size: Events buffered per client
+            max_subscribers: Maximum concurrent subscriptions per worker
+        """
+        self.connect = connect
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.dropped_total = 0
+        self._subscriptions: Set[Subscription] = set()
+        self._by_patient: Dict[UUID, Set[Subscription]] = defaultdict(set)
+        self._listening = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscriptions."""
+        return len(self._subscriptions)
+
+    async def subscribe(self, patient_ids: Iterable[UUID]) -> Subscription:
+        """
+        Follow the vitals of a set of patients.
+
+        Returns once the worker is listening, so no event committed after
+        this call is missed.
+
+        Args:
+            patient_ids: Patients to follow
+
+        Returns:
+            Subscription: Subscription to read events from
+
+        Raises:
+            FeedUnavailable: If the worker is at its subscriber limit or
+                cannot listen to the database
+        """
+        if len(self._subscriptions) >= self.max_subscribers:
+            raise FeedUnavailable("Too many live feed subscribers")
+        subscription = Subscription(patient_ids, self.queue_size)
+        self._subscriptions.add(subscription)
+        for patient_id in subscription.patient_ids:
+            self._by_patient[patient_id].add(subscription)
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+        try:
+            await asyncio.wait_for(
+                self._listening.wait(), LiveFeedConfig.LISTEN_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            self.unsubscribe(subscription)
+            raise FeedUnavailable("Live feed is not connected to the database")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stop delivering events to a subscription.
+
+        Args:
+            subscription: Subscription to remove
+        """
+        self._subscriptions.discard(subscription)
+        for patient_id in subscription.patient_ids:
+            followers = self._by_patient.get(patient_id)
+            if followers is not None:
+                followers.discard(subscription)
+                if not followers:
+                    del self._by_patient[patient_id]
+
+    def publish(self, event: Dict[str, Any]) -> int:
+        """
+        Hand an event to the subscriptions following its patient.
+
+        Args:
+            event: Serialized measurement with a ``patient_id``
+
+        Returns:
+            int: Number of subscriptions the event was queued for
+        """
+        try:
+            patient_id = UUID(event["patient_id"])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Live feed event without a valid patient_id ignored")
+            return 0
+        delivered = 0
+        for subscription in list(self._by_patient.get(patient_id, ())):
+            try:
+                subscription.queue.put_nowait(event)
+                delivered += 1
+            except asyncio.QueueFull:
+                subscription.drop("Client too slow")
+                self.dropped_total += 1
+                self.unsubscribe(subscription)
+                logger.warning("Live feed subscriber dropped: buffer of %d events full", self.queue_size)
+        return delivered
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """Decode a notification once and fan it out."""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Undecodable live feed notification ignored")
+            return
+        self.publish(event)
+
+    async def _listen(self) -> None:
+        """Hold the ``LISTEN`` connection, reconnecting when it is lost."""
+        while True:
+            conn = None
+            listened = False
+            try:
+                conn = await self.connect()
+                driver = (await conn.get_raw_connection()).driver_connection
+                lost = asyncio.Event()
+                driver.add_termination_listener(lambda _: lost.set())
+                await driver.add_listener(LiveFeedConfig.CHANNEL, self._on_notify)
+                self._listening.set()
+                listened = True
+                await lost.wait()
+                logger.warning("Live feed connection lost, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Live feed cannot listen to the database")
+            finally:
+                self._listening.clear()
+                if conn is not None:
+                    try:
+                        await conn.close()
+                    except Exception:
+                        await conn.invalidate()
+            if listened:
+                # Notifications sent until the next LISTEN would be lost
+                self._drop_all("Live feed connection lost")
+            await asyncio.sleep(LiveFeedConfig.RECONNECT_SECONDS)
+
+    async def stop(self) -> None:
+        """Stop listening and drop every subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._drop_all("Server stopping")
+
+    def _drop_all(self, reason: str) -> None:
+        """Drop every subscription, waking the clients waiting for events."""
+        for subscription in list(self._subscriptions):
+            subscription.drop(reason)
+            self.unsubscribe(subscription)
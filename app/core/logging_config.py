@@ -2,6 +2,7 @@ import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
 from pathlib import Path
+from app.core.config import get_settings
 
 class LogConfig:
     """
@@ -14,17 +15,18 @@ class LogConfig:
     def __init__(
         self,
         log_path: Optional[Path] = None,
-        log_level: int = logging.INFO
+        log_level: Optional[int] = None
     ) -> None:
         """
         Initialize logging configuration.
         
         Args:
             log_path: Optional custom path for log files
-            log_level: The minimum logging level to record
+            log_level: The minimum logging level to record, from settings if None
         """
-        self.log_path = log_path or Path("logs")
-        self.log_level = log_level
+        settings = get_settings().logging
+        self.log_path = log_path or settings.path
+        self.log_level = log_level if log_level is not None else logging.getLevelName(settings.level)
         self.setup_logging()
     
     def setup_logging(self) -> None:
@@ -0,0 +1,356 @@
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from sqlalchemy import event, func, select, tuple_, update
+from sqlalchemy.orm import Session
+from app.core.config import get_settings
+from app.models.medication import Medication
+from app.models.outbox import OutboxEvent, OutboxOffset
+from app.models.patient import Patient
+from app.models.vital_signs import VitalSigns
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_MODELS = (Patient, Medication, VitalSigns)
+
+class OutboxConfig:
+    """Outbox dispatcher configuration."""
+    _settings = get_settings().outbox
+    BATCH_SIZE: int = _settings.batch_size
+    POLL_INTERVAL_SECONDS: float = _settings.poll_interval_seconds
+    NDJSON_PATH: Optional[Path] = _settings.ndjson_path
+    WEBHOOK_URL: Optional[str] = _settings.webhook_url
+    WEBHOOK_TIMEOUT_SECONDS: float = _settings.webhook_timeout_seconds
+    # How long a worker may take to deliver a batch before another takes over
+    LEASE_SECONDS: float = _settings.lease_seconds
+
+def _outbox_event(obj: Any, event_type: str) -> OutboxEvent:
+    """Build the change event for a captured model instance."""
+    patient_id = obj.id if isinstance(obj, Patient) else obj.patient_id
+    return OutboxEvent(
+        aggregate_type=type(obj).__name__,
+        aggregate_id=obj.id,
+        patient_id=patient_id,
+        event_type=event_type,
+        payload=obj.model_dump(mode="json")
+    )
+
+def capture_changes(session: Session, flush_context: Any, instances: Any) -> None:
+    """
+    Append outbox events for pending patient and clinical changes.
+
+    Runs before every flush, so events are inserted by the same flush
+    and committed or rolled back together with the changes.
+
+    Args:
+        session: Session being flushed
+        flush_context: SQLAlchemy flush context
+        instances: Deprecated SQLAlchemy argument, unused
+    """
+    events = []
+    for obj in session.new:
+        if isinstance(obj, OUTBOX_MODELS):
+            events.append(_outbox_event(obj, "created"))
+    for obj in session.dirty:
+        if isinstance(obj, OUTBOX_MODELS) and session.is_modified(obj):
+            events.append(_outbox_event(obj, "updated"))
+    for obj in session.deleted:
+        if isinstance(obj, OUTBOX_MODELS):
+            events.append(_outbox_event(obj, "deleted"))
+    session.add_all(events)
+
+def record_change(session: Any, obj: Any, event_type: str) -> None:
+    """
+    Append the outbox event for a change made with a Core statement.
+
+    Bulk and ``UPDATE ... RETURNING`` statements bypass the flush, so
+    ``capture_changes`` never sees them; the event is added to the same
+    session and committed together with the change.
+
+    Args:
+        session: Session, sync or async, that made the change
+        obj: Changed instance, e.g. a row returned by the statement
+        event_type: "created", "updated" or "deleted"
+    """
+    session.add(_outbox_event(obj, event_type))
+
+def register_outbox_listener() -> None:
+    """Capture outbox events on every ORM session flush."""
+    if not event.contains(Session, "before_flush", capture_changes):
+        event.listen(Session, "before_flush", capture_changes)
+
+class OutboxSink(ABC):
+    """Destination for batches of outbox events."""
+
+    @abstractmethod
+    async def send(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Deliver a batch of events in order.
+
+        Args:
+            events: Serialized events, in delivery order
+        """
+
+    async def close(self) -> None:
+        """Release resources held by the sink."""
+
+class NDJSONFileSink(OutboxSink):
+    """Append events to a newline-delimited JSON file."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize file sink.
+
+        Args:
+            path: File to append events to
+        """
+        self.path = path
+
+    async def send(self, events: List[Dict[str, Any]]) -> None:
+        """Append a batch of events, one JSON document per line."""
+        lines = "".join(json.dumps(evt) + "\n" for evt in events)
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        """Write and flush lines to the file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(lines)
+
+class QueueSink(OutboxSink):
+    """Put events on a local asyncio queue for in-process consumers."""
+
+    def __init__(self, queue: Optional[asyncio.Queue] = None):
+        """
+        Initialize queue sink.
+
+        Args:
+            queue: Queue to put events on, a new unbounded queue if None
+        """
+        self.queue = queue if queue is not None else asyncio.Queue()
+
+    async def send(self, events: List[Dict[str, Any]]) -> None:
+        """Put each event on the queue, waiting if it is full."""
+        for evt in events:
+            await self.queue.put(evt)
+
+class WebhookSink(OutboxSink):
+    """POST batches of events to an HTTP endpoint."""
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 10.0,
+        transport: Optional["httpx.AsyncBaseTransport"] = None
+    ):
+        """
+        Initialize webhook sink.
+
+        Args:
+            url: Endpoint receiving ``{"events": [...]}`` JSON bodies
+            timeout: Request timeout in seconds
+            transport: Optional transport, e.g. ``httpx.MockTransport``
+                to stub the endpoint in tests
+        """
+        import httpx  # only needed when a webhook is configured
+
+        self.url = url
+        self.client = httpx.AsyncClient(timeout=timeout, transport=transport)
+
+    async def send(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Deliver a batch in a single request.
+
+        Raises:
+            httpx.HTTPError: If the endpoint is unreachable or rejects the batch
+        """
+        response = await self.client.post(self.url, json={"events": events})
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+def _serialize(evt: OutboxEvent) -> Dict[str, Any]:
+    """Convert an outbox event to its wire format."""
+    return {
+        "id": evt.id,
+        "aggregate_type": evt.aggregate_type,
+        "aggregate_id": str(evt.aggregate_id),
+        "patient_id": str(evt.patient_id),
+        "event_type": evt.event_type,
+        "payload": evt.payload,
+        "created_at": evt.created_at.isoformat(),
+    }
+
+class OutboxDispatcher:
+    """
+    Background task streaming outbox events to sinks.
+
+    Each sink is a separate consumer with its own stored offset, so
+    delivery resumes where it stopped after a restart and a failing sink
+    does not hold back the others. Delivery is at-least-once.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        sinks: Dict[str, OutboxSink],
+        batch_size: int = OutboxConfig.BATCH_SIZE,
+        poll_interval: float = OutboxConfig.POLL_INTERVAL_SECONDS,
+        lease_seconds: float = OutboxConfig.LEASE_SECONDS
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            session_factory: Callable returning an async session context
+            sinks: Sinks keyed by consumer name
+            batch_size: Maximum number of events per delivery
+            poll_interval: Seconds to wait when there are no new events
+            lease_seconds: Time a worker may take to deliver a batch
+        """
+        self.session_factory = session_factory
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def dispatch_once(self, consumer: str) -> int:
+        """
+        Deliver the next batch of events to one consumer.
+
+        Only events of transactions older than every running transaction
+        are read, and the offset is a ``(transaction_id, id)`` cursor. A
+        transaction still running when a batch is read can only commit
+        events ordered after that batch, so no event is ever skipped,
+        even one whose id was drawn after those of later transactions.
+
+        The batch is read and leased to this worker in a short
+        transaction; the sink is called with no lock or connection held,
+        and the offset advances afterwards only if the lease is still
+        ours. A worker that finds the consumer leased skips it.
+
+        Args:
+            consumer: Name of the sink to deliver to
+
+        Returns:
+            int: Number of events delivered
+        """
+        async with self.session_factory() as session:
+            locked = await session.scalar(
+                select(func.pg_try_advisory_xact_lock(func.hashtext(f"outbox:{consumer}")))
+            )
+            if not locked:
+                return 0
+            offset = await session.get(OutboxOffset, consumer)
+            if offset is None:
+                offset = OutboxOffset(consumer=consumer)
+                session.add(offset)
+            now = datetime.now(timezone.utc)
+            if offset.leased_until is not None and offset.leased_until > now:
+                return 0
+            stmt = (
+                select(OutboxEvent)
+                .where(
+                    tuple_(OutboxEvent.transaction_id, OutboxEvent.id)
+                    > tuple_(offset.last_transaction_id, offset.last_event_id),
+                    OutboxEvent.transaction_id
+                    < func.txid_snapshot_xmin(func.txid_current_snapshot())
+                )
+                .order_by(OutboxEvent.transaction_id, OutboxEvent.id)
+                .limit(self.batch_size)
+            )
+            result = await session.execute(stmt)
+            events = result.scalars().all()
+            if not events:
+                return 0
+            batch = [_serialize(evt) for evt in events]
+            last_transaction_id, last_event_id = events[-1].transaction_id, events[-1].id
+            lease = now + timedelta(seconds=self.lease_seconds)
+            offset.leased_until = lease
+            await session.commit()
+
+        try:
+            await self.sinks[consumer].send(batch)
+        except Exception:
+            await self._release(consumer, lease)
+            raise
+
+        async with self.session_factory() as session:
+            await session.execute(
+                update(OutboxOffset)
+                .where(OutboxOffset.consumer == consumer, OutboxOffset.leased_until == lease)
+                .values(
+                    last_transaction_id=last_transaction_id,
+                    last_event_id=last_event_id,
+                    leased_until=None,
+                    updated_at=datetime.now(timezone.utc)
+                )
+            )
+            await session.commit()
+        return len(events)
+
+    async def _release(self, consumer: str, lease: datetime) -> None:
+        """Give up a lease without advancing the offset."""
+        async with self.session_factory() as session:
+            await session.execute(
+                update(OutboxOffset)
+                .where(OutboxOffset.consumer == consumer, OutboxOffset.leased_until == lease)
+                .values(leased_until=None)
+            )
+            await session.commit()
+
+    async def run(self) -> None:
+        """Deliver events to every sink until cancelled."""
+        while True:
+            delivered = 0
+            for consumer in self.sinks:
+                try:
+                    delivered += await self.dispatch_once(consumer)
+                except Exception:
+                    logger.exception("Outbox delivery to %s failed", consumer)
+            if delivered == 0:
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> None:
+        """Start the dispatcher as a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the dispatcher and close its sinks."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for sink in self.sinks.values():
+            await sink.close()
+
+def configured_sinks() -> Dict[str, OutboxSink]:
+    """
+    Build the sinks enabled in ``OutboxConfig``.
+
+    Returns:
+        Dict[str, OutboxSink]: Sinks keyed by consumer name
+    """
+    sinks: Dict[str, OutboxSink] = {}
+    if OutboxConfig.NDJSON_PATH is not None:
+        sinks["ndjson"] = NDJSONFileSink(OutboxConfig.NDJSON_PATH)
+    if OutboxConfig.WEBHOOK_URL is not None:
+        sinks["webhook"] = WebhookSink(
+            OutboxConfig.WEBHOOK_URL,
+            timeout=OutboxConfig.WEBHOOK_TIMEOUT_SECONDS
+        )
+    return sinks
@@ -0,0 +1,294 @@
+import asyncio
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from jose import JWTError
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import get_settings
+from app.core.security import SecurityConfig
+
+Limit = Tuple[float, int]
+
+class RateLimitConfig:
+    """
+    Rate limiting and admission control configuration.
+
+    Limits are ``(refill rate per second, burst capacity)`` token buckets.
+    """
+    _settings = get_settings().rate_limit
+    ENABLED: bool = _settings.enabled
+    SCOPE_LIMITS: Dict[str, Limit] = _settings.scope_limits
+    ROUTE_LIMITS: Dict[str, Dict[str, Limit]] = _settings.route_limits
+    MAX_BUCKETS: int = _settings.max_buckets
+    MAX_CONCURRENT_REQUESTS: int = _settings.max_concurrent_requests
+    QUEUE_TIMEOUT_SECONDS: float = _settings.queue_timeout_seconds
+
+class RateLimitBackend(ABC):
+    """Storage for token buckets."""
+
+    @abstractmethod
+    async def consume(self, key: str, limit: Limit, cost: float = 1.0) -> Tuple[bool, float]:
+        """
+        Take tokens from a bucket.
+
+        Args:
+            key: Bucket identifier
+            limit: Refill rate per second and burst capacity
+            cost: Tokens needed for the request
+
+        Returns:
+            Tuple[bool, float]: Whether the request is allowed, and the
+                seconds until enough tokens are available if not
+        """
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Token buckets held in process memory.
+
+    Limits apply per worker process. The least recently used buckets are
+    evicted beyond ``max_buckets``; an evicted bucket restarts full.
+    """
+
+    def __init__(
+        self,
+        max_buckets: int = RateLimitConfig.MAX_BUCKETS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize in-memory backend.
+
+        Args:
+            max_buckets: Maximum number of buckets kept
+            clock: Monotonic time source, replaceable in tests
+        """
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def consume(self, key: str, limit: Limit, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take tokens from a bucket, refilling it for the elapsed time."""
+        rate, capacity = limit
+        now = self.clock()
+        tokens, updated = self._buckets.pop(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + (now - updated) * rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_buckets:
+            self._buckets.popitem(last=False)
+        return allowed, 0.0 if allowed else (cost - tokens) / rate
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Token buckets shared by all workers through Redis.
+
+    Each check is a single atomic script call. Requires the optional
+    ``redis`` package.
+    """
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[2])
+    local rate = tonumber(ARGV[1])
+    local now = tonumber(ARGV[3])
+    local cost = tonumber(ARGV[4])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    local allowed = 0
+    if tokens >= cost then
+        tokens = tokens - cost
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return {allowed, tostring(tokens)}
+    """
+
+    def __init__(self, url: str, prefix: str = "ratelimit:"):
+        """
+        Initialize Redis backend.
+
+        Args:
+            url: Redis connection URL
+            prefix: Key prefix for the buckets
+
+        Raises:
+            RuntimeError: If the ``redis`` package is not installed
+        """
+        try:
+            from redis import asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError("RedisRateLimitBackend requires the 'redis' package") from exc
+        self.prefix = prefix
+        self.client = redis.from_url(url)
+        self._script = self.client.register_script(self.SCRIPT)
+
+    async def consume(self, key: str, limit: Limit, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take tokens from the shared bucket."""
+        rate, capacity = limit
+        allowed, tokens = await self._script(
+            keys=[self.prefix + key],
+            args=[rate, capacity, time.time(), cost]
+        )
+        if allowed:
+            return True, 0.0
+        return False, (cost - float(tokens)) / rate
+
+_ID_SEGMENT = re.compile(
+    r"/(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)(?=/|$)"
+)
+
+def route_key(method: str, path: str) -> str:
+    """
+    Group request paths by route, replacing id segments with ``{id}``.
+
+    Args:
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        str: Route key, e.g. ``GET /patients/{id}``
+    """
+    return f"{method} {_ID_SEGMENT.sub('/{id}', path)}"
+
+def _identity(scope: Scope) -> Tuple[str, str]:
+    """
+    Identify the caller from the bearer token.
+
+    Verification hits the token service's memo, so this costs a dict
+    lookup for tokens already seen. Invalid or missing tokens are
+    limited per client address; the endpoint still rejects them.
+
+    Returns:
+        Tuple[str, str]: Subject and the scope whose limits apply
+    """
+    for name, value in scope.get("headers", []):
+        if name == b"authorization" and value[:7].lower() == b"bearer ":
+            try:
+                claims = SecurityConfig.token_service.verify(value[7:].decode())
+            except JWTError:
+                break
+            for role in claims.get("scopes", []):
+                if role in RateLimitConfig.SCOPE_LIMITS:
+                    return claims.get("sub", ""), role
+            break
+    client = scope.get("client")
+    return (client[0] if client else "unknown"), "anonymous"
+
+class RateLimitMiddleware:
+    """
+    Reject requests exceeding the caller's token bucket with 429.
+
+    Buckets are keyed by subject, scope and route (see ``route_key``),
+    with limits taken from ``RateLimitConfig.ROUTE_LIMITS`` or the scope
+    default.
+    """
+
+    def __init__(self, app: ASGIApp, backend: Optional[RateLimitBackend] = None):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            backend: Bucket storage, in-memory if None
+        """
+        self.app = app
+        self.backend = backend or InMemoryRateLimitBackend()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Check the caller's bucket before handing the request on."""
+        if scope["type"] != "http" or not RateLimitConfig.ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route = route_key(scope["method"], scope["path"])
+        subject, role = _identity(scope)
+        limit = RateLimitConfig.ROUTE_LIMITS.get(route, {}).get(
+            role,
+            RateLimitConfig.SCOPE_LIMITS.get(role, RateLimitConfig.SCOPE_LIMITS["anonymous"])
+        )
+        allowed, retry_after = await self.backend.consume(f"{role}:{subject}:{route}", limit)
+        if not allowed:
+            response = JSONResponse(
+                {"detail": "Too many requests"},
+                status_code=429,
+                headers={"Retry-After": str(max(1, round(retry_after)))}
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+class ConcurrencyLimitMiddleware:
+    """
+    Shed load with 503 when too many requests are in flight.
+
+    Requests wait briefly for a slot; if none frees up they are rejected
+    instead of queueing on the database connection pool. Server-sent
+    event streams give their slot back once the response starts: they
+    stay open indefinitely but do no database work while streaming.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrent: Optional[int] = None,
+        queue_timeout: Optional[float] = None
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_concurrent: Maximum requests in flight per worker
+            queue_timeout: Seconds to wait for a free slot
+        """
+        self.app = app
+        self.semaphore = asyncio.Semaphore(
+            max_concurrent or RateLimitConfig.MAX_CONCURRENT_REQUESTS
+        )
+        self.queue_timeout = (
+            queue_timeout if queue_timeout is not None
+            else RateLimitConfig.QUEUE_TIMEOUT_SECONDS
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request once a slot is free, or reject it."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await asyncio.wait_for(self.semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            response = JSONResponse(
+                {"detail": "Server busy, retry later"},
+                status_code=503,
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self.semaphore.release()
+
+        async def send_releasing_streams(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if headers.get("content-type", "").startswith("text/event-stream"):
+                    release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_releasing_streams)
+        finally:
+            release()
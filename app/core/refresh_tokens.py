@@ -0,0 +1,205 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.orm import raiseload
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.security import SecurityConfig
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+class InvalidRefreshToken(Exception):
+    """Raised when a refresh token is unknown, expired or revoked."""
+
+class RefreshTokenReuse(InvalidRefreshToken):
+    """Raised when an already rotated refresh token is presented again."""
+
+def hash_refresh_token(token: str) -> str:
+    """
+    Digest a refresh token for storage and lookup.
+
+    Refresh tokens are random 256-bit values, so a fast hash is enough;
+    no password-style key stretching is needed.
+
+    Args:
+        token: Raw refresh token
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+class RefreshTokenStore:
+    """
+    Class for issuing, rotating and revoking refresh tokens.
+
+    Renewing a session is a single indexed lookup on the token digest,
+    so clients do not need to re-submit their password (and pay for a
+    bcrypt verification) whenever their access token expires.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize refresh token store.
+
+        Args:
+            db_session: Database session
+        """
+        self.db_session = db_session
+
+    async def issue(
+        self,
+        user_id: UUID,
+        family_id: Optional[UUID] = None,
+        session_expires_at: Optional[datetime] = None
+    ) -> Tuple[str, RefreshToken]:
+        """
+        Create a refresh token.
+
+        Args:
+            user_id: Owner of the token
+            family_id: Family of a rotated token, new family if None
+            session_expires_at: Absolute session expiry, new session if None
+
+        Returns:
+            Tuple[str, RefreshToken]: Raw token and its stored record
+        """
+        raw_token, record = self._new_token(user_id, family_id, session_expires_at)
+        self.db_session.add(record)
+        await self.db_session.commit()
+        return raw_token, record
+
+    async def rotate(self, raw_token: str) -> Tuple[User, str]:
+        """
+        Exchange a refresh token for a new one in the same family.
+
+        Presenting a token that was already rotated revokes the whole
+        family, since either the client or an attacker holds a copy.
+
+        Args:
+            raw_token: Refresh token presented by the client
+
+        Returns:
+            Tuple[User, str]: Token owner and the new raw refresh token
+
+        Raises:
+            RefreshTokenReuse: If the token was already rotated or revoked
+            InvalidRefreshToken: If the token is unknown, expired or its
+                owner is inactive
+        """
+        stmt = (
+            select(RefreshToken)
+            .where(RefreshToken.token_hash == hash_refresh_token(raw_token))
+            .with_for_update()
+        )
+        result = await self.db_session.execute(stmt)
+        record = result.scalar_one_or_none()
+        if record is None:
+            raise InvalidRefreshToken("Unknown refresh token")
+
+        if record.revoked_at is not None:
+            await self.revoke_family(record.family_id)
+            raise RefreshTokenReuse("Refresh token reuse detected")
+
+        now = datetime.now(timezone.utc)
+        if record.expires_at <= now:
+            raise InvalidRefreshToken("Refresh token expired")
+
+        # The user's patients are not needed to issue tokens; skip loading them
+        result = await self.db_session.execute(
+            select(User).where(User.id == record.user_id).options(raiseload(User.patients))
+        )
+        user = result.scalar_one_or_none()
+        if user is None or not user.is_active:
+            raise InvalidRefreshToken("Refresh token owner is inactive")
+
+        new_token, new_record = self._new_token(
+            user_id=record.user_id,
+            family_id=record.family_id,
+            session_expires_at=record.session_expires_at
+        )
+        record.revoked_at = now
+        record.replaced_by_id = new_record.id
+        self.db_session.add_all([new_record, record])
+        await self.db_session.commit()
+        return user, new_token
+
+    async def revoke_family(self, family_id: UUID) -> int:
+        """
+        Revoke every token issued from the same login.
+
+        Args:
+            family_id: Token family to revoke
+
+        Returns:
+            int: Number of tokens revoked
+        """
+        return await self._revoke(RefreshToken.family_id == family_id)
+
+    async def revoke_user(self, user_id: UUID) -> int:
+        """
+        Revoke every refresh token of a user, ending all their sessions.
+
+        Args:
+            user_id: Owner of the tokens
+
+        Returns:
+            int: Number of tokens revoked
+        """
+        return await self._revoke(RefreshToken.user_id == user_id)
+
+    async def purge_expired(self) -> int:
+        """
+        Delete tokens that can no longer be used or trigger reuse detection.
+
+        Returns:
+            int: Number of tokens deleted
+        """
+        now = datetime.now(timezone.utc)
+        stmt = delete(RefreshToken).where(
+            or_(
+                RefreshToken.session_expires_at <= now,
+                RefreshToken.expires_at <= now
+            )
+        )
+        result = await self.db_session.execute(stmt)
+        await self.db_session.commit()
+        return result.rowcount
+
+    def _new_token(
+        self,
+        user_id: UUID,
+        family_id: Optional[UUID],
+        session_expires_at: Optional[datetime]
+    ) -> Tuple[str, RefreshToken]:
+        """Generate a raw token and its unsaved record."""
+        now = datetime.now(timezone.utc)
+        if session_expires_at is None:
+            session_expires_at = now + timedelta(
+                days=SecurityConfig.REFRESH_SESSION_MAX_DAYS
+            )
+        raw_token = secrets.token_urlsafe(32)
+        record = RefreshToken(
+            token_hash=hash_refresh_token(raw_token),
+            user_id=user_id,
+            family_id=family_id or uuid4(),
+            expires_at=min(
+                now + timedelta(days=SecurityConfig.REFRESH_TOKEN_EXPIRE_DAYS),
+                session_expires_at
+            ),
+            session_expires_at=session_expires_at
+        )
+        return raw_token, record
+
+    async def _revoke(self, condition) -> int:
+        """Mark active tokens matching a condition as revoked."""
+        stmt = (
+            update(RefreshToken)
+            .where(condition, RefreshToken.revoked_at.is_(None))
+            .values(revoked_at=datetime.now(timezone.utc))
+        )
+        result = await self.db_session.execute(stmt)
+        await self.db_session.commit()
+        return result.rowcount
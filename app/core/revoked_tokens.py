@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import ColumnElement, delete, exists, false
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.security import SecurityConfig
+from app.models.revoked_token import RevokedToken
+
+class RevokedTokenStore:
+    """
+    Class for revoking access tokens across workers.
+
+    Revocations are written to the database, so a logout handled by one
+    worker applies to all of them. Each worker also memoizes the
+    revocations it has seen in its ``TokenService``, rejecting those
+    tokens before any query.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        """
+        Initialize revoked token store.
+
+        Args:
+            db_session: Database session
+        """
+        self.db_session = db_session
+
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke an access token until it would have expired anyway.
+
+        Args:
+            jti: Token identifier
+            expires_at: Token expiry as a POSIX timestamp
+        """
+        stmt = insert(RevokedToken).values(
+            jti=jti,
+            expires_at=datetime.fromtimestamp(expires_at, timezone.utc)
+        ).on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        await self.db_session.execute(stmt)
+        await self.db_session.commit()
+        SecurityConfig.token_service.revoke(jti, expires_at)
+
+    @staticmethod
+    def is_revoked(jti: Optional[str]) -> ColumnElement[bool]:
+        """
+        Build an expression telling whether a token is revoked.
+
+        It is meant to be selected alongside another lookup, such as the
+        token's user, so the check costs no extra round trip.
+
+        Args:
+            jti: Token identifier, None for tokens issued without one
+
+        Returns:
+            ColumnElement[bool]: SQL boolean expression
+        """
+        if jti is None:
+            return false()
+        return exists().where(RevokedToken.jti == jti)
+
+    async def purge_expired(self) -> int:
+        """
+        Delete revocations of tokens past their expiry.
+
+        Returns:
+            int: Number of revocations deleted
+        """
+        stmt = delete(RevokedToken).where(
+            RevokedToken.expires_at <= datetime.now(timezone.utc)
+        )
+        result = await self.db_session.execute(stmt)
+        await self.db_session.commit()
+        return result.rowcount
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import distinct_on
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.core.config import get_settings
+from app.core.cron import CronTrigger
+from app.models.job_run import JobRun
+
+logger = logging.getLogger(__name__)
+
+class SchedulerConfig:
+    """Background job scheduler configuration."""
+    _settings = get_settings().scheduler
+    ENABLED: bool = _settings.enabled
+    # Random delay added to every run so workers and jobs do not fire in lockstep
+    JITTER_SECONDS: float = _settings.jitter_seconds
+    HISTORY_RETENTION_DAYS: int = _settings.history_retention_days
+    SCHEDULES: Dict[str, str] = _settings.schedules
+    LEADER_LOCK: str = "scheduler:leader"
+    # Upper bound on one sleep, so a wall clock change is noticed
+    MAX_SLEEP_SECONDS: float = 60.0
+    MAX_ERROR_LENGTH: int = 1000
+
+JobFunc = Callable[[AsyncSession], Awaitable[Optional[Dict[str, Any]]]]
+
+@dataclass
+class Job:
+    """
+    A periodic background task.
+
+    Attributes:
+        name: Unique job name, used in the run history
+        func: Coroutine function taking a database session and returning
+            optional details stored with the run
+        trigger: When the job runs
+        leader_only: Whether only the elected worker runs the job; jobs
+            maintaining per-process state run on every worker
+        due_at: Next scheduled fire time
+        next_run_at: ``due_at`` plus this run's jitter
+    """
+    name: str
+    func: JobFunc
+    trigger: CronTrigger
+    leader_only: bool = True
+    due_at: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
+
+class Scheduler:
+    """
+    In-process scheduler running periodic jobs as asyncio tasks.
+
+    Every worker runs a scheduler, and a session-level advisory lock
+    elects the single worker that runs leader-only jobs. The lock is held
+    on a dedicated connection for as long as the worker lives, so when
+    the leader dies the server releases it and the next worker to try
+    takes over. A job never overlaps with its own previous run, and every
+    run is recorded in ``job_runs`` with its duration and outcome.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        connect: Callable[[], Awaitable[AsyncConnection]],
+        jobs: Iterable[Job] = (),
+        jitter_seconds: float = SchedulerConfig.JITTER_SECONDS
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            session_factory: Callable returning a session for job runs
+            connect: Callable opening the connection that holds the
+                leader lock, ideally outside the request pool
+            jobs: Jobs to schedule
+            jitter_seconds: Maximum random delay added to each run
+        """
+        self.session_factory = session_factory
+        self.connect = connect
+        self.jitter_seconds = jitter_seconds
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+        self.jobs: Dict[str, Job] = {}
+        for job in jobs:
+            self.add_job(job)
+        self._leader_conn: Optional[AsyncConnection] = None
+        self._leader_guard = asyncio.Lock()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this worker currently holds the leader lock."""
+        return self._leader_conn is not None
+
+    def add_job(self, job: Job) -> None:
+        """
+        Schedule a job.
+
+        Args:
+            job: Job to add
+
+        Raises:
+            ValueError: If a job with the same name exists
+        """
+        if job.name in self.jobs:
+            raise ValueError(f"Job {job.name!r} is already scheduled")
+        self._schedule(job, datetime.now(timezone.utc))
+        self.jobs[job.name] = job
+
+    def _schedule(self, job: Job, after: datetime) -> None:
+        """Set the job's next fire time after a moment, with fresh jitter."""
+        job.due_at = job.trigger.next_after(after)
+        job.next_run_at = job.due_at + timedelta(
+            seconds=random.uniform(0, self.jitter_seconds)
+        )
+
+    async def ensure_leader(self) -> bool:
+        """
+        Check that this worker holds the leader lock, trying to take it if not.
+
+        A held lock is verified with a round trip on its connection; if
+        the connection was lost, so was the lock.
+
+        Returns:
+            bool: Whether this worker is the leader
+        """
+        async with self._leader_guard:
+            if self._leader_conn is not None:
+                try:
+                    await self._leader_conn.execute(select(1))
+                    await self._leader_conn.commit()
+                    return True
+                except Exception:
+                    logger.warning("Scheduler leader connection lost on %s", self.worker)
+                    await self._close_leader_connection(unlock=False)
+
+            conn = None
+            try:
+                conn = await self.connect()
+                locked = await conn.scalar(
+                    select(func.pg_try_advisory_lock(func.hashtext(SchedulerConfig.LEADER_LOCK)))
+                )
+                await conn.commit()
+            except Exception:
+                logger.exception("Scheduler leader election failed")
+                if conn is not None:
+                    await conn.close()
+                return False
+            if not locked:
+                await conn.close()
+                return False
+            logger.info("Scheduler leadership taken by %s", self.worker)
+            self._leader_conn = conn
+            return True
+
+    async def _close_leader_connection(self, unlock: bool = True) -> None:
+        """Release the leader lock and close its connection."""
+        conn, self._leader_conn = self._leader_conn, None
+        if conn is None:
+            return
+        try:
+            if unlock:
+                await conn.execute(
+                    select(func.pg_advisory_unlock(func.hashtext(SchedulerConfig.LEADER_LOCK)))
+                )
+                await conn.commit()
+            await conn.close()
+        except Exception:
+            # Closing the server session releases the lock anyway
+            await conn.invalidate()
+
+    async def run_job(self, job: Job) -> Optional[JobRun]:
+        """
+        Run a job once and record the run.
+
+        A failing job is logged and recorded, never raised, so it cannot
+        stop the scheduler.
+
+        Args:
+            job: Job to run
+
+        Returns:
+            Optional[JobRun]: Recorded run, or None if the job is
+                leader-only and this worker is not the leader
+        """
+        if job.leader_only and not await self.ensure_leader():
+            return None
+
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        status, error, details = "succeeded", None, None
+        try:
+            async with self.session_factory() as session:
+                details = await job.func(session)
+        except Exception as exc:
+            logger.exception("Job %s failed", job.name)
+            status = "failed"
+            error = f"{type(exc).__name__}: {exc}"[:SchedulerConfig.MAX_ERROR_LENGTH]
+
+        run = JobRun(
+            job=job.name,
+            worker=self.worker,
+            started_at=started_at,
+            finished_at=datetime.now(timezone.utc),
+            duration_ms=round((time.perf_counter() - start) * 1000, 3),
+            status=status,
+            error=error,
+            details=details
+        )
+        try:
+            async with self.session_factory() as session:
+                session.add(run)
+                await session.commit()
+        except Exception:
+            logger.exception("Cannot record run of job %s", job.name)
+        return run
+
+    def _dispatch(self, job: Job) -> None:
+        """Start a run of a job unless its previous run is still going."""
+        previous = self._running.get(job.name)
+        if previous is not None and not previous.done():
+            logger.warning("Job %s skipped: previous run still in progress", job.name)
+            return
+        self._running[job.name] = asyncio.create_task(self.run_job(job))
+
+    async def run(self) -> None:
+        """Start due jobs until cancelled."""
+        while True:
+            now = datetime.now(timezone.utc)
+            for job in self.jobs.values():
+                if job.next_run_at <= now:
+                    self._dispatch(job)
+                    self._schedule(job, job.due_at)
+                    if job.due_at <= now:
+                        # Missed slots, e.g. after a suspend, are run only once
+                        self._schedule(job, now)
+
+            delay = SchedulerConfig.MAX_SLEEP_SECONDS
+            if self.jobs:
+                upcoming = min(job.next_run_at for job in self.jobs.values())
+                delay = min(delay, (upcoming - datetime.now(timezone.utc)).total_seconds())
+            await asyncio.sleep(max(delay, 0))
+
+    def start(self) -> None:
+        """Start the scheduler as a background task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler, cancel running jobs and give up leadership."""
+        tasks = [task for task in self._running.values() if not task.done()]
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._running.clear()
+        await self._close_leader_connection()
+
+async def run_statistics(db: AsyncSession) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate the recorded runs of every job.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Per job: ``runs``, ``failures``,
+            ``avg_duration_ms``, ``p95_duration_ms``,
+            ``max_duration_ms`` and the ``last_run``
+    """
+    totals = await db.execute(
+        select(
+            JobRun.job,
+            func.count(),
+            func.count().filter(JobRun.status == "failed"),
+            func.avg(JobRun.duration_ms),
+            func.percentile_cont(0.95).within_group(JobRun.duration_ms),
+            func.max(JobRun.duration_ms)
+        ).group_by(JobRun.job)
+    )
+    statistics: Dict[str, Dict[str, Any]] = {
+        job: {
+            "runs": runs,
+            "failures": failures,
+            "avg_duration_ms": round(avg, 3),
+            "p95_duration_ms": round(p95, 3),
+            "max_duration_ms": maximum,
+            "last_run": None,
+        }
+        for job, runs, failures, avg, p95, maximum in totals
+    }
+    latest = await db.execute(
+        select(JobRun)
+        .ext(distinct_on(JobRun.job))
+        .order_by(JobRun.job, JobRun.started_at.desc())
+    )
+    for run in latest.scalars():
+        statistics[run.job]["last_run"] = run
+    return statistics
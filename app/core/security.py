@@ -1,60 +1,104 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from pydantic import BaseModel
+from app.core.config import SecuritySettings, get_settings
+from app.core.tokens import SigningKey, TokenService
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
 
 class Token(BaseModel):
     """Token schema."""
     access_token: str
     token_type: str
+    expires_in: Optional[int] = None
+    refresh_token: Optional[str] = None
 
 class TokenData(BaseModel):
     """Token data schema."""
     username: Optional[str] = None
     scopes: list[str] = []
 
+def signing_keys(settings: SecuritySettings) -> List[SigningKey]:
+    """
+    Build the token key set from the security settings.
+
+    Args:
+        settings: Security settings
+
+    Returns:
+        List[SigningKey]: Configured keys, or a single key built from
+            ``secret_key`` and ``algorithm`` when none are configured
+    """
+    if not settings.signing_keys:
+        return [SigningKey(
+            kid=settings.active_kid,
+            algorithm=settings.algorithm,
+            private_key=settings.secret_key.get_secret_value()
+        )]
+    return [
+        SigningKey(
+            kid=key.kid,
+            algorithm=key.algorithm,
+            private_key=key.private_key.get_secret_value() if key.private_key else None,
+            public_key=key.public_key
+        )
+        for key in settings.signing_keys
+    ]
+
 class SecurityConfig:
     """Security configuration."""
-    SECRET_KEY: str = "your-secret-key-stored-in-env"  
-    ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    _settings = get_settings().security
+    SECRET_KEY: str = _settings.secret_key.get_secret_value()
+    ALGORITHM: str = _settings.algorithm
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = _settings.access_token_expire_minutes
+    REFRESH_TOKEN_EXPIRE_DAYS: int = _settings.refresh_token_expire_days
+    REFRESH_SESSION_MAX_DAYS: int = _settings.refresh_session_max_days
+    ACTIVE_KID: str = _settings.active_kid
+    SIGNING_KEYS: List[SigningKey] = signing_keys(_settings)
+    VERIFIED_TOKEN_CACHE_SIZE: int = _settings.verified_token_cache_size
+    BCRYPT_ROUNDS: int = _settings.bcrypt_rounds
     
-    pwd_context: CryptContext = CryptContext(
-        schemes=["bcrypt"],
-        deprecated="auto",
-        bcrypt__rounds=12  
+    token_service: TokenService = TokenService(
+        keys=SIGNING_KEYS,
+        active_kid=ACTIVE_KID,
+        cache_size=VERIFIED_TOKEN_CACHE_SIZE
     )
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def pwd_context() -> "CryptContext":
+        """Password hashing context, built on first use."""
+        from passlib.context import CryptContext
+
+        return CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=SecurityConfig.BCRYPT_ROUNDS
+        )
+    
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against a hash."""
         try:
-            return SecurityConfig.pwd_context.verify(plain_password, hashed_password)
+            return SecurityConfig.pwd_context().verify(plain_password, hashed_password)
         except Exception:
             return False
     
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Generate a password hash."""
-        return SecurityConfig.pwd_context.hash(password)
+        return SecurityConfig.pwd_context().hash(password)
     
     @staticmethod
     def create_access_token(
         data: Dict[str, Any],
         expires_delta: Optional[timedelta] = None
     ) -> str:
-        """Create a JWT token."""
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.utcnow() + expires_delta
-        else:
-            expire = datetime.utcnow() + timedelta(
+        """Create a JWT token signed with the active key."""
+        if not expires_delta:
+            expires_delta = timedelta(
                 minutes=SecurityConfig.ACCESS_TOKEN_EXPIRE_MINUTES
             )
-        to_encode.update({"exp": expire})
-        return jwt.encode(
-            to_encode,
-            SecurityConfig.SECRET_KEY,
-            algorithm=SecurityConfig.ALGORITHM
-        )
\ No newline at end of file
+        return SecurityConfig.token_service.issue(data, expires_delta)
\ No newline at end of file
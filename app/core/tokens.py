@@ -0,0 +1,203 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+SYMMETRIC_ALGORITHMS = {"HS256", "HS384", "HS512"}
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+
+@dataclass(frozen=True)
+class SigningKey:
+    """
+    A key in the token key set.
+
+    Attributes:
+        kid: Key identifier written to the token header
+        algorithm: JWS algorithm (HS*, RS* or ES*)
+        private_key: Shared secret or PEM private key; None for verify-only keys
+        public_key: PEM public key for asymmetric algorithms, derived from
+            the private key when omitted
+    """
+    kid: str
+    algorithm: str
+    private_key: Optional[str] = None
+    public_key: Optional[str] = None
+
+class TokenService:
+    """
+    Issue and verify JWT access tokens.
+
+    Keys are parsed once and cached by ``kid``, so several keys can be
+    accepted at the same time while signing rotates to a new one.
+    Verified tokens are memoized in a bounded LRU until they expire, and
+    revoked ``jti`` values are kept in a dict for O(1) lookups. Both
+    caches are local to the process; revocations are shared between
+    workers through ``RevokedTokenStore``.
+    """
+
+    def __init__(
+        self,
+        keys: List[SigningKey],
+        active_kid: Optional[str] = None,
+        cache_size: int = 4096
+    ) -> None:
+        """
+        Initialize token service.
+
+        Args:
+            keys: Key set used for signing and verification
+            active_kid: Key used to sign new tokens, first key if None
+            cache_size: Maximum number of verified tokens to memoize
+
+        Raises:
+            ValueError: If the key set is empty or inconsistent
+        """
+        if not keys:
+            raise ValueError("At least one signing key is required")
+        self.cache_size = cache_size
+        self._keys: Dict[str, SigningKey] = {}
+        self._verifiers: Dict[str, Tuple[str, Key]] = {}
+        for key in keys:
+            self.add_key(key)
+
+        self.active_kid = active_kid or keys[0].kid
+        active = self._keys.get(self.active_kid)
+        if active is None or active.private_key is None:
+            raise ValueError(f"Active key '{self.active_kid}' cannot sign tokens")
+        self._signer: Key = jwk.construct(active.private_key, active.algorithm)
+
+        self._verified: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._revoked: Dict[str, float] = {}
+
+    def add_key(self, key: SigningKey) -> None:
+        """
+        Add a key to the verification set.
+
+        Args:
+            key: Key to accept for verification
+
+        Raises:
+            ValueError: If the algorithm is not supported
+        """
+        if key.algorithm in SYMMETRIC_ALGORITHMS:
+            verifier = jwk.construct(key.private_key, key.algorithm)
+        elif key.algorithm in ASYMMETRIC_ALGORITHMS:
+            if key.public_key is not None:
+                verifier = jwk.construct(key.public_key, key.algorithm)
+            else:
+                verifier = jwk.construct(key.private_key, key.algorithm).public_key()
+        else:
+            raise ValueError(f"Unsupported signing algorithm: {key.algorithm}")
+        self._keys[key.kid] = key
+        self._verifiers[key.kid] = (key.algorithm, verifier)
+
+    def issue(
+        self,
+        claims: Dict[str, Any],
+        expires_delta: timedelta
+    ) -> str:
+        """
+        Sign a new token with the active key.
+
+        Args:
+            claims: Token claims, e.g. ``sub`` and ``scopes``
+            expires_delta: Token lifetime
+
+        Returns:
+            str: Encoded JWT
+        """
+        now = datetime.now(timezone.utc)
+        to_encode = claims.copy()
+        to_encode.setdefault("jti", uuid4().hex)
+        to_encode.update({"iat": now, "exp": now + expires_delta})
+        algorithm = self._keys[self.active_kid].algorithm
+        return jwt.encode(
+            to_encode,
+            self._signer,
+            algorithm=algorithm,
+            headers={"kid": self.active_kid}
+        )
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verify a token and return its claims.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            Dict[str, Any]: Verified claims
+
+        Raises:
+            JWTError: If the token is invalid, expired or revoked
+        """
+        now = datetime.now(timezone.utc).timestamp()
+        cached = self._verified.get(token)
+        if cached is not None:
+            claims, expires_at = cached
+            if expires_at <= now:
+                del self._verified[token]
+                raise JWTError("Signature has expired.")
+            self._verified.move_to_end(token)
+        else:
+            kid = jwt.get_unverified_header(token).get("kid", self.active_kid)
+            verifier = self._verifiers.get(kid)
+            if verifier is None:
+                raise JWTError(f"Unknown key id: {kid}")
+            algorithm, key = verifier
+            claims = jwt.decode(token, key, algorithms=[algorithm])
+            expires_at = float(claims.get("exp", now))
+            self._verified[token] = (claims, expires_at)
+            if len(self._verified) > self.cache_size:
+                self._verified.popitem(last=False)
+
+        jti = claims.get("jti")
+        if jti is not None and jti in self._revoked:
+            raise JWTError("Token has been revoked.")
+        return claims
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke a token until it would have expired anyway.
+
+        Args:
+            jti: Token identifier
+            expires_at: Token expiry as a POSIX timestamp
+        """
+        self._revoked[jti] = expires_at
+
+    def purge_expired(self) -> int:
+        """
+        Drop revocations and memoized tokens past their expiry.
+
+        Returns:
+            int: Number of revocations removed
+        """
+        now = datetime.now(timezone.utc).timestamp()
+        expired = [jti for jti, exp in self._revoked.items() if exp <= now]
+        for jti in expired:
+            del self._revoked[jti]
+        for token in [t for t, (_, exp) in self._verified.items() if exp <= now]:
+            del self._verified[token]
+        return len(expired)
+
+    def jwks(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Public keys for other services to verify our tokens.
+
+        Shared-secret keys are never published.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: JWK set
+        """
+        keys = []
+        for kid, (algorithm, key) in self._verifiers.items():
+            if algorithm in SYMMETRIC_ALGORITHMS:
+                continue
+            entry = key.to_dict()
+            entry.update({"kid": kid, "alg": algorithm, "use": "sig"})
+            keys.append(entry)
+        return {"keys": keys}
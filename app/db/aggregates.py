@@ -0,0 +1,159 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.schemas.stats import PatientStats
+
+SUMMARY_VIEW = "patient_summary"
+
+AGE_BANDS: List[Tuple[str, int, Optional[int]]] = [
+    ("<65", 0, 64),
+    ("65-74", 65, 74),
+    ("75-84", 75, 84),
+    ("85+", 85, None),
+]
+
+# Bucket of patients whose birth date gives no age, e.g. a future date
+UNKNOWN_AGE_BAND = "unknown"
+
+def _age_band_case(column: str) -> str:
+    """
+    Build a SQL CASE expression mapping a birth date column to its age band.
+
+    Args:
+        column: Qualified name of the date of birth column
+
+    Returns:
+        str: SQL CASE expression returning the age band label, or
+            UNKNOWN_AGE_BAND if the age falls in no band
+    """
+    age = f"date_part('year', age(current_date, {column}))"
+    branches = []
+    for label, low, high in AGE_BANDS:
+        if high is None:
+            branches.append(f"WHEN {age} >= {low} THEN '{label}'")
+        else:
+            branches.append(f"WHEN {age} BETWEEN {low} AND {high} THEN '{label}'")
+    return "CASE " + " ".join(branches) + f" ELSE '{UNKNOWN_AGE_BAND}' END"
+
+CREATE_SUMMARY_VIEW = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {SUMMARY_VIEW} AS
+SELECT 'doctor' AS dimension,
+       coalesce(p.primary_doctor_id::text, 'unassigned') AS bucket,
+       count(*) AS patient_count,
+       now() AS refreshed_at
+FROM patients p
+WHERE p.is_active
+GROUP BY 2
+UNION ALL
+SELECT 'age_band', {_age_band_case("p.date_of_birth")}, count(*), now()
+FROM patients p
+WHERE p.is_active
+GROUP BY 2
+UNION ALL
+SELECT 'category', c.category::text, count(DISTINCT c.patient_id), now()
+FROM medicalcondition c
+JOIN patients p ON p.id = c.patient_id
+WHERE c.is_active AND p.is_active
+GROUP BY 2
+UNION ALL
+SELECT 'category_severity', c.category::text || ':' || c.severity::text,
+       count(DISTINCT c.patient_id), now()
+FROM medicalcondition c
+JOIN patients p ON p.id = c.patient_id
+WHERE c.is_active AND p.is_active
+GROUP BY 2
+WITH DATA
+"""
+
+CREATE_SUMMARY_INDEX = f"""
+CREATE UNIQUE INDEX IF NOT EXISTS ux_{SUMMARY_VIEW}_dimension_bucket
+ON {SUMMARY_VIEW} (dimension, bucket)
+"""
+
+class PatientAggregates:
+    """
+    Precomputed patient counts served from a materialized view.
+
+    Counts per doctor, age band and condition category/severity are
+    computed by PostgreSQL on refresh, so reading them costs a scan of a
+    few dozen rows regardless of how many patients are stored.
+    """
+
+    @staticmethod
+    async def create(conn: AsyncConnection) -> None:
+        """
+        Create the summary view and its unique index if missing.
+
+        Args:
+            conn: Connection inside the schema creation transaction
+        """
+        await conn.execute(text(CREATE_SUMMARY_VIEW))
+        await conn.execute(text(CREATE_SUMMARY_INDEX))
+
+    @staticmethod
+    async def drop(conn: AsyncConnection) -> None:
+        """
+        Drop the summary view so the underlying tables can be dropped.
+
+        Args:
+            conn: Connection inside the schema cleanup transaction
+        """
+        await conn.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {SUMMARY_VIEW}"))
+
+    @staticmethod
+    async def refresh(db: AsyncSession, concurrently: bool = True) -> None:
+        """
+        Recompute the summary view.
+
+        A concurrent refresh keeps the previous contents readable while
+        the new ones are computed, relying on the unique index.
+
+        Args:
+            db: Database session
+            concurrently: Whether to refresh without blocking readers
+        """
+        mode = "CONCURRENTLY " if concurrently else ""
+        await db.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{SUMMARY_VIEW}"))
+        await db.commit()
+
+    @staticmethod
+    async def read(db: AsyncSession) -> PatientStats:
+        """
+        Read the precomputed patient counts.
+
+        Args:
+            db: Database session
+
+        Returns:
+            PatientStats: Counts grouped by dimension
+        """
+        result = await db.execute(text(
+            f"SELECT dimension, bucket, patient_count, refreshed_at FROM {SUMMARY_VIEW}"
+        ))
+        buckets: Dict[str, Dict[str, int]] = {
+            "doctor": {},
+            "age_band": {},
+            "category": {},
+            "category_severity": {},
+        }
+        refreshed_at: Optional[datetime] = None
+        for dimension, bucket, count, row_refreshed_at in result:
+            # Views created before the unknown band have a NULL bucket instead
+            bucket = UNKNOWN_AGE_BAND if bucket is None else bucket.lower()
+            buckets.setdefault(dimension, {})[bucket] = count
+            refreshed_at = row_refreshed_at
+
+        by_category_severity: Dict[str, Dict[str, int]] = {}
+        for key, count in buckets["category_severity"].items():
+            category, severity = key.split(":", 1)
+            by_category_severity.setdefault(category, {})[severity] = count
+
+        return PatientStats(
+            total=sum(buckets["age_band"].values()),
+            by_doctor=buckets["doctor"],
+            by_age_band=buckets["age_band"],
+            by_category=buckets["category"],
+            by_category_severity=by_category_severity,
+            refreshed_at=refreshed_at,
+        )
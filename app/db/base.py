@@ -1,5 +1,17 @@
 from app.models.base import BaseModel
 from app.models.user import User
 from app.models.patient import Patient
+from app.models.medical_condition import MedicalCondition
+from app.models.medication import Medication
+from app.models.vital_signs import VitalSigns
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+from app.models.outbox import OutboxEvent, OutboxOffset
+from app.models.audit import AuditRecord
+from app.models.job_run import JobRun
 
-__all__ = ["BaseModel", "User", "Patient"]
\ No newline at end of file
+__all__ = [
+    "BaseModel", "User", "Patient", "MedicalCondition", "Medication",
+    "VitalSigns", "RefreshToken", "RevokedToken", "OutboxEvent", "OutboxOffset",
+    "AuditRecord", "JobRun"
+]
\ No newline at end of file
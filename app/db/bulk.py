@@ -0,0 +1,86 @@
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple, Type
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+from app.models.lite import lite_columns, lite_row_class
+
+def _row_class(model: Type[SQLModel], stmt: Select) -> Type[Any]:
+    """Lite row class matching the columns a statement selects."""
+    return lite_row_class(model, tuple(column.key for column in stmt.selected_columns))
+
+class LiteRows:
+    """
+    Bulk reads returning compact read-only rows instead of model instances.
+
+    The statements select the table's columns rather than the mapped
+    entity, so rows never enter the session's identity map and are
+    released as soon as the caller drops them. Use these for exports,
+    analytics and large lists; use the models when rows are modified.
+    """
+
+    @staticmethod
+    def select(
+        model: Type[SQLModel],
+        *criteria: Any,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Select:
+        """
+        Build the column select for a model's lite rows.
+
+        Args:
+            model: Table model, e.g. ``Patient``
+            criteria: WHERE clauses
+            fields: Column names to read, all columns if None
+
+        Returns:
+            Select: Statement whose rows map onto ``lite_row_class``
+        """
+        return select(*lite_columns(model, fields)).where(*criteria)
+
+    @staticmethod
+    async def fetch(
+        db: AsyncSession,
+        model: Type[SQLModel],
+        stmt: Select
+    ) -> List[Any]:
+        """
+        Run a lite row select and build every row.
+
+        Args:
+            db: Database session
+            model: Table model the statement was built for
+            stmt: Statement from ``LiteRows.select``, possibly ordered or limited
+
+        Returns:
+            List[Any]: Lite rows
+        """
+        row_class = _row_class(model, stmt)
+        result = await db.execute(stmt)
+        return [row_class(*row) for row in result]
+
+    @staticmethod
+    async def stream(
+        db: AsyncSession,
+        model: Type[SQLModel],
+        stmt: Select,
+        batch_size: int
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Run a lite row select through a server-side cursor.
+
+        Only one batch is held in memory at a time, whatever the size of
+        the result.
+
+        Args:
+            db: Database session
+            model: Table model the statement was built for
+            stmt: Statement from ``LiteRows.select``
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Sequence[Any]: Batch of lite rows
+        """
+        row_class = _row_class(model, stmt)
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield [row_class(*row) for row in partition]
@@ -0,0 +1,121 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import ColumnElement, exists, false
+from app.db.aggregates import AGE_BANDS
+from app.models.medical_condition import MedicalCondition
+from app.models.patient import Patient
+from app.schemas.patient import PatientCohort
+
+def _years_before(day: date, years: int) -> date:
+    """Same calendar day ``years`` earlier; February 29th maps to the 28th."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+def age_bounds(cohort: PatientCohort) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Combine the explicit age limits with the age band.
+
+    Args:
+        cohort: Cohort criteria
+
+    Returns:
+        Tuple[Optional[int], Optional[int]]: Minimum and maximum age,
+            None where unbounded
+
+    Raises:
+        ValueError: If the age band is unknown
+    """
+    min_age, max_age = cohort.min_age, cohort.max_age
+    if cohort.age_band is not None:
+        bands = {label: (low, high) for label, low, high in AGE_BANDS}
+        if cohort.age_band not in bands:
+            raise ValueError(
+                f"Unknown age band {cohort.age_band!r}, expected one of {', '.join(bands)}"
+            )
+        low, high = bands[cohort.age_band]
+        min_age = low if min_age is None else max(min_age, low)
+        if high is not None:
+            max_age = high if max_age is None else min(max_age, high)
+    return min_age, max_age
+
+def birth_date_range(
+    min_age: Optional[int],
+    max_age: Optional[int],
+    today: date
+) -> Tuple[Optional[date], Optional[date]]:
+    """
+    Translate an age range into the matching range of birth dates.
+
+    Someone is at least ``n`` years old if born on or before the same
+    day ``n`` years ago, and at most ``n`` years old if born after the
+    same day ``n + 1`` years ago.
+
+    Args:
+        min_age: Minimum age in whole years, None if unbounded
+        max_age: Maximum age in whole years, None if unbounded
+        today: Day the ages are computed on
+
+    Returns:
+        Tuple[Optional[date], Optional[date]]: Earliest and latest
+            birth dates, both inclusive, None where unbounded
+    """
+    latest = _years_before(today, min_age) if min_age is not None else None
+    earliest = (
+        _years_before(today, max_age + 1) + timedelta(days=1)
+        if max_age is not None else None
+    )
+    return earliest, latest
+
+def cohort_criteria(
+    cohort: PatientCohort,
+    today: Optional[date] = None
+) -> List[ColumnElement[bool]]:
+    """
+    Build the WHERE clauses selecting a cohort of patients.
+
+    Ages become a ``date_of_birth`` range with constant bounds, served
+    by the birth date index, rather than an age computed for every row.
+    The condition criteria are an ``EXISTS`` semi-join, so a patient
+    with several matching conditions is returned once and the planner
+    may start from whichever side is more selective.
+
+    Args:
+        cohort: Cohort criteria
+        today: Day ages are computed on, current UTC date if None
+
+    Returns:
+        List[ColumnElement[bool]]: Clauses to combine with AND
+
+    Raises:
+        ValueError: If the age band is unknown
+    """
+    today = today or datetime.now(timezone.utc).date()
+    criteria: List[ColumnElement[bool]] = []
+
+    min_age, max_age = age_bounds(cohort)
+    if min_age is not None and max_age is not None and min_age > max_age:
+        return [false()]
+    earliest, latest = birth_date_range(min_age, max_age, today)
+    if earliest is not None:
+        criteria.append(Patient.date_of_birth >= earliest)
+    if latest is not None:
+        criteria.append(Patient.date_of_birth <= latest)
+
+    if cohort.gender is not None:
+        criteria.append(Patient.gender == cohort.gender.value)
+    if cohort.doctor_id is not None:
+        criteria.append(Patient.primary_doctor_id == cohort.doctor_id)
+
+    if cohort.condition_category is not None or cohort.severity is not None:
+        condition = exists().where(
+            MedicalCondition.patient_id == Patient.id,
+            MedicalCondition.is_active
+        )
+        if cohort.condition_category is not None:
+            condition = condition.where(MedicalCondition.category == cohort.condition_category)
+        if cohort.severity is not None:
+            condition = condition.where(MedicalCondition.severity == cohort.severity)
+        criteria.append(condition)
+    return criteria
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cron import CronTrigger
+from app.core.refresh_tokens import RefreshTokenStore
+from app.core.revoked_tokens import RevokedTokenStore
+from app.core.scheduler import Job, JobFunc, SchedulerConfig
+from app.core.security import SecurityConfig
+from app.db.aggregates import PatientAggregates
+from app.db.partitions import AuditPartitions
+from app.models.job_run import JobRun
+
+async def maintain_audit_partitions(db: AsyncSession) -> Dict[str, Any]:
+    """Create the upcoming audit partitions and drop the expired ones."""
+    conn = await db.connection()
+    ensured = await AuditPartitions.ensure(conn)
+    removed = await AuditPartitions.apply_retention(conn)
+    await db.commit()
+    return {"ensured": ensured, "removed": removed}
+
+async def refresh_patient_aggregates(db: AsyncSession) -> None:
+    """Recompute the precomputed patient counts."""
+    await PatientAggregates.refresh(db)
+
+async def purge_refresh_tokens(db: AsyncSession) -> Dict[str, Any]:
+    """Delete refresh tokens past their expiry."""
+    return {"deleted": await RefreshTokenStore(db).purge_expired()}
+
+async def purge_revoked_tokens(db: AsyncSession) -> Dict[str, Any]:
+    """Delete expired revocations and drop this worker's expired memos."""
+    return {
+        "deleted": await RevokedTokenStore(db).purge_expired(),
+        "memo_deleted": SecurityConfig.token_service.purge_expired()
+    }
+
+async def purge_job_history(db: AsyncSession) -> Dict[str, Any]:
+    """Delete job runs older than the history retention."""
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        days=SchedulerConfig.HISTORY_RETENTION_DAYS
+    )
+    result = await db.execute(delete(JobRun).where(JobRun.started_at < cutoff))
+    await db.commit()
+    return {"deleted": result.rowcount}
+
+# Job name -> (function, leader only)
+MAINTENANCE_TASKS: Dict[str, Tuple[JobFunc, bool]] = {
+    "audit_partitions": (maintain_audit_partitions, True),
+    "patient_aggregates": (refresh_patient_aggregates, True),
+    "refresh_tokens": (purge_refresh_tokens, True),
+    # Revocations are also memoized per process, so every worker runs it
+    "revoked_tokens": (purge_revoked_tokens, False),
+    "job_history": (purge_job_history, True),
+}
+
+def maintenance_jobs(schedules: Optional[Dict[str, str]] = None) -> List[Job]:
+    """
+    Build the maintenance jobs with their configured schedules.
+
+    Jobs without a schedule are not run.
+
+    Args:
+        schedules: Cron expression per job name, ``SchedulerConfig`` default if None
+
+    Returns:
+        List[Job]: Jobs to add to the scheduler
+
+    Raises:
+        ValueError: If a schedule names an unknown job
+    """
+    if schedules is None:
+        schedules = SchedulerConfig.SCHEDULES
+    unknown = set(schedules) - set(MAINTENANCE_TASKS)
+    if unknown:
+        raise ValueError(f"Unknown maintenance jobs: {', '.join(sorted(unknown))}")
+    return [
+        Job(
+            name=name,
+            func=MAINTENANCE_TASKS[name][0],
+            trigger=CronTrigger(expression),
+            leader_only=MAINTENANCE_TASKS[name][1]
+        )
+        for name, expression in schedules.items()
+    ]
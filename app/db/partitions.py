@@ -0,0 +1,132 @@
+import re
+from datetime import date, datetime, timezone
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.core.config import get_settings
+
+class AuditConfig:
+    """Audit table partitioning and retention configuration."""
+    TABLE_NAME: str = "audit_log"
+    _settings = get_settings().audit
+    PARTITIONS_AHEAD: int = _settings.partitions_ahead
+    RETENTION_MONTHS: int = _settings.retention_months
+
+_PARTITION_NAME = re.compile(rf"^{AuditConfig.TABLE_NAME}_y(\d{{4}})m(\d{{2}})$")
+
+def _add_months(month_start: date, months: int) -> date:
+    """Return the first day of the month ``months`` after ``month_start``."""
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(month_start: date) -> str:
+    """
+    Name of the audit partition holding a month.
+
+    Args:
+        month_start: First day of the month
+
+    Returns:
+        str: Partition table name, e.g. ``audit_log_y2024m01``
+    """
+    return f"{AuditConfig.TABLE_NAME}_y{month_start.year:04d}m{month_start.month:02d}"
+
+class AuditPartitions:
+    """
+    Maintenance of the monthly partitions of the audit table.
+
+    New partitions are created ahead of time so inserts never hit a
+    missing range; expired months are detached and dropped, which is a
+    metadata operation instead of a large ``DELETE``.
+    """
+
+    @staticmethod
+    async def ensure(
+        conn: AsyncConnection,
+        months_ahead: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> List[str]:
+        """
+        Create partitions for the current month and the months ahead.
+
+        Args:
+            conn: Database connection
+            months_ahead: Future months to create, ``AuditConfig`` default if None
+            today: Reference date, current UTC date if None
+
+        Returns:
+            List[str]: Names of the partitions ensured
+        """
+        if months_ahead is None:
+            months_ahead = AuditConfig.PARTITIONS_AHEAD
+        today = today or datetime.now(timezone.utc).date()
+        current = today.replace(day=1)
+
+        names = []
+        for offset in range(months_ahead + 1):
+            start = _add_months(current, offset)
+            end = _add_months(start, 1)
+            name = partition_name(start)
+            await conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} "
+                f"PARTITION OF {AuditConfig.TABLE_NAME} "
+                f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+                f"TO ('{end.isoformat()} 00:00:00+00')"
+            ))
+            names.append(name)
+        return names
+
+    @staticmethod
+    async def attached(conn: AsyncConnection) -> List[str]:
+        """
+        List the partitions currently attached to the audit table.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            List[str]: Partition table names
+        """
+        result = await conn.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table ORDER BY child.relname"
+        ), {"table": AuditConfig.TABLE_NAME})
+        return [row[0] for row in result]
+
+    @staticmethod
+    async def apply_retention(
+        conn: AsyncConnection,
+        retention_months: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> List[str]:
+        """
+        Detach and drop partitions entirely older than the retention window.
+
+        Args:
+            conn: Database connection
+            retention_months: Months to keep, ``AuditConfig`` default if None
+            today: Reference date, current UTC date if None
+
+        Returns:
+            List[str]: Names of the partitions removed
+        """
+        if retention_months is None:
+            retention_months = AuditConfig.RETENTION_MONTHS
+        today = today or datetime.now(timezone.utc).date()
+        cutoff = _add_months(today.replace(day=1), -retention_months)
+
+        removed = []
+        for name in await AuditPartitions.attached(conn):
+            match = _PARTITION_NAME.match(name)
+            if match is None:
+                continue
+            month_start = date(int(match.group(1)), int(match.group(2)), 1)
+            if _add_months(month_start, 1) <= cutoff:
+                await conn.execute(text(
+                    f"ALTER TABLE {AuditConfig.TABLE_NAME} DETACH PARTITION {name}"
+                ))
+                await conn.execute(text(f"DROP TABLE {name}"))
+                removed.append(name)
+        return removed
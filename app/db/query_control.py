@@ -0,0 +1,230 @@
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+class QueryConfig:
+    """
+    Statement limits and slow-query capture configuration.
+
+    Every session belongs to a query class whose limits apply to each of
+    its transactions: ``interactive`` for request handlers, ``export``
+    for long streaming reads and ``maintenance`` for background jobs.
+    """
+    _settings = get_settings().query
+    DEFAULT_CLASS: str = "interactive"
+    STATEMENT_TIMEOUT_MS: Dict[str, int] = _settings.statement_timeout_ms
+    LOCK_TIMEOUT_MS: Dict[str, int] = _settings.lock_timeout_ms
+    SLOW_QUERY_THRESHOLD_MS: float = _settings.slow_query_threshold_ms
+    SLOW_QUERY_LOG_SIZE: int = _settings.slow_query_log_size
+
+def apply_query_limits(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection
+) -> None:
+    """
+    Set the statement and lock timeouts when a session transaction begins.
+
+    The settings are transaction-local, so they end with the transaction
+    and never leak to the next user of a pooled connection. Both are set
+    in a single round trip.
+    """
+    query_class = session.info.get("query_class", QueryConfig.DEFAULT_CLASS)
+    connection.info["query_class"] = query_class
+    connection.exec_driver_sql(
+        "SELECT set_config('statement_timeout', $1, true), "
+        "set_config('lock_timeout', $2, true)",
+        (
+            f"{QueryConfig.STATEMENT_TIMEOUT_MS[query_class]}ms",
+            f"{QueryConfig.LOCK_TIMEOUT_MS[query_class]}ms",
+        )
+    )
+
+def register_query_limits() -> None:
+    """Apply the query class limits to every ORM session transaction."""
+    if not event.contains(Session, "after_begin", apply_query_limits):
+        event.listen(Session, "after_begin", apply_query_limits)
+
+def redact_parameters(parameters: Any) -> List[str]:
+    """
+    Replace bound parameter values with their type names.
+
+    Args:
+        parameters: DBAPI parameters of one statement
+
+    Returns:
+        List[str]: One placeholder per parameter, e.g. ``<UUID>``
+    """
+    if isinstance(parameters, list):
+        return [f"<{len(parameters)} parameter sets>"]
+    if isinstance(parameters, dict):
+        return [f"{name}=<{type(value).__name__}>" for name, value in parameters.items()]
+    return [f"<{type(value).__name__}>" for value in parameters or ()]
+
+@dataclass
+class SlowQuery:
+    """
+    A statement that took longer than the slow-query threshold.
+
+    Attributes:
+        statement: SQL text with ``$n`` placeholders
+        parameters: Redacted bound parameters
+        duration_ms: Execution time
+        query_class: Query class of the session that ran it
+        recorded_at: When the statement finished
+        error: Exception class name if the statement failed, e.g. on timeout
+    """
+    statement: str
+    parameters: List[str]
+    duration_ms: float
+    query_class: str
+    recorded_at: datetime
+    error: Optional[str] = None
+
+class SlowQueryLog:
+    """
+    Ring buffer of the most recent slow statements.
+
+    Timing hooks into the engine's cursor events. Statements that fail
+    are recorded too when they were slow, which is how statement
+    timeouts show up. Bound values are never stored.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: Optional[float] = None,
+        size: Optional[int] = None
+    ):
+        """
+        Initialize slow-query log.
+
+        Args:
+            threshold_ms: Minimum duration recorded, config default if None
+            size: Number of entries kept, config default if None
+        """
+        self.threshold_ms = (
+            threshold_ms if threshold_ms is not None else QueryConfig.SLOW_QUERY_THRESHOLD_MS
+        )
+        self._entries: Deque[SlowQuery] = deque(maxlen=size or QueryConfig.SLOW_QUERY_LOG_SIZE)
+
+    def install(self, engine: Engine) -> None:
+        """
+        Time every statement run on an engine.
+
+        Args:
+            engine: Sync engine, e.g. ``AsyncEngine.sync_engine``
+        """
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def _before_execute(self, conn: Connection, cursor: Any, statement: str,
+                        parameters: Any, context: Any, executemany: bool) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after_execute(self, conn: Connection, cursor: Any, statement: str,
+                       parameters: Any, context: Any, executemany: bool) -> None:
+        self._record(conn, statement, parameters)
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.connection is not None and context.statement is not None:
+            # The DBAPI adapter wraps the driver's exception, e.g. QueryCanceledError
+            error = context.original_exception.__cause__ or context.original_exception
+            self._record(
+                context.connection,
+                context.statement,
+                context.parameters,
+                type(error).__name__
+            )
+
+    def _record(self, conn: Connection, statement: str, parameters: Any,
+                error: Optional[str] = None) -> None:
+        """Pop the statement's start time and keep it if it was slow."""
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        duration_ms = (time.perf_counter() - starts.pop()) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+        self._entries.append(SlowQuery(
+            statement=statement,
+            parameters=redact_parameters(parameters),
+            duration_ms=round(duration_ms, 3),
+            query_class=conn.info.get("query_class", QueryConfig.DEFAULT_CLASS),
+            recorded_at=datetime.now(timezone.utc),
+            error=error
+        ))
+
+    def entries(self, limit: Optional[int] = None) -> List[SlowQuery]:
+        """
+        Get the recorded statements.
+
+        Args:
+            limit: Maximum entries returned, all if None
+
+        Returns:
+            List[SlowQuery]: Most recent first
+        """
+        entries = list(reversed(self._entries))
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self) -> None:
+        """Drop all recorded statements."""
+        self._entries.clear()
+
+slow_query_log = SlowQueryLog()
+
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+async def explain_generic(db: AsyncSession, statement: str) -> Optional[List[str]]:
+    """
+    Get the generic plan of a captured statement without its values.
+
+    The statement is prepared and explained with ``plan_cache_mode``
+    forced to generic, so the plan does not depend on (and the output
+    does not reveal) the parameter values. Nothing is executed, and the
+    session's transaction is rolled back afterwards.
+
+    Args:
+        db: Database session
+        statement: SQL text with ``$n`` placeholders
+
+    Returns:
+        Optional[List[str]]: Plan lines, or None if the statement cannot
+            be explained
+    """
+    if not _EXPLAINABLE.match(statement):
+        return None
+    placeholders = max((int(n) for n in re.findall(r"\$(\d+)", statement)), default=0)
+    arguments = ", ".join(["NULL"] * placeholders)
+    conn = await db.connection()
+    driver = (await conn.get_raw_connection()).driver_connection
+    plan = None
+    prepared = False
+    await driver.execute("SAVEPOINT explain_plan")
+    try:
+        await driver.execute("SET LOCAL plan_cache_mode = force_generic_plan")
+        await driver.execute(f"PREPARE slow_query_plan AS {statement}")
+        prepared = True
+        execute = f"EXECUTE slow_query_plan({arguments})" if placeholders else "EXECUTE slow_query_plan"
+        plan = [row[0] for row in await driver.fetch(f"EXPLAIN {execute}")]
+    except Exception as exc:
+        logger.debug("Cannot explain captured statement: %s", exc)
+        await driver.execute("ROLLBACK TO SAVEPOINT explain_plan")
+    # Prepared statements outlive transactions; drop it before the
+    # connection goes back to the pool
+    if prepared:
+        await driver.execute("DEALLOCATE slow_query_plan")
+    await db.rollback()
+    return plan
@@ -1,17 +1,32 @@
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 from sqlmodel import SQLModel
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 from sqlalchemy import text
+from app.db import base  # noqa: F401 - registers every table on the metadata
+from app.db.aggregates import PatientAggregates
+from app.db.partitions import AuditPartitions
+from app.db.upgrades import apply_schema_upgrades
+from app.core.config import get_settings
+from app.core.outbox import register_outbox_listener
+from app.db.query_control import QueryConfig, register_query_limits, slow_query_log
 
 class DatabaseConfig:
     """Database configuration settings."""
-    POSTGRES_USER: str = "silvanoquarto"
-    POSTGRES_PASSWORD: str = "password"
-    POSTGRES_SERVER: str = "localhost"
-    POSTGRES_PORT: str = "5432"
-    POSTGRES_DB: str = "healthcare_db"
+    _settings = get_settings().database
+    POSTGRES_USER: str = _settings.user
+    POSTGRES_PASSWORD: str = _settings.password.get_secret_value()
+    POSTGRES_SERVER: str = _settings.server
+    POSTGRES_PORT: str = str(_settings.port)
+    POSTGRES_DB: str = _settings.name
+    # Set per worker by the launcher from the total connection budget
+    POOL_SIZE: int = _settings.pool_size
+    MAX_OVERFLOW: int = _settings.max_overflow
+    POOL_TIMEOUT: float = _settings.pool_timeout_seconds
+    POOL_RECYCLE: int = _settings.pool_recycle_seconds
+    ECHO: bool = _settings.echo
     
     @property
     def SQLALCHEMY_DATABASE_URL(self) -> str:
@@ -23,29 +38,102 @@ class DatabaseConfig:
 
 db_config = DatabaseConfig()
 
-engine = create_async_engine(
-    db_config.SQLALCHEMY_DATABASE_URL,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
-    poolclass=NullPool
-)
+@lru_cache(maxsize=None)
+def get_engine() -> AsyncEngine:
+    """
+    Get the process-wide engine, creating it on first use.
+
+    Creating the engine loads the asyncpg driver, so it is deferred
+    until the first connection is needed instead of happening at import.
+
+    Returns:
+        AsyncEngine: Async database engine
+    """
+    engine = create_async_engine(
+        db_config.SQLALCHEMY_DATABASE_URL,
+        echo=db_config.ECHO,
+        future=True,
+        pool_pre_ping=True,
+        pool_size=db_config.POOL_SIZE,
+        max_overflow=db_config.MAX_OVERFLOW,
+        pool_timeout=db_config.POOL_TIMEOUT,
+        pool_recycle=db_config.POOL_RECYCLE
+    )
+    slow_query_log.install(engine.sync_engine)
+    return engine
+
+@lru_cache(maxsize=None)
+def _unpooled_engine() -> AsyncEngine:
+    """Engine opening a new connection on every connect, outside the pool."""
+    return create_async_engine(db_config.SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
+def connect_unpooled() -> AsyncConnection:
+    """
+    Open a dedicated connection that does not count against the pool.
+
+    Meant for long-held connections, such as the scheduler's leader
+    lock, that would otherwise keep a request's connection checked out.
+    ``ServerConfig.UNPOOLED_CONNECTIONS_PER_WORKER`` reserves room for
+    them in the connection budget. Closing it closes the server session.
+
+    Returns:
+        AsyncConnection: Connection, to be awaited or used as an async
+            context manager
+    """
+    return _unpooled_engine().connect()
+
+@lru_cache(maxsize=None)
+def _session_factory() -> sessionmaker:
+    """Session factory bound to the engine."""
+    return sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+def async_session(query_class: str = QueryConfig.DEFAULT_CLASS) -> AsyncSession:
+    """
+    Open a new session on the engine.
+
+    Args:
+        query_class: Query class whose statement and lock timeouts apply
+            to the session's transactions (see ``QueryConfig``)
+
+    Returns:
+        AsyncSession: Session, usable as an async context manager
+
+    Raises:
+        ValueError: If the query class has no configured timeouts
+    """
+    if query_class not in QueryConfig.STATEMENT_TIMEOUT_MS:
+        raise ValueError(f"Unknown query class {query_class!r}")
+    session = _session_factory()()
+    session.info["query_class"] = query_class
+    return session
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``engine`` lazily, so importing it does not create it early."""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-async_session = sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+register_outbox_listener()
+register_query_limits()
 
 async def init_db() -> None:
     """
     Initialize database with all models.
     
-    Sets timezone to UTC and creates all tables.
+    Sets timezone to UTC, creates all tables, upgrades existing ones,
+    creates the upcoming audit partitions and the summary views built on
+    top of the tables.
     """
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.execute(text('SET TIME ZONE "UTC"'))
         await conn.run_sync(SQLModel.metadata.create_all)
+        await apply_schema_upgrades(conn)
+        await AuditPartitions.ensure(conn)
+        await PatientAggregates.create(conn)
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -67,5 +155,6 @@ async def cleanup_db() -> None:
     
     Used primarily for testing.
     """
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
+        await PatientAggregates.drop(conn)
         await conn.run_sync(SQLModel.metadata.drop_all)
\ No newline at end of file
@@ -0,0 +1,73 @@
+from typing import List
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlmodel import SQLModel
+
+# create_all only adds missing tables. These idempotent statements bring
+# the tables of an existing database up to date; each must be safe to
+# run on every startup.
+SCHEMA_UPGRADES: List[str] = [
+    # Patient versions for optimistic concurrency, and server-side timestamp
+    # defaults on the tables created before BaseModel declared them
+    "ALTER TABLE patients ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1",
+    "ALTER TABLE patients ALTER COLUMN created_at SET DEFAULT now(), "
+    "ALTER COLUMN updated_at SET DEFAULT now()",
+    "ALTER TABLE users ALTER COLUMN created_at SET DEFAULT now(), "
+    "ALTER COLUMN updated_at SET DEFAULT now()",
+    # Outbox offsets: (transaction id, event id) cursor and delivery lease
+    "ALTER TABLE outbox_offsets ADD COLUMN IF NOT EXISTS last_transaction_id BIGINT NOT NULL DEFAULT 0",
+    "ALTER TABLE outbox_offsets ADD COLUMN IF NOT EXISTS leased_until TIMESTAMP WITH TIME ZONE",
+    "CREATE INDEX IF NOT EXISTS ix_outbox_events_transaction_id_id ON outbox_events (transaction_id, id)",
+    # Start an id-only offset before the oldest transaction with undelivered
+    # events: some delivered events may be sent again, none is skipped
+    """
+    UPDATE outbox_offsets o
+    SET last_transaction_id = coalesce(
+        (SELECT min(e.transaction_id) - 1 FROM outbox_events e WHERE e.id > o.last_event_id),
+        (SELECT max(e.transaction_id) FROM outbox_events e WHERE e.id <= o.last_event_id),
+        0
+    )
+    WHERE o.last_transaction_id = 0 AND o.last_event_id > 0
+    """,
+    # Cohort filter indexes
+    "CREATE INDEX IF NOT EXISTS ix_patients_date_of_birth ON patients (date_of_birth)",
+    "CREATE INDEX IF NOT EXISTS ix_patients_primary_doctor_id ON patients (primary_doctor_id)",
+    "CREATE INDEX IF NOT EXISTS ix_medicalcondition_category_severity_patient "
+    "ON medicalcondition (category, severity, patient_id)",
+    # updated_at for UPDATEs the ORM's onupdate never sees, e.g. Core
+    # statements or manual SQL; triggers per table in updated_at_triggers
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at := now();
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+def updated_at_triggers() -> List[str]:
+    """
+    Statements attaching ``set_updated_at`` to the tables that keep an
+    ``updated_at`` column current on update.
+
+    Returns:
+        List[str]: One ``CREATE OR REPLACE TRIGGER`` per table
+    """
+    return [
+        f"CREATE OR REPLACE TRIGGER {table.name}_set_updated_at "
+        f"BEFORE UPDATE ON {table.name} "
+        f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        for table in SQLModel.metadata.sorted_tables
+        if "updated_at" in table.c and table.c.updated_at.onupdate is not None
+    ]
+
+async def apply_schema_upgrades(conn: AsyncConnection) -> None:
+    """
+    Bring the tables of an existing database up to date.
+
+    Args:
+        conn: Connection inside the schema creation transaction
+    """
+    for statement in SCHEMA_UPGRADES + updated_at_triggers():
+        await conn.execute(text(statement))
@@ -1,17 +1,54 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.endpoints import auth, patients
+from app.api.deps import cancel_on_disconnect
+from app.api.endpoints import audit, auth, monitoring, patients, research, stats, vitals
 from app.core.logging_config import LogConfig
+from app.core.compression import CompressionMiddleware
+from app.core.live_feed import VitalsFeed
+from app.core.outbox import OutboxDispatcher, configured_sinks
+from app.core.rate_limit import ConcurrencyLimitMiddleware, RateLimitMiddleware
+from app.core.scheduler import Scheduler, SchedulerConfig
+from app.db.maintenance import maintenance_jobs
+from app.db.session import async_session, connect_unpooled
 from contextlib import asynccontextmanager
 
-log_config = LogConfig()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background services on startup and stop them on shutdown."""
+    LogConfig()
+    sinks = configured_sinks()
+    dispatcher = OutboxDispatcher(async_session, sinks) if sinks else None
+    if dispatcher is not None:
+        dispatcher.start()
+    scheduler = None
+    if SchedulerConfig.ENABLED:
+        scheduler = Scheduler(
+            lambda: async_session("maintenance"),
+            connect_unpooled,
+            maintenance_jobs()
+        )
+        scheduler.start()
+    app.state.scheduler = scheduler
+    # Listens to the database only once a client subscribes
+    app.state.vitals_feed = VitalsFeed(connect_unpooled)
+    yield
+    await app.state.vitals_feed.stop()
+    if scheduler is not None:
+        await scheduler.stop()
+    if dispatcher is not None:
+        await dispatcher.stop()
 
 app = FastAPI(
     title="Healthcare Data Platform",
     description="API for managing elderly patient healthcare data",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    dependencies=[Depends(cancel_on_disconnect, scope="function")]
 )
 
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ConcurrencyLimitMiddleware)
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, specify actual origins
@@ -22,13 +59,8 @@ app.add_middleware(
 
 app.include_router(auth.router)
 app.include_router(patients.router)
-
-@asynccontextmanager
-async def startup_event():
-    """Initialize services on startup."""
-    pass  
-
-@asynccontextmanager
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    pass  
\ No newline at end of file
+app.include_router(stats.router)
+app.include_router(research.router)
+app.include_router(audit.router)
+app.include_router(monitoring.router)
+app.include_router(vitals.router)
\ No newline at end of file
@@ -1,5 +1,16 @@
 from .base import BaseModel
 from .user import User, UserRole
 from .patient import Patient, Gender, BloodType
+from .medical_condition import MedicalCondition, ConditionCategory, Severity
+from .medication import Medication
+from .vital_signs import VitalSigns
+from .refresh_token import RefreshToken
+from .revoked_token import RevokedToken
+from .outbox import OutboxEvent, OutboxOffset
+from .audit import AuditRecord
+from .job_run import JobRun
 
-MODELS = [User, Patient]
\ No newline at end of file
+MODELS = [
+    User, Patient, MedicalCondition, Medication, VitalSigns,
+    RefreshToken, RevokedToken, OutboxEvent, OutboxOffset, AuditRecord, JobRun
+]
\ No newline at end of file
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+from sqlmodel import Field, SQLModel
+from sqlalchemy import DateTime, Index, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+class AuditRecord(SQLModel, table=True):
+    """
+    Persisted audit trail entry.
+    
+    The table is append-only and range-partitioned by month on
+    ``timestamp``; partitions are created ahead of time and old ones are
+    detached for retention (see ``app.db.partitions``). The primary key
+    includes ``timestamp`` because PostgreSQL requires the partition key
+    in every unique constraint.
+    
+    Attributes:
+        id: Unique identifier for the audit entry
+        timestamp: When the action occurred
+        user_id: ID of the user who performed the action
+        action: Type of action performed
+        resource_type: Type of resource affected
+        resource_id: ID of the specific resource affected
+        resource_ids: IDs of the resources affected by a batch action
+        details: Additional details about the action
+    """
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_resource", "resource_type", "resource_id", "timestamp"),
+        Index("ix_audit_log_user", "user_id", "timestamp"),
+        Index("ix_audit_log_resource_ids", "resource_ids", postgresql_using="gin"),
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    timestamp: datetime = Field(
+        primary_key=True,
+        sa_type=DateTime(timezone=True),
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    user_id: UUID = Field(nullable=False)
+    action: str = Field(nullable=False)
+    resource_type: str = Field(nullable=False)
+    resource_id: Optional[UUID] = Field(default=None)
+    resource_ids: Optional[List[UUID]] = Field(default=None, sa_type=ARRAY(Uuid))
+    details: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONB)
\ No newline at end of file
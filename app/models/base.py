@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from sqlmodel import SQLModel, Field
 from uuid import UUID, uuid4
@@ -9,20 +9,28 @@ class BaseModel(SQLModel):
     Base model for all database models.
     
     Uses PostgreSQL TIMESTAMP WITH TIME ZONE for datetime fields.
+    Server-generated values are fetched in the same statement
+    (``eager_defaults``), so they never need a separate refresh.
     """
+    __mapper_args__ = {"eager_defaults": True}
+    
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True
     )
     
     created_at: datetime = Field(
-        sa_column=DateTime(timezone=True),
-        default_factory=lambda: datetime.now()
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+        default_factory=lambda: datetime.now(timezone.utc)
     )
     
+    # Set on every UPDATE: by the ORM's onupdate, and by the set_updated_at
+    # trigger (app/db/upgrades.py) for Core statements and manual SQL
     updated_at: datetime = Field(
-        sa_column=DateTime(timezone=True),
-        default_factory=lambda: datetime.now()
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+        default_factory=lambda: datetime.now(timezone.utc)
     )
     
     is_active: bool = Field(default=True)
@@ -32,8 +40,4 @@ class BaseModel(SQLModel):
         json_encoders = {
             datetime: lambda dt: dt.isoformat(),
             UUID: lambda v: str(v)
-        }
-        
-    def update_timestamp(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now()
\ No newline at end of file
+        }
\ No newline at end of file
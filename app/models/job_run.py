@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from sqlmodel import Field, SQLModel
+from sqlalchemy import BigInteger, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+
+class JobRun(SQLModel, table=True):
+    """
+    History entry of a background job run.
+
+    Attributes:
+        id: Run sequence number
+        job: Name of the job
+        worker: Process that ran the job, as ``hostname:pid``
+        started_at: When the run started
+        finished_at: When the run ended
+        duration_ms: Run time in milliseconds
+        status: "succeeded" or "failed"
+        error: Exception raised by a failed run
+        details: Job-specific results, e.g. number of rows deleted
+    """
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        Index("ix_job_runs_job_started_at", "job", "started_at"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger)
+    job: str = Field(nullable=False)
+    worker: str = Field(nullable=False)
+    started_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    finished_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+    duration_ms: float = Field(nullable=False)
+    status: str = Field(nullable=False)
+    error: Optional[str] = Field(default=None)
+    details: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSONB)
@@ -0,0 +1,66 @@
+from dataclasses import make_dataclass
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Type
+from sqlalchemy import Column
+from sqlmodel import SQLModel
+
+def lite_columns(
+    model: Type[SQLModel],
+    fields: Optional[Tuple[str, ...]] = None
+) -> List[Column]:
+    """
+    Table columns of a model, in table order or as listed.
+
+    Args:
+        model: Table model, e.g. ``Patient``
+        fields: Column names to keep, all columns if None
+
+    Returns:
+        List[Column]: Columns to select
+
+    Raises:
+        ValueError: If a field is not a column of the model's table
+    """
+    columns = model.__table__.columns
+    if fields is None:
+        return list(columns)
+    unknown = [name for name in fields if name not in columns]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no columns {', '.join(unknown)}")
+    return [columns[name] for name in fields]
+
+@lru_cache(maxsize=None)
+def lite_row_class(
+    model: Type[SQLModel],
+    fields: Optional[Tuple[str, ...]] = None
+) -> Type[Any]:
+    """
+    Read-only compact row class mirroring a table model.
+
+    The class is a frozen dataclass with ``__slots__``: an instance is
+    one object holding a pointer per column, without the validation
+    state, ``__dict__`` and SQLAlchemy instance state of a model
+    instance. Instances are built positionally from result rows, e.g.
+    ``PatientRow(*row)``, and are never tracked by a session.
+
+    Args:
+        model: Table model, e.g. ``Patient``
+        fields: Column names to keep, all columns if None
+
+    Returns:
+        Type[Any]: Dataclass named after the model, e.g. ``PatientRow``
+    """
+    annotations = {
+        name: hint
+        for klass in reversed(model.__mro__)
+        for name, hint in getattr(klass, "__annotations__", {}).items()
+    }
+    return make_dataclass(
+        f"{model.__name__}Row",
+        [
+            (column.key, annotations.get(column.key, Any))
+            for column in lite_columns(model, fields)
+        ],
+        frozen=True,
+        slots=True
+    )
@@ -2,6 +2,7 @@ from enum import Enum
 from datetime import date
 from typing import Optional
 from sqlmodel import Field
+from sqlalchemy import Index
 from uuid import UUID
 from .base import BaseModel
 
@@ -17,11 +18,16 @@ class Severity(str, Enum):
     SEVERELY = "severely"
 
 class MedicalCondition(BaseModel, table = True):
-    patient_id: UUID = Field(foreign_key="patient.id")
+    # Lets cohort filters on category and severity start from the conditions
+    __table_args__ = (
+        Index("ix_medicalcondition_category_severity_patient", "category", "severity", "patient_id"),
+    )
+
+    patient_id: UUID = Field(foreign_key="patients.id", index=True)
     category: ConditionCategory
     name: str
     diagnosis_date: date
     severity: Severity
-    diagnosing_doctor_id: UUID = Field(foreign_key="user.id")
+    diagnosing_doctor_id: UUID = Field(foreign_key="users.id")
     notes: Optional[str] = None
     treatment_plan: Optional[str] = None
\ No newline at end of file
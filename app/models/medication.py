@@ -5,12 +5,12 @@ from uuid import UUID
 from .base import BaseModel
 
 class Medication(BaseModel, table=True):
-    patient_id: UUID = Field(foreign_key="patient.id")
+    patient_id: UUID = Field(foreign_key="patients.id", index=True)
     name: str
     dosage: str
     frequency: str
     start_date: date
     end_date: Optional[date] = None
-    prescribed_by_id: UUID = Field(foreign_key="user.id")
+    prescribed_by_id: UUID = Field(foreign_key="users.id")
     is_active: bool = True
     notes: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+from sqlmodel import Field, SQLModel
+from sqlalchemy import BigInteger, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+class OutboxEvent(SQLModel, table=True):
+    """
+    Change event written in the same transaction as the change itself.
+    
+    Events are delivered in ``(transaction_id, id)`` order: transactions
+    in the order they started writing, and the events of a transaction
+    in the order they were written.
+    
+    Attributes:
+        id: Monotonic event sequence number
+        transaction_id: Writing transaction, used to wait for concurrent
+            writers before advancing past an event
+        aggregate_type: Model name of the changed row
+        aggregate_id: Primary key of the changed row
+        patient_id: Patient the change belongs to
+        event_type: "created", "updated" or "deleted"
+        payload: Row contents after the change
+        created_at: When the event was written
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        Index("ix_outbox_events_transaction_id_id", "transaction_id", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger)
+    transaction_id: Optional[int] = Field(
+        default=None,
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": text("txid_current()")}
+    )
+    aggregate_type: str = Field(nullable=False)
+    aggregate_id: UUID = Field(nullable=False)
+    patient_id: UUID = Field(index=True, nullable=False)
+    event_type: str = Field(nullable=False)
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_type=JSONB)
+    created_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+class OutboxOffset(SQLModel, table=True):
+    """
+    Delivery position of an outbox consumer.
+    
+    Attributes:
+        consumer: Name of the sink consuming the events
+        last_transaction_id: Transaction of the last delivered event
+        last_event_id: Id of the last delivered event
+        leased_until: End of the lease of the worker delivering the next
+            batch, None when no delivery is in progress
+        updated_at: When the position last advanced
+    """
+    __tablename__ = "outbox_offsets"
+
+    consumer: str = Field(primary_key=True)
+    last_transaction_id: int = Field(default=0, sa_type=BigInteger)
+    last_event_id: int = Field(default=0, sa_type=BigInteger)
+    leased_until: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
+    updated_at: datetime = Field(
+        sa_type=DateTime(timezone=True),
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
\ No newline at end of file
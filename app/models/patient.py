@@ -33,18 +33,23 @@ class Patient(BaseModel, table=True):
     fiscal_code: str = Field(unique=True, index=True)
     first_name: str
     last_name: str
-    date_of_birth: date
+    # Indexed for age and cohort filters, which become birth date ranges
+    date_of_birth: date = Field(index=True)
     gender: str
     
     last_visit_date: Optional[datetime] = Field(
         default=None,
-        sa_column=DateTime(timezone=True)
+        sa_type=DateTime(timezone=True)
     )
     
     primary_doctor_id: Optional[UUID] = Field(
         default=None,
-        foreign_key="users.id"
+        foreign_key="users.id",
+        index=True
     )
+    # Incremented by every update; clients send it back to detect conflicts
+    version: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+    
     primary_doctor: Optional["User"] = Relationship(
         back_populates="patients",
         sa_relationship_kwargs={"lazy": "selectin"}
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlmodel import Field
+from sqlalchemy import DateTime
+from .base import BaseModel
+
+class RefreshToken(BaseModel, table=True):
+    """
+    Refresh token issued alongside an access token.
+    
+    Only a SHA-256 digest of the token is stored. Tokens rotated from the
+    same login share a ``family_id`` so that reuse of an already rotated
+    token can revoke the whole chain.
+    
+    Attributes:
+        token_hash: Hex SHA-256 digest of the token
+        user_id: Owner of the token
+        family_id: Identifier shared by all rotations of one login
+        expires_at: Sliding expiry, renewed on every rotation
+        session_expires_at: Absolute expiry of the login session
+        revoked_at: When the token was rotated or revoked
+        replaced_by_id: Token issued when this one was rotated
+    """
+    __tablename__ = "refresh_tokens"
+
+    token_hash: str = Field(unique=True, index=True, nullable=False)
+    user_id: UUID = Field(foreign_key="users.id", index=True, nullable=False)
+    family_id: UUID = Field(index=True, nullable=False)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), nullable=False)
+    session_expires_at: datetime = Field(sa_type=DateTime(timezone=True), nullable=False)
+    revoked_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
+    replaced_by_id: Optional[UUID] = Field(default=None)
+
+    def __repr__(self) -> str:
+        """String representation of the refresh token."""
+        return f"RefreshToken(id={self.id}, user_id={self.user_id}, family_id={self.family_id})"
\ No newline at end of file
@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlmodel import Field, SQLModel
+from sqlalchemy import DateTime
+
+class RevokedToken(SQLModel, table=True):
+    """
+    Access token revoked before its expiry, e.g. on logout.
+
+    Attributes:
+        jti: Identifier of the revoked token
+        expires_at: Token expiry, after which the entry can be deleted
+    """
+    __tablename__ = "revoked_tokens"
+
+    jti: str = Field(primary_key=True)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of the revoked token."""
+        return f"RevokedToken(jti={self.jti}, expires_at={self.expires_at})"
@@ -5,7 +5,7 @@ from uuid import UUID
 from .base import BaseModel
 
 class VitalSigns(BaseModel, table=True):
-    patient_id: UUID = Field(foreign_key="patient.id")
+    patient_id: UUID = Field(foreign_key="patients.id", index=True)
     measured_at: datetime
     blood_pressure_systolic: Optional[int] = None
     blood_pressure_diastolic: Optional[int] = None
@@ -13,5 +13,5 @@ class VitalSigns(BaseModel, table=True):
     respiratory_rate: Optional[int] = None
     temperature: Optional[float] = None
     oxygen_saturation: Optional[float] = None
-    measured_by_id: UUID = Field(foreign_key="user.id")
+    measured_by_id: UUID = Field(foreign_key="users.id")
     notes: Optional[str] = None
\ No newline at end of file
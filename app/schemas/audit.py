@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
 class AuditEntry(BaseModel):
@@ -13,6 +13,7 @@ class AuditEntry(BaseModel):
         action: Type of action performed
         resource_type: Type of resource affected
         resource_id: ID of the specific resource affected
+        resource_ids: IDs of the resources affected by a batch action
         details: Additional details about the action
         timestamp: When the action occurred
     """
@@ -21,5 +22,6 @@ class AuditEntry(BaseModel):
     action: str
     resource_type: str
     resource_id: Optional[UUID] = None
+    resource_ids: Optional[List[UUID]] = None
     details: Optional[Dict[str, Any]] = None
     timestamp: datetime
\ No newline at end of file
@@ -0,0 +1,92 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+class SlowQueryEntry(BaseModel):
+    """
+    Schema for a captured slow statement.
+    
+    Attributes:
+        statement: SQL text with ``$n`` placeholders
+        parameters: Bound parameter types; values are never captured
+        duration_ms: Execution time in milliseconds
+        query_class: Query class of the session that ran it
+        recorded_at: When the statement finished
+        error: Exception class name if the statement failed, e.g. on timeout
+        plan: Generic plan, when requested
+    """
+    statement: str
+    parameters: List[str]
+    duration_ms: float
+    query_class: str
+    recorded_at: datetime
+    error: Optional[str] = None
+    plan: Optional[List[str]] = None
+
+class JobRunEntry(BaseModel):
+    """
+    Schema for a recorded background job run.
+    
+    Attributes:
+        job: Name of the job
+        worker: Process that ran the job, as ``hostname:pid``
+        started_at: When the run started
+        finished_at: When the run ended
+        duration_ms: Run time in milliseconds
+        status: "succeeded" or "failed"
+        error: Exception raised by a failed run
+        details: Job-specific results
+    """
+    job: str
+    worker: str
+    started_at: datetime
+    finished_at: datetime
+    duration_ms: float
+    status: str
+    error: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+
+class JobStatus(BaseModel):
+    """
+    Schema for the schedule and run metrics of a background job.
+    
+    Durations are aggregated over the retained run history of every
+    worker; the schedule is the one of the worker answering.
+    
+    Attributes:
+        name: Job name
+        schedule: Cron expression, None if the job is no longer scheduled
+        leader_only: Whether only the elected worker runs the job
+        next_run_at: Next run on the answering worker
+        runs: Recorded runs
+        failures: Recorded failed runs
+        avg_duration_ms: Mean run time
+        p95_duration_ms: 95th percentile run time
+        max_duration_ms: Longest run time
+        last_run: Most recent run
+    """
+    name: str
+    schedule: Optional[str] = None
+    leader_only: Optional[bool] = None
+    next_run_at: Optional[datetime] = None
+    runs: int = 0
+    failures: int = 0
+    avg_duration_ms: Optional[float] = None
+    p95_duration_ms: Optional[float] = None
+    max_duration_ms: Optional[float] = None
+    last_run: Optional[JobRunEntry] = None
+
+class SchedulerStatus(BaseModel):
+    """
+    Schema for the state of the background job scheduler.
+    
+    Attributes:
+        worker: Worker answering the request
+        running: Whether the scheduler runs on this worker
+        leader: Whether this worker runs the leader-only jobs
+        jobs: Status of every scheduled or recorded job
+    """
+    worker: Optional[str] = None
+    running: bool
+    leader: bool
+    jobs: List[JobStatus]
@@ -0,0 +1,86 @@
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+from app.models.medical_condition import ConditionCategory, Severity
+from app.models.patient import Gender, Patient
+
+class PatientBatchRequest(BaseModel):
+    """
+    Schema for fetching several patients at once.
+    
+    Attributes:
+        ids: Patient IDs to fetch, at most 200
+    """
+    ids: List[UUID] = Field(min_length=1, max_length=200)
+
+class PatientBatchResponse(BaseModel):
+    """
+    Schema for a batch of patients.
+    
+    Attributes:
+        patients: Patients found, in the order requested
+        missing: Requested IDs that do not exist or are not accessible
+    """
+    patients: List[Patient]
+    missing: List[UUID]
+
+class PatientUpdate(BaseModel):
+    """
+    Schema for a partial patient update.
+    
+    Only the fields present in the request are changed.
+    
+    Attributes:
+        version: Version the client last read; the update is rejected if
+            the patient has changed since
+        first_name: Patient first name
+        last_name: Patient last name
+        date_of_birth: Patient date of birth
+        gender: Patient gender
+        last_visit_date: When the patient was last visited
+        primary_doctor_id: ID of the primary doctor (admins only)
+        is_active: Whether the patient record is active
+    """
+    version: int = Field(ge=1)
+    first_name: Optional[str] = Field(default=None, min_length=1)
+    last_name: Optional[str] = Field(default=None, min_length=1)
+    date_of_birth: Optional[date] = None
+    gender: Optional[Gender] = None
+    last_visit_date: Optional[datetime] = None
+    primary_doctor_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def _required_fields_not_null(self) -> "PatientUpdate":
+        """Reject explicit nulls for columns that cannot be empty."""
+        for name in ("first_name", "last_name", "date_of_birth", "gender", "is_active"):
+            if name in self.model_fields_set and getattr(self, name) is None:
+                raise ValueError(f"{name} cannot be null")
+        return self
+
+# Upper bound of age criteria, keeping the birth date bounds within date's range
+MAX_AGE = 150
+
+class PatientCohort(BaseModel):
+    """
+    Schema for the criteria selecting a group of patients.
+    
+    Every criterion is optional and all of them must hold.
+    
+    Attributes:
+        min_age: Minimum age in whole years
+        max_age: Maximum age in whole years
+        age_band: Age band label of the summary statistics, e.g. "75-84"
+        gender: Patient gender
+        doctor_id: ID of the primary doctor
+        condition_category: Category of an active condition of the patient
+        severity: Severity of that active condition
+    """
+    min_age: Optional[int] = Field(default=None, ge=0, le=MAX_AGE)
+    max_age: Optional[int] = Field(default=None, ge=0, le=MAX_AGE)
+    age_band: Optional[str] = None
+    gender: Optional[Gender] = None
+    doctor_id: Optional[UUID] = None
+    condition_category: Optional[ConditionCategory] = None
+    severity: Optional[Severity] = None
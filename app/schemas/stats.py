@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, Optional
+
+class PatientStats(BaseModel):
+    """
+    Schema for precomputed patient counts.
+
+    Attributes:
+        total: Number of active patients
+        by_doctor: Patient count per primary doctor id ("unassigned" if none)
+        by_age_band: Patient count per age band ("unknown" if the birth
+            date gives no age)
+        by_category: Patient count per condition category
+        by_category_severity: Patient count per condition category and severity
+        refreshed_at: When the counts were last recomputed
+    """
+    total: int = 0
+    by_doctor: Dict[str, int] = {}
+    by_age_band: Dict[str, int] = {}
+    by_category: Dict[str, int] = {}
+    by_category_severity: Dict[str, Dict[str, int]] = {}
+    refreshed_at: Optional[datetime] = None
\ No newline at end of file
@@ -0,0 +1,30 @@
+from pydantic import AwareDatetime, BaseModel, Field
+from typing import Optional
+from uuid import UUID
+
+class VitalSignsCreate(BaseModel):
+    """
+    Schema for recording a vital signs measurement.
+
+    The measuring user is the authenticated user.
+
+    Attributes:
+        patient_id: Patient measured
+        measured_at: When the measurement was taken, with its UTC offset
+        blood_pressure_systolic: Systolic pressure in mmHg
+        blood_pressure_diastolic: Diastolic pressure in mmHg
+        heart_rate: Beats per minute
+        respiratory_rate: Breaths per minute
+        temperature: Body temperature in degrees Celsius
+        oxygen_saturation: SpO2 percentage
+        notes: Free-text notes
+    """
+    patient_id: UUID
+    measured_at: AwareDatetime
+    blood_pressure_systolic: Optional[int] = Field(default=None, ge=0)
+    blood_pressure_diastolic: Optional[int] = Field(default=None, ge=0)
+    heart_rate: Optional[int] = Field(default=None, ge=0)
+    respiratory_rate: Optional[int] = Field(default=None, ge=0)
+    temperature: Optional[float] = None
+    oxygen_saturation: Optional[float] = Field(default=None, ge=0, le=100)
+    notes: Optional[str] = None
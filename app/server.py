@@ -0,0 +1,204 @@
+import argparse
+import importlib.util
+import os
+from typing import Any, Dict, List, Optional
+from app.core.config import get_settings
+
+class ServerConfig:
+    """Production server configuration."""
+    _settings = get_settings().server
+    APP: str = "app.main:app"
+    HOST: str = _settings.host
+    PORT: int = _settings.port
+    WORKERS: Optional[int] = _settings.workers
+    # Total connections all workers may hold, kept below Postgres max_connections
+    DB_CONNECTION_BUDGET: int = _settings.db_connection_budget
+    # Share of each worker's connections held open in the pool; the rest is overflow
+    POOL_CORE_RATIO: float = _settings.pool_core_ratio
+    KEEPALIVE_SECONDS: int = _settings.keepalive_seconds
+    GRACEFUL_TIMEOUT_SECONDS: int = _settings.graceful_timeout_seconds
+    BACKLOG: int = _settings.backlog
+    MAX_REQUESTS: int = _settings.max_requests
+    MAX_REQUESTS_JITTER: int = _settings.max_requests_jitter
+    # Connections each worker opens outside its pool: the scheduler's
+    # leader lock and the vitals feed's LISTEN connection
+    UNPOOLED_CONNECTIONS_PER_WORKER: int = 2
+
+def default_workers(budget: int) -> int:
+    """
+    One worker per CPU, as many as the connection budget can serve.
+
+    Args:
+        budget: Total connections available to the application
+
+    Returns:
+        int: Worker count giving every worker at least one pooled connection
+    """
+    servable = budget // (ServerConfig.UNPOOLED_CONNECTIONS_PER_WORKER + 1)
+    return max(1, min(os.cpu_count() or 1, servable))
+
+def pool_size_per_worker(budget: int, workers: int) -> Dict[str, int]:
+    """
+    Split the database connection budget across worker processes.
+
+    Each worker has its own engine and pool, so the pool size times the
+    worker count, overflow included, must stay within the budget. The
+    connections a worker may open outside its pool are reserved first.
+
+    Args:
+        budget: Total connections available to the application
+        workers: Number of worker processes
+
+    Returns:
+        Dict[str, int]: ``pool_size`` and ``max_overflow`` for each worker
+
+    Raises:
+        ValueError: If the budget does not give every worker a pooled
+            connection
+    """
+    per_worker = budget // workers - ServerConfig.UNPOOLED_CONNECTIONS_PER_WORKER
+    if per_worker < 1:
+        raise ValueError(
+            f"A budget of {budget} connections cannot serve {workers} workers"
+        )
+    pool_size = max(1, round(per_worker * ServerConfig.POOL_CORE_RATIO))
+    return {"pool_size": pool_size, "max_overflow": per_worker - pool_size}
+
+def _has_module(name: str) -> bool:
+    """Check whether an optional module is installed."""
+    return importlib.util.find_spec(name) is not None
+
+def event_loop() -> str:
+    """Use uvloop when installed, the standard asyncio loop otherwise."""
+    return "uvloop" if _has_module("uvloop") else "asyncio"
+
+def http_protocol() -> str:
+    """Use the httptools parser when installed, h11 otherwise."""
+    return "httptools" if _has_module("httptools") else "h11"
+
+def _worker_class() -> str:
+    """Uvicorn worker class for gunicorn, from ``uvicorn-worker`` if installed."""
+    if _has_module("uvicorn_worker"):
+        return "uvicorn_worker.UvicornWorker"
+    return "uvicorn.workers.UvicornWorker"
+
+def run_gunicorn(args: argparse.Namespace) -> None:
+    """
+    Serve with gunicorn managing uvicorn workers.
+
+    Gunicorn restarts crashed workers, recycles them after
+    ``MAX_REQUESTS`` and reloads gracefully on ``SIGHUP``. The
+    application is not preloaded in the master: each worker imports it,
+    so a reload picks up new code and no connection is shared by forked
+    processes.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class _Application(BaseApplication):
+        def load_config(self) -> None:
+            options = {
+                "bind": f"{args.host}:{args.port}",
+                "workers": args.workers,
+                "worker_class": _worker_class(),
+                "keepalive": ServerConfig.KEEPALIVE_SECONDS,
+                "graceful_timeout": ServerConfig.GRACEFUL_TIMEOUT_SECONDS,
+                "timeout": ServerConfig.GRACEFUL_TIMEOUT_SECONDS * 2,
+                "backlog": ServerConfig.BACKLOG,
+                "max_requests": ServerConfig.MAX_REQUESTS,
+                "max_requests_jitter": ServerConfig.MAX_REQUESTS_JITTER,
+                "accesslog": "-" if args.access_log else None,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self) -> Any:
+            from app.main import app
+
+            return app
+
+    _Application().run()
+
+def run_uvicorn(args: argparse.Namespace) -> None:
+    """
+    Serve with uvicorn's own process manager.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    import uvicorn
+
+    uvicorn.run(
+        ServerConfig.APP,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        backlog=ServerConfig.BACKLOG,
+        timeout_keep_alive=ServerConfig.KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=ServerConfig.GRACEFUL_TIMEOUT_SECONDS,
+        limit_max_requests=ServerConfig.MAX_REQUESTS,
+        access_log=args.access_log,
+        proxy_headers=True,
+    )
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the launcher's command line."""
+    parser = argparse.ArgumentParser(description="Run the Healthcare Data Platform API")
+    parser.add_argument("--host", default=ServerConfig.HOST)
+    parser.add_argument("--port", type=int, default=ServerConfig.PORT)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=ServerConfig.WORKERS,
+        help="Worker processes; one per CPU within the connection budget if omitted"
+    )
+    parser.add_argument(
+        "--db-connections",
+        type=int,
+        default=ServerConfig.DB_CONNECTION_BUDGET,
+        help="Total database connections shared by all workers"
+    )
+    parser.add_argument(
+        "--server",
+        choices=["auto", "gunicorn", "uvicorn"],
+        default="auto",
+        help="Process manager; gunicorn when installed if auto"
+    )
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args(argv)
+    if args.workers is None:
+        args.workers = default_workers(args.db_connections)
+    return args
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Start the API with one process per worker.
+
+    Settings are validated before any worker starts. The pool sizes
+    are exported as setting overrides before the application is
+    imported, so every worker's engine is sized from the shared budget.
+
+    Args:
+        argv: Command line arguments, ``sys.argv`` if None
+    """
+    args = parse_args(argv)
+    pool = pool_size_per_worker(args.db_connections, args.workers)
+    os.environ["DATABASE__POOL_SIZE"] = str(pool["pool_size"])
+    os.environ["DATABASE__MAX_OVERFLOW"] = str(pool["max_overflow"])
+    get_settings.cache_clear()
+    get_settings()
+
+    server = args.server
+    if server == "auto":
+        server = "gunicorn" if os.name == "posix" and _has_module("gunicorn") else "uvicorn"
+    if server == "gunicorn":
+        run_gunicorn(args)
+    else:
+        run_uvicorn(args)
+
+if __name__ == "__main__":
+    main()
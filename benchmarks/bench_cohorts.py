@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, List, Set
+from sqlalchemy import ColumnElement, delete, extract, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.bulk import LiteRows
+from app.db.cohorts import cohort_criteria
+from app.db.session import async_session, init_db
+from app.models.medical_condition import ConditionCategory, MedicalCondition, Severity
+from app.models.patient import Gender, Patient
+from app.models.user import User, UserRole
+from app.schemas.patient import PatientCohort
+
+ROUNDS = 5
+
+# Birth dates spread over 60 years; one condition for every other patient
+INSERT_PATIENTS = """
+INSERT INTO patients (id, created_at, updated_at, is_active, fiscal_code,
+                      first_name, last_name, date_of_birth, gender, version)
+SELECT gen_random_uuid(), now(), now(), true, 'BENCH' || n, 'First', 'Last',
+       current_date - 365 * 40 - (n::bigint * 7919 % (365 * 60))::int,
+       (ARRAY['male', 'female', 'other'])[n % 3 + 1], 1
+FROM generate_series(1, :rows) AS n
+"""
+
+INSERT_CONDITIONS = """
+INSERT INTO medicalcondition (id, created_at, updated_at, is_active, patient_id,
+                              category, name, diagnosis_date, severity, diagnosing_doctor_id)
+SELECT gen_random_uuid(), now(), now(), true, p.id,
+       (ARRAY['CARDIOVASCULAR', 'NEURODEGENERATIVE', 'FRAILTY'])[abs(hashtext(p.fiscal_code)) % 3 + 1]::conditioncategory,
+       'Bench condition', date '2020-01-01',
+       (ARRAY['FIT', 'MILDLY', 'MODERATELY', 'SEVERELY'])[abs(hashtext(p.last_name || p.fiscal_code)) % 4 + 1]::severity,
+       :doctor_id
+FROM patients p
+WHERE p.fiscal_code LIKE 'BENCH%' AND abs(hashtext(p.fiscal_code)) % 2 = 0
+"""
+
+BENCH_PATIENTS = Patient.fiscal_code.like("BENCH%")
+
+async def plan_nodes(db: AsyncSession, stmt: Any) -> Set[str]:
+    """Node types of the statement's plan, e.g. ``Index Scan``."""
+    compiled = stmt.compile(db.bind, compile_kwargs={"literal_binds": True})
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+    nodes: Set[str] = set()
+
+    def walk(node: dict) -> None:
+        nodes.add(node["Node Type"])
+        for child in node.get("Plans", ()):
+            walk(child)
+
+    plan = result.scalar()
+    walk((json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"])
+    return nodes
+
+async def measure(name: str, run: Callable[[], Awaitable[int]], nodes: Set[str]) -> None:
+    """Print the median time of a query strategy and its plan nodes."""
+    timings: List[float] = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        matched = await run()
+        timings.append(time.perf_counter() - start)
+    print(
+        f"{name:22} {matched:9d} rows {statistics.median(timings) * 1000:9.1f} ms  "
+        f"{', '.join(sorted(nodes))}"
+    )
+
+async def bench(rows: int) -> None:
+    """
+    Compare ways of selecting patients aged 85 and over among ``rows`` patients.
+
+    Synthetic patients are committed so the planner has statistics for
+    them, and deleted at the end; run against a development database.
+
+    Args:
+        rows: Number of synthetic patients
+    """
+    await init_db()
+    async with async_session("maintenance") as db:
+        doctor = User(
+            username="bench_cohorts",
+            email="bench_cohorts@example.com",
+            hashed_password="-",
+            full_name="Bench",
+            role=UserRole.DOCTOR
+        )
+        doctor_id = doctor.id
+        db.add(doctor)
+        await db.commit()
+        try:
+            await db.execute(text(INSERT_PATIENTS), {"rows": rows})
+            await db.execute(text(INSERT_CONDITIONS), {"doctor_id": doctor_id})
+            await db.commit()
+            await db.execute(text("ANALYZE patients"))
+            await db.execute(text("ANALYZE medicalcondition"))
+            await db.commit()
+            await run_cases(db, rows)
+        finally:
+            await db.rollback()
+            await db.execute(delete(MedicalCondition).where(
+                MedicalCondition.diagnosing_doctor_id == doctor_id
+            ))
+            await db.execute(delete(Patient).where(BENCH_PATIENTS))
+            await db.execute(delete(User).where(User.id == doctor_id))
+            await db.commit()
+
+async def run_cases(db: AsyncSession, rows: int) -> None:
+    """Time each strategy on the committed synthetic patients."""
+    today = datetime.now(timezone.utc).date()
+
+    def counting(*criteria: ColumnElement[bool]) -> Any:
+        return select(func.count()).select_from(Patient).where(BENCH_PATIENTS, *criteria)
+
+    async def in_python() -> int:
+        stmt = LiteRows.select(Patient, BENCH_PATIENTS, fields=("id", "date_of_birth"))
+        patients = await LiteRows.fetch(db, Patient, stmt)
+        return sum(
+            1 for patient in patients
+            if today.year - patient.date_of_birth.year - (
+                (today.month, today.day)
+                < (patient.date_of_birth.month, patient.date_of_birth.day)
+            ) >= 85
+        )
+
+    computed_age = counting(
+        extract("year", func.age(func.current_date(), Patient.date_of_birth)) >= 85
+    )
+    birth_range = counting(*cohort_criteria(PatientCohort(min_age=85), today))
+    combined = counting(*cohort_criteria(
+        PatientCohort(
+            age_band="85+",
+            gender=Gender.FEMALE,
+            condition_category=ConditionCategory.FRAILTY,
+            severity=Severity.SEVERELY
+        ),
+        today
+    ))
+
+    print(f"{rows} patients, median of {ROUNDS} runs")
+    await measure("age in Python", in_python, {"Seq Scan (all rows loaded)"})
+    await measure(
+        "age() in SQL", lambda: db.scalar(computed_age), await plan_nodes(db, computed_age)
+    )
+    await measure(
+        "birth date range", lambda: db.scalar(birth_range), await plan_nodes(db, birth_range)
+    )
+    await measure(
+        "range + gender + EXISTS", lambda: db.scalar(combined), await plan_nodes(db, combined)
+    )
+
+def main() -> None:
+    """Run the cohort filtering benchmark against the configured database."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    asyncio.run(bench(args.rows))
+
+if __name__ == "__main__":
+    main()
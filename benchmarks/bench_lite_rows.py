@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+from sqlalchemy import select, text
+from sqlalchemy.orm import raiseload
+from app.db.bulk import LiteRows
+from app.db.session import async_session, init_db
+from app.models.patient import Patient
+
+STREAM_BATCH_SIZE = 1000
+
+# Synthetic patients, inserted and rolled back in the benchmark's transaction
+INSERT_PATIENTS = """
+INSERT INTO patients (id, created_at, updated_at, is_active, fiscal_code,
+                      first_name, last_name, date_of_birth, gender, version)
+SELECT gen_random_uuid(), now(), now(), true, 'BENCH' || n,
+       'First' || (n % 1000), 'Last' || (n % 5000),
+       date '1930-01-01' + (n % 18000), (ARRAY['male', 'female', 'other'])[n % 3 + 1], 1
+FROM generate_series(1, :rows) AS n
+"""
+
+async def measure(
+    name: str,
+    rows: int,
+    load: Callable[[], Awaitable[Any]]
+) -> None:
+    """
+    Print the memory and time of one loading strategy.
+
+    Only allocations made while loading are traced. ``retained`` is what
+    the loaded result keeps alive, ``peak`` includes the driver's
+    buffered rows held while the result is built.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await load()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    loaded = result if isinstance(result, int) else len(result)
+    assert loaded == rows
+    del result
+    print(
+        f"{name:12} {retained / 2**20:9.1f} MiB retained {retained / rows:7.0f} B/row "
+        f"{peak / 2**20:9.1f} MiB peak {seconds:7.2f} s"
+    )
+
+async def bench(rows: int) -> None:
+    """
+    Compare loading ``rows`` patients as ORM instances, plain rows and lite rows.
+
+    The lite rows are also streamed in batches, as the export does,
+    keeping none of them.
+
+    Args:
+        rows: Number of synthetic patients
+    """
+    await init_db()
+    async with async_session("export") as db:
+        await db.execute(text(INSERT_PATIENTS), {"rows": rows})
+        bench_rows = Patient.fiscal_code.like("BENCH%")
+
+        async def orm() -> Any:
+            result = await db.execute(
+                select(Patient).where(bench_rows).options(raiseload(Patient.primary_doctor))
+            )
+            patients = result.scalars().all()
+            db.expunge_all()
+            return patients
+
+        async def plain_rows() -> Any:
+            result = await db.execute(LiteRows.select(Patient, bench_rows))
+            return result.all()
+
+        async def lite_rows() -> Any:
+            return await LiteRows.fetch(db, Patient, LiteRows.select(Patient, bench_rows))
+
+        async def lite_stream() -> int:
+            count = 0
+            stmt = LiteRows.select(Patient, bench_rows)
+            async for batch in LiteRows.stream(db, Patient, stmt, STREAM_BATCH_SIZE):
+                count += len(batch)
+            return count
+
+        print(f"{rows} patients")
+        await measure("orm", rows, orm)
+        await measure("row", rows, plain_rows)
+        await measure("lite", rows, lite_rows)
+        await measure("lite stream", rows, lite_stream)
+        await db.rollback()
+
+def main() -> None:
+    """Run the bulk read memory benchmark against the configured database."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    asyncio.run(bench(args.rows))
+
+if __name__ == "__main__":
+    main()
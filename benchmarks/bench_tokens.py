@@ -0,0 +1,64 @@
+import timeit
+from datetime import timedelta
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+from app.core.tokens import SigningKey, TokenService
+
+ROUNDS = 2000
+
+def _pem(private_key) -> str:
+    """Serialize a private key to unencrypted PKCS8 PEM."""
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+
+def _pem_public(key: SigningKey) -> str:
+    """Derive the PEM public key for an asymmetric signing key."""
+    private_key = serialization.load_pem_private_key(key.private_key.encode(), None)
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+def bench(name: str, key: SigningKey) -> None:
+    """
+    Print the per-request verification cost for one key type.
+
+    Compares decoding with the raw key material (the previous code path),
+    the cached parsed key, and a memoized verified token.
+    """
+    service = TokenService(keys=[key], cache_size=0)
+    token = service.issue({"sub": "bench", "scopes": ["doctor"]}, timedelta(minutes=30))
+    raw_key = key.private_key if key.algorithm.startswith("HS") else _pem_public(key)
+
+    cases = {
+        "raw key": lambda: jwt.decode(token, raw_key, algorithms=[key.algorithm]),
+        "cached key": lambda: service.verify(token),
+    }
+    memoized = TokenService(keys=[key])
+    memoized.verify(token)
+    cases["memoized token"] = lambda: memoized.verify(token)
+
+    for case, func in cases.items():
+        seconds = timeit.timeit(func, number=ROUNDS)
+        print(f"{name:6} {case:15} {seconds / ROUNDS * 1e6:10.1f} us/verify")
+
+def main() -> None:
+    """Run the token verification microbenchmarks."""
+    bench("HS256", SigningKey(kid="hs", algorithm="HS256", private_key="bench-secret"))
+    bench("RS256", SigningKey(
+        kid="rs",
+        algorithm="RS256",
+        private_key=_pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    ))
+    bench("ES256", SigningKey(
+        kid="es",
+        algorithm="ES256",
+        private_key=_pem(ec.generate_private_key(ec.SECP256R1()))
+    ))
+
+if __name__ == "__main__":
+    main()
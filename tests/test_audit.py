@@ -0,0 +1,92 @@
+from datetime import date, datetime, timezone
+from uuid import uuid4
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.audit import AuditLog, AuditStore
+from app.core.security import SecurityConfig
+from app.db.partitions import AuditPartitions
+from app.db.session import engine
+from app.main import app
+from app.models.audit import AuditRecord
+from app.models.patient import Patient
+from app.models.user import User
+
+@pytest.mark.asyncio
+async def test_resource_history(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test that logged actions are found per resource and per user"""
+    audit = AuditLog(db_session)
+    await audit.log_action(
+        user_id=test_user.id,
+        action="READ",
+        resource_type="Patient",
+        resource_id=test_patient.id
+    )
+
+    store = AuditStore(db_session)
+    history = await store.resource_history("Patient", test_patient.id)
+    activity = await store.user_activity(test_user.id)
+
+    assert [entry.user_id for entry in history] == [test_user.id]
+    assert [entry.action for entry in activity] == ["READ"]
+
+    await audit.log_action(
+        user_id=test_user.id,
+        action="READ",
+        resource_type="Patient",
+        resource_ids=[uuid4(), test_patient.id]
+    )
+    await audit.log_action(
+        user_id=test_user.id,
+        action="UPDATE",
+        resource_type="Patient",
+        resource_id=test_patient.id
+    )
+    history = await store.resource_history("Patient", test_patient.id)
+    assert [entry.action for entry in history] == ["UPDATE", "READ", "READ"]
+    assert history[1].resource_ids is not None
+    latest = await store.resource_history("Patient", test_patient.id, limit=2)
+    assert [entry.action for entry in latest] == ["UPDATE", "READ"]
+    assert latest[1].resource_ids is not None
+
+@pytest.mark.asyncio
+async def test_paging_keeps_entries_with_equal_timestamps(db_session: AsyncSession, test_user: User):
+    """Test that the (timestamp, id) cursor pages through entries logged at the same instant"""
+    timestamp = datetime.now(timezone.utc)
+    db_session.add_all([
+        AuditRecord(user_id=test_user.id, action="READ", resource_type="Patient", timestamp=timestamp)
+        for _ in range(5)
+    ])
+    await db_session.commit()
+
+    store = AuditStore(db_session)
+    seen = []
+    page = await store.user_activity(test_user.id, limit=2)
+    while page:
+        seen.extend(entry.id for entry in page)
+        page = await store.user_activity(
+            test_user.id, before=page[-1].timestamp, before_id=page[-1].id, limit=2
+        )
+    assert len(seen) == len(set(seen)) == 5
+
+    token = SecurityConfig.create_access_token(data={"sub": test_user.username, "scopes": ["admin"]})
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(
+            f"/audit/users/{test_user.id}",
+            params={"limit": 0},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    assert response.status_code == 422
+
+@pytest.mark.asyncio
+async def test_partition_retention():
+    """Test partition creation ahead and detach-based retention"""
+    async with engine.begin() as conn:
+        created = await AuditPartitions.ensure(conn, months_ahead=1, today=date(2020, 1, 15))
+        assert created == ["audit_log_y2020m01", "audit_log_y2020m02"]
+
+        removed = await AuditPartitions.apply_retention(
+            conn, retention_months=1, today=date(2020, 3, 10)
+        )
+        assert removed == ["audit_log_y2020m01"]
+        assert "audit_log_y2020m02" in await AuditPartitions.attached(conn)
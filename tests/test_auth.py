@@ -1,8 +1,11 @@
+from datetime import datetime, timezone
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy import select
 from app.core.security import SecurityConfig
+from app.db.query_control import slow_query_log
+from app.models.revoked_token import RevokedToken
 from app.models.user import User, UserRole
 from app.main import app
 
@@ -43,7 +46,7 @@ async def test_user_authentication(db_session: AsyncSession):
     db_session.add(user)
     await db_session.commit()
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         response = await ac.post("/auth/token", 
             data={
                 "username": "testdoctor",
@@ -53,4 +56,66 @@ async def test_user_authentication(db_session: AsyncSession):
         )
         assert response.status_code == 200
         assert "access_token" in response.json()
-        assert response.json()["token_type"] == "bearer"
\ No newline at end of file
+        assert response.json()["token_type"] == "bearer"
+
+@pytest.mark.asyncio
+async def test_refresh_token_rotation(
+    db_session: AsyncSession,
+    test_user: User,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test refresh token grant, rotation and reuse detection"""
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.post("/auth/token",
+            data={
+                "username": "testdoctor",
+                "password": "testpass123",
+                "grant_type": "password"
+            }
+        )
+        assert response.status_code == 200
+        first_refresh = response.json()["refresh_token"]
+
+        slow_query_log.clear()
+        response = await ac.post("/auth/refresh", data={"refresh_token": first_refresh})
+        assert response.status_code == 200
+        assert not any("FROM patients" in entry.statement for entry in slow_query_log.entries())
+        second_refresh = response.json()["refresh_token"]
+        assert second_refresh != first_refresh
+        assert "access_token" in response.json()
+
+        response = await ac.post("/auth/refresh", data={"refresh_token": first_refresh})
+        assert response.status_code == 401
+
+        response = await ac.post("/auth/refresh", data={"refresh_token": second_refresh})
+        assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_revocation_applies_to_every_worker(db_session: AsyncSession, test_user: User):
+    """Test that tokens revoked by another worker, or by logout, are rejected"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        token = SecurityConfig.create_access_token(
+            data={"sub": test_user.username, "scopes": ["doctor"]}
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        assert (await ac.get("/patients/", headers=headers)).status_code == 200
+
+        # Revoked by another worker: only the database knows about it
+        claims = SecurityConfig.token_service.verify(token)
+        db_session.add(RevokedToken(
+            jti=claims["jti"],
+            expires_at=datetime.fromtimestamp(claims["exp"], timezone.utc)
+        ))
+        await db_session.commit()
+        assert (await ac.get("/patients/", headers=headers)).status_code == 401
+
+        token = SecurityConfig.create_access_token(
+            data={"sub": test_user.username, "scopes": ["doctor"]}
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        assert (await ac.post("/auth/logout", headers=headers)).status_code == 204
+        assert (await ac.get("/patients/", headers=headers)).status_code == 401
+
+    result = await db_session.execute(select(RevokedToken.jti))
+    assert len(result.all()) == 2
\ No newline at end of file
@@ -0,0 +1,123 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.endpoints.research import _export_records
+from app.core.security import SecurityConfig
+from app.db.cohorts import birth_date_range, cohort_criteria
+from app.main import app
+from app.models.medical_condition import ConditionCategory, MedicalCondition, Severity
+from app.models.patient import Gender, Patient
+from app.models.user import User
+from app.schemas.patient import PatientCohort
+
+def _age(born: date, today: date) -> int:
+    """Whole years between two dates, as ``Patient.age`` computes them."""
+    return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+
+def test_birth_date_range_matches_ages():
+    """Test that the birth date bounds select exactly the ages in range, leap days included"""
+    for today in (date(2024, 2, 29), date(2025, 2, 28), date(2025, 3, 1), date(2024, 12, 31)):
+        earliest, latest = birth_date_range(85, 89, today)
+        born = date(1930, 1, 1)
+        while born < date(1945, 1, 1):
+            assert (earliest <= born <= latest) == (85 <= _age(born, today) <= 89), (today, born)
+            born += timedelta(days=1)
+
+    assert birth_date_range(None, None, date(2024, 5, 1)) == (None, None)
+    assert birth_date_range(85, None, date(2024, 5, 1)) == (None, date(1939, 5, 1))
+
+@pytest.mark.asyncio
+async def test_cohort_filters(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test combined age band, gender and condition filters on the list and the export"""
+    today = datetime.now(timezone.utc).date()
+    elderly = Patient(
+        fiscal_code="ELDER12345",
+        first_name="Ada",
+        last_name="Old",
+        date_of_birth=date(today.year - 88, 1, 1),
+        gender=Gender.FEMALE,
+        primary_doctor_id=test_user.id
+    )
+    younger = Patient(
+        fiscal_code="YOUNG12345",
+        first_name="Bea",
+        last_name="Young",
+        date_of_birth=date(today.year - 70, 1, 1),
+        gender=Gender.FEMALE,
+        primary_doctor_id=test_user.id
+    )
+    db_session.add_all([elderly, younger])
+    await db_session.commit()
+    for patient, severity in ((elderly, Severity.SEVERELY), (younger, Severity.SEVERELY), (elderly, Severity.MILDLY)):
+        db_session.add(MedicalCondition(
+            patient_id=patient.id,
+            category=ConditionCategory.FRAILTY,
+            name="Sarcopenia",
+            diagnosis_date=date(2020, 5, 1),
+            severity=severity,
+            diagnosing_doctor_id=test_user.id
+        ))
+    await db_session.commit()
+
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": ["doctor"]}
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        async def fiscal_codes(**params) -> list:
+            response = await ac.get("/patients/", params=params, headers=headers)
+            assert response.status_code == 200
+            return sorted(patient["fiscal_code"] for patient in response.json())
+
+        assert await fiscal_codes(age_band="85+") == ["ELDER12345"]
+        assert await fiscal_codes(min_age=65, gender="female") == ["ELDER12345", "YOUNG12345"]
+        assert await fiscal_codes(condition_category="frailty", severity="severely") == [
+            "ELDER12345", "YOUNG12345"
+        ]
+        assert await fiscal_codes(age_band="65-74", severity="mildly") == []
+        assert await fiscal_codes(max_age=80, gender="female") == ["YOUNG12345"]
+
+        filtered = await ac.get("/patients/", params={"age_band": "85+"}, headers=headers)
+        unfiltered = await ac.get("/patients/", headers=headers)
+        assert filtered.headers["etag"] != unfiltered.headers["etag"]
+
+        invalid = await ac.get("/patients/", params={"min_age": 90, "max_age": 80}, headers=headers)
+        assert invalid.status_code == 422
+        unknown_band = await ac.get("/patients/", params={"age_band": "100+"}, headers=headers)
+        assert unknown_band.status_code == 422
+        for params in ({"max_age": 5000}, {"min_age": 3000}):
+            out_of_range = await ac.get("/patients/", params=params, headers=headers)
+            assert out_of_range.status_code == 422
+
+    criteria = cohort_criteria(PatientCohort(min_age=85, max_age=89, gender=Gender.FEMALE))
+    chunks = [chunk async for chunk in _export_records(k=1, batch_size=10, criteria=criteria)]
+    records = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert len(records) == 1
+    assert records[0]["gender"] == "female"
+    assert len(records[0]["conditions"]) == 2
+
+@pytest.mark.asyncio
+async def test_export_cohort_matches_released_classes(test_user: User):
+    """Test that exports are only restricted by released age bands and gender"""
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": ["researcher"]}
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        allowed = await ac.get(
+            "/research/export", params={"age_band": "85-89", "gender": "female"}, headers=headers
+        )
+        assert allowed.status_code == 200
+        top_coded = await ac.get("/research/export", params={"age_band": "90+"}, headers=headers)
+        assert top_coded.status_code == 200
+
+        for params in (
+            {"doctor_id": str(test_user.id)},
+            {"min_age": 87},
+            {"age_band": "85-89", "severity": "severely"},
+            {"age_band": "85+"},
+        ):
+            response = await ac.get("/research/export", params=params, headers=headers)
+            assert response.status_code == 422, params
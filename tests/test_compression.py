@@ -0,0 +1,11 @@
+from app.core import compression
+from app.core.compression import negotiate_encoding
+
+def test_negotiate_encoding():
+    """Test Accept-Encoding negotiation and q-values"""
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("br;q=0, gzip") == "gzip"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    if compression.brotli is not None:
+        assert negotiate_encoding("gzip, br") == "br"
\ No newline at end of file
@@ -0,0 +1,44 @@
+import pytest
+from pydantic import ValidationError
+from app.core.config import Settings, get_settings
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    """Reload settings around each test so overrides do not leak"""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+def test_settings_are_cached():
+    """Test that settings are loaded once per process"""
+    assert get_settings() is get_settings()
+
+def test_environment_overrides(monkeypatch: pytest.MonkeyPatch):
+    """Test nested environment overrides, including structured values"""
+    monkeypatch.setenv("DATABASE__POOL_SIZE", "20")
+    monkeypatch.setenv("SECURITY__BCRYPT_ROUNDS", "10")
+    monkeypatch.setenv("LOGGING__LEVEL", "debug")
+    monkeypatch.setenv("RATE_LIMIT__SCOPE_LIMITS", '{"admin": [100, 200]}')
+
+    settings = get_settings()
+    assert settings.database.pool_size == 20
+    assert settings.rate_limit.max_concurrent_requests == 20
+    assert settings.security.bcrypt_rounds == 10
+    assert settings.logging.level == "DEBUG"
+    assert settings.rate_limit.scope_limits["admin"] == (100.0, 200)
+    assert settings.rate_limit.scope_limits["anonymous"] == (5.0, 20)
+    assert settings.database.password.get_secret_value() == "password"
+    assert "password='password'" not in repr(settings.database)
+
+@pytest.mark.parametrize("name, value", [
+    ("SECURITY__BCRYPT_ROUNDS", "3"),
+    ("DATABASE__POOL_SIZE", "0"),
+    ("COMPRESSION__GZIP_LEVEL", "10"),
+    ("LOGGING__LEVEL", "LOUD"),
+    ("RATE_LIMIT__MAX_CONCURRENT_REQUESTS", "1000"),
+])
+def test_invalid_values_are_rejected(monkeypatch: pytest.MonkeyPatch, name: str, value: str):
+    """Test that invalid values fail at startup instead of at first use"""
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValidationError):
+        Settings()
@@ -0,0 +1,35 @@
+import dataclasses
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.bulk import LiteRows
+from app.models.lite import lite_row_class
+from app.models.patient import Patient
+
+@pytest.mark.asyncio
+async def test_lite_rows_bypass_the_session(db_session: AsyncSession, test_patient: Patient):
+    """Test that lite rows are compact, read-only and never tracked"""
+    db_session.expunge_all()
+    rows = await LiteRows.fetch(db_session, Patient, LiteRows.select(Patient))
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert type(row).__name__ == "PatientRow"
+    assert not hasattr(row, "__dict__")
+    assert row.id == test_patient.id and row.fiscal_code == "TEST123456"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        row.first_name = "Jane"
+    assert len(db_session.identity_map) == 0
+
+    stmt = LiteRows.select(
+        Patient,
+        Patient.gender == "male",
+        fields=("id", "date_of_birth")
+    )
+    batches = [batch async for batch in LiteRows.stream(db_session, Patient, stmt, batch_size=10)]
+    assert [[(row.id, row.date_of_birth) for row in batch] for batch in batches] == [
+        [(test_patient.id, test_patient.date_of_birth)]
+    ]
+    assert lite_row_class(Patient, ("id", "date_of_birth")).__slots__ == ("id", "date_of_birth")
+
+    with pytest.raises(ValueError):
+        LiteRows.select(Patient, fields=("id", "primary_doctor"))
@@ -0,0 +1,110 @@
+from typing import Any, Dict, List, Optional
+import pytest
+import httpx
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import select
+from app.core.outbox import OutboxDispatcher, OutboxSink, QueueSink, WebhookSink
+from app.db.session import async_session
+from app.models.outbox import OutboxEvent, OutboxOffset
+from app.models.patient import Patient
+
+@pytest.mark.asyncio
+async def test_patient_write_appends_event(db_session: AsyncSession, test_patient: Patient):
+    """Test that creating a patient appends an outbox event in the same commit"""
+    result = await db_session.execute(select(OutboxEvent))
+    events = result.scalars().all()
+
+    assert len(events) == 1
+    assert events[0].aggregate_type == "Patient"
+    assert events[0].event_type == "created"
+    assert events[0].patient_id == test_patient.id
+    assert events[0].payload["fiscal_code"] == "TEST123456"
+
+@pytest.mark.asyncio
+async def test_dispatcher_delivers_and_resumes(db_session: AsyncSession, test_patient: Patient):
+    """Test batch delivery to a queue sink and a stubbed webhook with stored offsets"""
+    received = []
+
+    def webhook_stub(request: httpx.Request) -> httpx.Response:
+        received.extend(httpx.Response(200, content=request.content).json()["events"])
+        return httpx.Response(204)
+
+    queue_sink = QueueSink()
+    dispatcher = OutboxDispatcher(
+        async_session,
+        {
+            "queue": queue_sink,
+            "webhook": WebhookSink("http://stub/events", transport=httpx.MockTransport(webhook_stub)),
+        }
+    )
+
+    assert await dispatcher.dispatch_once("queue") == 1
+    assert await dispatcher.dispatch_once("webhook") == 1
+    assert await dispatcher.dispatch_once("queue") == 0
+
+    event = queue_sink.queue.get_nowait()
+    assert event["patient_id"] == str(test_patient.id)
+    assert received[0]["id"] == event["id"]
+
+    offset = await db_session.get(OutboxOffset, "queue")
+    assert offset.last_event_id == event["id"]
+    await dispatcher.stop()
+
+@pytest.mark.asyncio
+async def test_dispatcher_delivers_late_lower_ids(db_session: AsyncSession, test_patient: Patient):
+    """Test that an event committed after a delivered one with a higher id is not skipped"""
+    def updated(event_id: int) -> OutboxEvent:
+        return OutboxEvent(
+            id=event_id,
+            aggregate_type="Patient",
+            aggregate_id=test_patient.id,
+            patient_id=test_patient.id,
+            event_type="updated"
+        )
+
+    queue_sink = QueueSink()
+    dispatcher = OutboxDispatcher(async_session, {"queue": queue_sink})
+
+    db_session.add(updated(1_000_001))
+    await db_session.commit()
+    assert await dispatcher.dispatch_once("queue") == 2
+    # A later transaction commits an id drawn before the delivered one
+    db_session.add(updated(1_000_000))
+    await db_session.commit()
+    assert await dispatcher.dispatch_once("queue") == 1
+
+    ids = [queue_sink.queue.get_nowait()["id"] for _ in range(3)]
+    assert ids[1:] == [1_000_001, 1_000_000]
+
+class _ProbingSink(OutboxSink):
+    """Sink that dispatches again while delivering, then optionally fails."""
+
+    def __init__(self) -> None:
+        self.dispatcher: Optional[OutboxDispatcher] = None
+        self.fail = True
+        self.concurrent: List[int] = []
+        self.batches: List[List[Dict[str, Any]]] = []
+
+    async def send(self, events: List[Dict[str, Any]]) -> None:
+        self.concurrent.append(await self.dispatcher.dispatch_once("probe"))
+        self.batches.append(events)
+        if self.fail:
+            raise ConnectionError("sink unavailable")
+
+@pytest.mark.asyncio
+async def test_dispatcher_leases_batches(db_session: AsyncSession, test_patient: Patient):
+    """Test that a batch being delivered is leased, and released when delivery fails"""
+    sink = _ProbingSink()
+    dispatcher = OutboxDispatcher(async_session, {"probe": sink})
+    sink.dispatcher = dispatcher
+
+    with pytest.raises(ConnectionError):
+        await dispatcher.dispatch_once("probe")
+    offset = await db_session.get(OutboxOffset, "probe")
+    assert offset.last_event_id == 0
+    assert offset.leased_until is None
+
+    sink.fail = False
+    assert await dispatcher.dispatch_once("probe") == 1
+    assert sink.concurrent == [0, 0]
+    assert sink.batches[0] == sink.batches[1]
\ No newline at end of file
@@ -1,8 +1,13 @@
 from datetime import date, datetime, timezone
+from uuid import uuid4
 import pytest
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
+from app.core.audit import AuditStore
+from app.core.security import SecurityConfig
+from app.db.query_control import slow_query_log
+from app.models.outbox import OutboxEvent
 from app.models.patient import Patient, Gender
 from app.models.user import User
 from app.main import app
@@ -40,4 +45,125 @@ async def test_get_patient(db_session: AsyncSession, test_user: User, test_patie
     assert db_patient is not None
     assert db_patient.first_name == "John"
     assert db_patient.last_name == "Doe"
-    assert db_patient.primary_doctor_id == test_user.id
\ No newline at end of file
+    assert db_patient.primary_doctor_id == test_user.id
+
+@pytest.mark.asyncio
+async def test_get_patient_conditional(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test ETag validators and 304 responses on patient reads"""
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": [test_user.role.value]}
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(f"/patients/{test_patient.id}", headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+
+        response = await ac.get(
+            f"/patients/{test_patient.id}",
+            headers={**headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = await ac.get("/patients/", headers=headers)
+        assert response.status_code == 200
+        list_etag = response.headers["etag"]
+
+        response = await ac.get("/patients/", headers={**headers, "If-None-Match": list_etag})
+        assert response.status_code == 304
+
+@pytest.mark.asyncio
+async def test_batch_read_patients(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test batch retrieval reports missing ids and writes one audit record"""
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": [test_user.role.value]}
+    )
+    unknown_id = uuid4()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.post(
+            "/patients/batch",
+            json={"ids": [str(test_patient.id), str(unknown_id)]},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [patient["id"] for patient in body["patients"]] == [str(test_patient.id)]
+    assert body["missing"] == [str(unknown_id)]
+
+    history = await AuditStore(db_session).resource_history("Patient", test_patient.id)
+    assert len(history) == 1
+    assert history[0].resource_ids == [test_patient.id]
+
+@pytest.mark.asyncio
+async def test_update_patient_optimistic_concurrency(
+    db_session: AsyncSession,
+    test_user: User,
+    test_patient: Patient,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """Test partial updates with version checks in a single UPDATE"""
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": [test_user.role.value]}
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        slow_query_log.clear()
+        response = await ac.patch(
+            f"/patients/{test_patient.id}",
+            json={"version": 1, "first_name": "Jonathan"},
+            headers=headers
+        )
+        statements = [entry.statement for entry in slow_query_log.entries()]
+        assert response.status_code == 200
+        body = response.json()
+        assert (body["first_name"], body["last_name"], body["version"]) == ("Jonathan", "Doe", 2)
+        assert datetime.fromisoformat(body["updated_at"]) > test_patient.updated_at
+        assert response.headers["etag"].startswith('W/"')
+        assert sum("FROM patients" in sql or "UPDATE patients" in sql for sql in statements) == 1
+
+        stale = await ac.patch(
+            f"/patients/{test_patient.id}",
+            json={"version": 1, "last_name": "Roe"},
+            headers=headers
+        )
+        assert stale.status_code == 409
+
+        missing = await ac.patch(f"/patients/{uuid4()}", json={"version": 1, "last_name": "Roe"}, headers=headers)
+        assert missing.status_code == 404
+
+        invalid = await ac.patch(
+            f"/patients/{test_patient.id}",
+            json={"version": 2, "first_name": None},
+            headers=headers
+        )
+        assert invalid.status_code == 422
+
+    result = await db_session.execute(
+        select(Patient.first_name, Patient.last_name, Patient.version)
+        .where(Patient.id == test_patient.id)
+    )
+    assert result.one() == ("Jonathan", "Doe", 2)
+
+    result = await db_session.execute(
+        select(OutboxEvent.event_type).where(OutboxEvent.patient_id == test_patient.id)
+    )
+    assert result.scalars().all() == ["created", "updated"]
+
+@pytest.mark.asyncio
+async def test_updated_at_set_outside_the_orm(db_session: AsyncSession, test_patient: Patient):
+    """Test that UPDATEs bypassing the ORM still advance updated_at"""
+    await db_session.execute(
+        text("UPDATE patients SET first_name = 'Jonathan' WHERE id = :id"),
+        {"id": test_patient.id}
+    )
+    updated_at = await db_session.scalar(
+        select(Patient.updated_at).where(Patient.id == test_patient.id)
+    )
+    assert updated_at > test_patient.updated_at
@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import select
+from app.api.deps import cancel_on_disconnect
+from app.core.security import SecurityConfig
+from app.db.query_control import QueryConfig, slow_query_log
+from app.db.session import async_session
+from app.main import app
+from app.models.patient import Patient
+from app.models.user import User
+
+@pytest.mark.asyncio
+async def test_timeouts_follow_query_class():
+    """Test that each query class gets its limits in every transaction"""
+    async with async_session() as db:
+        assert (await db.execute(text("SHOW statement_timeout"))).scalar() == "5s"
+        await db.commit()
+        assert (await db.execute(text("SHOW lock_timeout"))).scalar() == "1s"
+
+    async with async_session("export") as db:
+        assert (await db.execute(text("SHOW statement_timeout"))).scalar() == "10min"
+
+    with pytest.raises(ValueError):
+        async_session("unknown")
+
+@pytest.mark.asyncio
+async def test_statement_timeout_is_captured(monkeypatch: pytest.MonkeyPatch):
+    """Test that a statement over its timeout is cancelled and logged"""
+    monkeypatch.setitem(QueryConfig.STATEMENT_TIMEOUT_MS, "interactive", 100)
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 50)
+    slow_query_log.clear()
+
+    async with async_session() as db:
+        with pytest.raises(DBAPIError):
+            await db.execute(text("SELECT pg_sleep(2)"))
+
+    entry = slow_query_log.entries()[0]
+    assert entry.statement == "SELECT pg_sleep(2)"
+    assert entry.error == "QueryCanceledError"
+    assert entry.duration_ms < 2000
+
+@pytest.mark.asyncio
+async def test_slow_query_endpoint(test_user: User, test_patient: Patient, monkeypatch: pytest.MonkeyPatch):
+    """Test that captured statements are listed with redacted values and a plan"""
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0)
+    slow_query_log.clear()
+    async with async_session() as db:
+        await db.execute(select(Patient).where(Patient.fiscal_code == "TEST123456"))
+
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": ["admin"]}
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get(
+            "/monitoring/slow-queries",
+            params={"explain": True},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == 200
+    entry = next(e for e in response.json() if "patients.fiscal_code = $1" in e["statement"])
+    assert entry["parameters"] == ["<str>"]
+    assert "TEST123456" not in response.text
+    assert any("patients" in line for line in entry["plan"])
+
+@pytest.mark.asyncio
+async def test_disconnect_cancels_query():
+    """Test that a client disconnect cancels the handler and its statement"""
+    probe = FastAPI(dependencies=[Depends(cancel_on_disconnect, scope="function")])
+    cancelled = asyncio.Event()
+
+    @probe.get("/sleep")
+    async def sleep() -> None:
+        async with async_session() as db:
+            try:
+                await db.execute(text("SELECT pg_sleep(4)"))
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(0.3)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/sleep", "headers": [],
+        "query_string": b"", "http_version": "1.1", "scheme": "http",
+        "server": ("test", 80), "client": ("test", 1234), "root_path": "",
+    }
+    await asyncio.wait_for(probe(scope, receive, send), timeout=3)
+
+    assert cancelled.is_set()
+    assert sent[0]["status"] == 499
+    async with async_session() as db:
+        running = await db.execute(text(
+            "SELECT count(*) FROM pg_stat_activity "
+            "WHERE query = 'SELECT pg_sleep(4)' AND state = 'active'"
+        ))
+        assert running.scalar() == 0
@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from httpx import ASGITransport, AsyncClient
+from app.core.config import Settings
+from app.core.rate_limit import (
+    ConcurrencyLimitMiddleware, InMemoryRateLimitBackend, RateLimitConfig, route_key
+)
+from app.main import app
+
+class FakeClock:
+    """Manually advanced clock."""
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_and_refill():
+    """Test that a bucket allows its burst, rejects, then refills"""
+    clock = FakeClock()
+    backend = InMemoryRateLimitBackend(clock=clock)
+    limit = (1.0, 2)
+
+    assert (await backend.consume("doctor:testdoctor:GET /patients/", limit))[0]
+    assert (await backend.consume("doctor:testdoctor:GET /patients/", limit))[0]
+    allowed, retry_after = await backend.consume("doctor:testdoctor:GET /patients/", limit)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    assert (await backend.consume("nurse:testnurse:GET /patients/", limit))[0]
+
+    clock.now += 1.0
+    assert (await backend.consume("doctor:testdoctor:GET /patients/", limit))[0]
+
+@pytest.mark.asyncio
+async def test_bucket_eviction_is_bounded():
+    """Test that the least recently used buckets are evicted"""
+    backend = InMemoryRateLimitBackend(max_buckets=2, clock=FakeClock())
+
+    for key in ("a", "b", "c"):
+        await backend.consume(key, (1.0, 1))
+
+    assert list(backend._buckets) == ["b", "c"]
+
+
+def test_route_key_groups_ids():
+    """Test that requests to the same route share a bucket"""
+    assert route_key("GET", "/patients/3fa85f64-5717-4562-b3fc-2c963f66afa6") == "GET /patients/{id}"
+    assert route_key("GET", "/patients/") == "GET /patients/"
+
+@pytest.mark.asyncio
+async def test_event_streams_release_their_slot():
+    """Test that an open event stream does not hold a concurrency slot"""
+    started, finish = asyncio.Event(), asyncio.Event()
+
+    async def stream_app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/event-stream")],
+        })
+        started.set()
+        await finish.wait()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def send(message):
+        pass
+
+    middleware = ConcurrencyLimitMiddleware(stream_app, max_concurrent=1, queue_timeout=0.1)
+    request = asyncio.create_task(middleware({"type": "http"}, None, send))
+    await started.wait()
+    assert not middleware.semaphore.locked()
+
+    finish.set()
+    await request
+    assert not middleware.semaphore.locked()
+    await middleware.semaphore.acquire()
+    assert middleware.semaphore.locked()
+
+@pytest.mark.asyncio
+async def test_partial_scope_limits_override(monkeypatch: pytest.MonkeyPatch):
+    """Test that overriding one scope's limits keeps the other scopes limited"""
+    monkeypatch.setenv("RATE_LIMIT__SCOPE_LIMITS", '{"admin": [100, 200]}')
+    monkeypatch.setattr(RateLimitConfig, "ENABLED", True)
+    monkeypatch.setattr(RateLimitConfig, "SCOPE_LIMITS", Settings().rate_limit.scope_limits)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/auth/jwks.json")
+    assert response.status_code == 200
@@ -0,0 +1,62 @@
+from datetime import date
+from uuid import uuid4
+import json
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.api.endpoints.research import _export_records
+from app.core.anonymization import Pseudonymizer, age_band_bounds, age_band_label
+from app.models.patient import Patient
+
+def test_pseudonyms_are_stable_and_keyed():
+    """Test that pseudonyms are deterministic per key"""
+    patient_id = uuid4()
+
+    assert Pseudonymizer("key-a").pseudonym(patient_id) == Pseudonymizer("key-a").pseudonym(patient_id)
+    assert Pseudonymizer("key-a").pseudonym(patient_id) != Pseudonymizer("key-b").pseudonym(patient_id)
+    assert Pseudonymizer("key-a").pseudonym(patient_id) != str(patient_id)
+
+def test_age_band_labels():
+    """Test age band formatting and top-coding"""
+    assert age_band_label(75) == "75-79"
+    assert age_band_label(90) == "90+"
+
+def test_age_band_bounds():
+    """Test that export age band labels map back to the ages they cover"""
+    assert age_band_bounds("75-79") == (75, 79)
+    assert age_band_bounds("0-4") == (0, 4)
+    assert age_band_bounds("90+") == (90, None)
+    for label in ("85+", "75-84", "76-80", "95+"):
+        with pytest.raises(ValueError):
+            age_band_bounds(label)
+
+@pytest.mark.asyncio
+async def test_export_pseudonymizes_and_suppresses(db_session: AsyncSession, test_patient: Patient):
+    """Test that exported records carry no direct identifiers and small classes are dropped"""
+    chunks = [chunk async for chunk in _export_records(k=1, batch_size=10, criteria=[])]
+    records = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    assert len(records) == 1
+    assert records[0]["pseudonym"] == Pseudonymizer().pseudonym(test_patient.id)
+    assert "TEST123456" not in chunks[0]
+    assert "John" not in chunks[0]
+
+    suppressed = [chunk async for chunk in _export_records(k=2, batch_size=10, criteria=[])]
+    assert suppressed == []
+
+@pytest.mark.asyncio
+async def test_export_skips_future_birth_dates(db_session: AsyncSession, test_patient: Patient):
+    """Test that a birth date in the future does not produce a negative age band"""
+    db_session.add(Patient(
+        fiscal_code="FUTURE1234",
+        first_name="Erin",
+        last_name="Typo",
+        date_of_birth=date(date.today().year + 1, 1, 1),
+        gender="female"
+    ))
+    await db_session.commit()
+
+    chunks = [chunk async for chunk in _export_records(k=1, batch_size=10, criteria=[])]
+    records = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    assert [record["pseudonym"] for record in records] == [Pseudonymizer().pseudonym(test_patient.id)]
+    assert not records[0]["age_band"].startswith("-")
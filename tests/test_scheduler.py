@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.cron import CronTrigger
+from app.core.scheduler import Job, Scheduler
+from app.core.security import SecurityConfig
+from app.db.maintenance import maintenance_jobs
+from app.db.session import async_session, connect_unpooled
+from app.main import app
+from app.models.job_run import JobRun
+from app.models.user import User
+
+def test_cron_trigger_next_after():
+    """Test fire times of steps, fixed times and weekday ranges"""
+    moment = datetime(2024, 3, 8, 23, 54, 30, tzinfo=timezone.utc)  # a Friday
+
+    assert CronTrigger("*/10 * * * *").next_after(moment) == datetime(2024, 3, 9, 0, 0, tzinfo=timezone.utc)
+    assert CronTrigger("15 2 * * *").next_after(moment) == datetime(2024, 3, 9, 2, 15, tzinfo=timezone.utc)
+    assert CronTrigger("0 9 * * 1-5").next_after(moment) == datetime(2024, 3, 11, 9, 0, tzinfo=timezone.utc)
+    assert CronTrigger("0 0 29 2 *").next_after(moment) == datetime(2028, 2, 29, 0, 0, tzinfo=timezone.utc)
+
+    for expression in ["* * * *", "60 * * * *", "*/0 * * * *", "a * * * *"]:
+        with pytest.raises(ValueError):
+            CronTrigger(expression)
+
+@pytest.mark.asyncio
+async def test_single_leader_across_workers():
+    """Test that one scheduler holds the leader lock until it stops"""
+    first = Scheduler(async_session, connect_unpooled)
+    second = Scheduler(async_session, connect_unpooled)
+    try:
+        assert await first.ensure_leader()
+        assert await first.ensure_leader()
+        assert not await second.ensure_leader()
+
+        await first.stop()
+        assert not first.is_leader
+        assert await second.ensure_leader()
+    finally:
+        await first.stop()
+        await second.stop()
+
+@pytest.mark.asyncio
+async def test_runs_are_recorded(db_session: AsyncSession, test_user: User):
+    """Test run history, failure capture and the job metrics endpoint"""
+    async def failing(db: AsyncSession) -> None:
+        raise RuntimeError("boom")
+
+    jobs = maintenance_jobs({"refresh_tokens": "30 * * * *", "revoked_tokens": "*/15 * * * *"})
+    scheduler = Scheduler(async_session, connect_unpooled, jobs, jitter_seconds=0)
+    scheduler.add_job(Job("failing", failing, CronTrigger("0 0 * * *"), leader_only=False))
+    with pytest.raises(ValueError):
+        scheduler.add_job(Job("failing", failing, CronTrigger("0 0 * * *")))
+
+    try:
+        succeeded = await scheduler.run_job(scheduler.jobs["refresh_tokens"])
+        failed = await scheduler.run_job(scheduler.jobs["failing"])
+        await scheduler.run_job(scheduler.jobs["revoked_tokens"])
+    finally:
+        await scheduler.stop()
+
+    assert succeeded.status == "succeeded" and succeeded.details == {"deleted": 0}
+    assert failed.status == "failed" and failed.error == "RuntimeError: boom"
+    runs = (await db_session.execute(select(JobRun))).scalars().all()
+    assert {run.job for run in runs} == {"refresh_tokens", "failing", "revoked_tokens"}
+
+    token = SecurityConfig.create_access_token(
+        data={"sub": test_user.username, "scopes": ["admin"]}
+    )
+    app.state.scheduler = scheduler
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.get(
+                "/monitoring/jobs",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            history = await ac.get(
+                "/monitoring/jobs/failing/runs",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+    finally:
+        app.state.scheduler = None
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["running"] and not body["leader"]
+    jobs = {job["name"]: job for job in body["jobs"]}
+    assert jobs["refresh_tokens"]["schedule"] == "30 * * * *"
+    assert jobs["refresh_tokens"]["runs"] == 1
+    assert jobs["failing"]["failures"] == 1
+    assert jobs["failing"]["last_run"]["status"] == "failed"
+    assert history.json()[0]["error"] == "RuntimeError: boom"
@@ -0,0 +1,33 @@
+import pytest
+from app.server import ServerConfig, default_workers, parse_args, pool_size_per_worker
+
+def test_pool_split_stays_within_budget():
+    """Test that the per-worker pools and unpooled connections never exceed the budget"""
+    unpooled = ServerConfig.UNPOOLED_CONNECTIONS_PER_WORKER
+    for workers in range(1, 14):
+        pool = pool_size_per_worker(40, workers)
+        assert pool["pool_size"] >= 1
+        assert (pool["pool_size"] + pool["max_overflow"] + unpooled) * workers <= 40
+
+def test_pool_split_rejects_small_budget():
+    """Test that every worker needs at least one pooled connection"""
+    with pytest.raises(ValueError):
+        pool_size_per_worker(3, 4)
+    with pytest.raises(ValueError):
+        pool_size_per_worker(8, 4)
+
+def test_parse_args():
+    """Test launcher command line parsing"""
+    args = parse_args(["--workers", "4", "--db-connections", "40", "--port", "9000"])
+    assert (args.workers, args.db_connections, args.port) == (4, 40, 9000)
+    assert args.server == "auto"
+
+def test_default_workers_fit_the_budget(monkeypatch: pytest.MonkeyPatch):
+    """Test that the default worker count always starts, whatever the CPU count"""
+    servable = 40 // (ServerConfig.UNPOOLED_CONNECTIONS_PER_WORKER + 1)
+    for cpus in (1, 4, 14, 16, 32, 128):
+        monkeypatch.setattr("os.cpu_count", lambda: cpus)
+        workers = default_workers(40)
+        assert workers == min(cpus, servable)
+        pool_size_per_worker(40, workers)
+        assert parse_args(["--db-connections", "40"]).workers == workers
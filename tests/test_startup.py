@@ -0,0 +1,42 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Generous enough for slow CI machines; set IMPORT_TIME_BUDGET_MS to tighten locally
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+# Loaded on first use, never while importing the application
+DEFERRED_MODULES = {"asyncpg", "httpx", "passlib"}
+
+def _import_times(tmp_path: Path) -> Dict[str, int]:
+    """
+    Import ``app.main`` in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        Dict[str, int]: Cumulative import time in microseconds per module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+def test_app_import_stays_within_budget(tmp_path: Path):
+    """Test that importing the application stays fast and side-effect free"""
+    times = _import_times(tmp_path)
+
+    assert times["app.main"] / 1000 < IMPORT_TIME_BUDGET_MS
+    assert not DEFERRED_MODULES & {name.split(".")[0] for name in times}
+    assert not (tmp_path / "logs").exists()
@@ -0,0 +1,50 @@
+from datetime import date
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.aggregates import PatientAggregates
+from app.models.medical_condition import ConditionCategory, MedicalCondition, Severity
+from app.models.patient import Gender, Patient
+from app.models.user import User
+
+@pytest.mark.asyncio
+async def test_patient_stats_refresh(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test that refreshed aggregates count patients per dimension"""
+    condition = MedicalCondition(
+        patient_id=test_patient.id,
+        category=ConditionCategory.FRAILTY,
+        name="Sarcopenia",
+        diagnosis_date=date(2020, 5, 1),
+        severity=Severity.MILDLY,
+        diagnosing_doctor_id=test_user.id
+    )
+    db_session.add(condition)
+    await db_session.commit()
+
+    await PatientAggregates.refresh(db_session)
+    stats = await PatientAggregates.read(db_session)
+
+    assert stats.total == 1
+    assert stats.by_doctor == {str(test_user.id): 1}
+    assert sum(stats.by_age_band.values()) == 1
+    assert stats.by_category == {"frailty": 1}
+    assert stats.by_category_severity == {"frailty": {"mildly": 1}}
+    assert stats.refreshed_at is not None
+
+@pytest.mark.asyncio
+async def test_patient_stats_unknown_age_band(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test that a birth date in the future is counted in the unknown age band"""
+    db_session.add(Patient(
+        fiscal_code="FUTURE1234",
+        first_name="Jane",
+        last_name="Doe",
+        date_of_birth=date(2999, 1, 1),
+        gender=Gender.FEMALE,
+        primary_doctor_id=test_user.id
+    ))
+    await db_session.commit()
+
+    await PatientAggregates.refresh(db_session)
+    stats = await PatientAggregates.read(db_session)
+
+    assert stats.total == 2
+    assert stats.by_age_band["unknown"] == 1
\ No newline at end of file
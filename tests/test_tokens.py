@@ -0,0 +1,85 @@
+import json
+from datetime import timedelta
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError
+from pydantic import ValidationError
+from app.core.config import Settings
+from app.core.security import signing_keys
+from app.core.tokens import SigningKey, TokenService
+
+def _rsa_pem() -> str:
+    """Generate an RSA private key as PEM."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ).decode()
+
+def test_issue_and_verify_roundtrip():
+    """Test that issued tokens verify and carry a jti"""
+    service = TokenService(keys=[SigningKey(kid="k1", algorithm="HS256", private_key="secret")])
+    token = service.issue({"sub": "testdoctor", "scopes": ["doctor"]}, timedelta(minutes=5))
+
+    claims = service.verify(token)
+
+    assert claims["sub"] == "testdoctor"
+    assert claims["scopes"] == ["doctor"]
+    assert claims["jti"]
+    assert service.verify(token) == claims
+
+def test_key_rotation_by_kid():
+    """Test that tokens signed with a retired key still verify"""
+    old_key = SigningKey(kid="old", algorithm="HS256", private_key="old-secret")
+    new_key = SigningKey(kid="new", algorithm="RS256", private_key=_rsa_pem())
+    old_service = TokenService(keys=[old_key])
+    old_token = old_service.issue({"sub": "testdoctor"}, timedelta(minutes=5))
+
+    service = TokenService(keys=[old_key, new_key], active_kid="new")
+    new_token = service.issue({"sub": "testnurse"}, timedelta(minutes=5))
+
+    assert service.verify(old_token)["sub"] == "testdoctor"
+    assert service.verify(new_token)["sub"] == "testnurse"
+    assert [key["kid"] for key in service.jwks()["keys"]] == ["new"]
+
+def test_revoked_token_is_rejected():
+    """Test that revocation applies to memoized tokens"""
+    service = TokenService(keys=[SigningKey(kid="k1", algorithm="HS256", private_key="secret")])
+    token = service.issue({"sub": "testdoctor"}, timedelta(minutes=5))
+    claims = service.verify(token)
+
+    service.revoke(claims["jti"], claims["exp"])
+
+    with pytest.raises(JWTError):
+        service.verify(token)
+
+def test_expired_token_is_rejected():
+    """Test that expired tokens fail verification"""
+    service = TokenService(keys=[SigningKey(kid="k1", algorithm="HS256", private_key="secret")])
+    token = service.issue({"sub": "testdoctor"}, timedelta(seconds=-1))
+
+    with pytest.raises(JWTError):
+        service.verify(token)
+
+def test_key_set_from_settings(monkeypatch: pytest.MonkeyPatch):
+    """Test that a configured key set signs with the active key and publishes public keys"""
+    monkeypatch.setenv("SECURITY__SIGNING_KEYS", json.dumps([
+        {"kid": "2026-09", "algorithm": "HS256", "private_key": "old-secret"},
+        {"kid": "2026-10", "algorithm": "RS256", "private_key": _rsa_pem()},
+    ]))
+    monkeypatch.setenv("SECURITY__ACTIVE_KID", "2026-10")
+    settings = Settings().security
+    old_key = SigningKey(kid="2026-09", algorithm="HS256", private_key="old-secret")
+    old_token = TokenService(keys=[old_key]).issue({"sub": "testdoctor"}, timedelta(minutes=5))
+
+    service = TokenService(keys=signing_keys(settings), active_kid=settings.active_kid)
+
+    assert service.verify(old_token)["sub"] == "testdoctor"
+    assert service.verify(service.issue({"sub": "testnurse"}, timedelta(minutes=5)))["sub"] == "testnurse"
+    assert [key["kid"] for key in service.jwks()["keys"]] == ["2026-10"]
+
+    monkeypatch.setenv("SECURITY__ACTIVE_KID", "2026-11")
+    with pytest.raises(ValidationError):
+        Settings()
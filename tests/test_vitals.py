@@ -0,0 +1,146 @@
+import asyncio
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.live_feed import LiveFeedConfig, VitalsFeed
+from app.core.security import SecurityConfig
+from app.db.session import connect_unpooled
+from app.main import app
+from app.models.patient import Patient
+from app.models.user import User
+from app.models.vital_signs import VitalSigns
+
+def _headers(user: User, role: str) -> dict:
+    """Bearer header for a user acting with one role scope."""
+    token = SecurityConfig.create_access_token(data={"sub": user.username, "scopes": [role]})
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.mark.asyncio
+async def test_ingest_notifies_subscribers(db_session: AsyncSession, test_user: User, test_patient: Patient):
+    """Test that a recorded measurement reaches only the subscriptions following its patient"""
+    other = Patient(
+        fiscal_code="OTHER12345",
+        first_name="Jane",
+        last_name="Roe",
+        date_of_birth=test_patient.date_of_birth,
+        gender="female"
+    )
+    db_session.add(other)
+    await db_session.commit()
+
+    feed = VitalsFeed(connect_unpooled)
+    following = await feed.subscribe([test_patient.id])
+    elsewhere = await feed.subscribe([other.id])
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post(
+                "/vitals/",
+                json={
+                    "patient_id": str(test_patient.id),
+                    "measured_at": "2024-03-01T08:30:00+01:00",
+                    "heart_rate": 72,
+                    "oxygen_saturation": 97.5,
+                },
+                headers=_headers(test_user, "doctor")
+            )
+            forbidden = await ac.post(
+                "/vitals/",
+                json={"patient_id": str(other.id), "measured_at": "2024-03-01T08:30:00Z"},
+                headers=_headers(test_user, "doctor")
+            )
+        assert response.status_code == 200
+        assert forbidden.status_code == 403
+
+        event = await asyncio.wait_for(following.queue.get(), 5)
+        assert event["id"] == response.json()["id"]
+        assert event["heart_rate"] == 72
+        assert event["measured_by_id"] == str(test_user.id)
+        assert elsewhere.queue.empty()
+    finally:
+        await feed.stop()
+
+    stored = (await db_session.execute(select(VitalSigns))).scalars().all()
+    assert len(stored) == 1
+
+@pytest.mark.asyncio
+async def test_stream_drops_slow_clients(test_user: User, test_patient: Patient):
+    """Test the event stream and that a client whose buffer overflows is dropped"""
+    feed = VitalsFeed(connect_unpooled, queue_size=2)
+    app.state.vitals_feed = feed
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            denied = await ac.get(
+                "/vitals/stream",
+                params={"patient_ids": [str(test_patient.id)]},
+                headers=_headers(test_user, "researcher")
+            )
+            assert denied.status_code == 403
+
+            stream = asyncio.create_task(ac.get(
+                "/vitals/stream",
+                params={"patient_ids": [str(test_patient.id)]},
+                headers=_headers(test_user, "nurse")
+            ))
+            while feed.subscriber_count == 0:
+                await asyncio.sleep(0.01)
+            # Three events at once overflow the two-event buffer
+            for n in range(3):
+                feed.publish({"id": f"event-{n}", "patient_id": str(test_patient.id)})
+            response = await asyncio.wait_for(stream, 5)
+    finally:
+        await feed.stop()
+        app.state.vitals_feed = None
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    body = response.text
+    assert "id: event-0\nevent: vitals" in body
+    assert "id: event-1\nevent: vitals" in body
+    assert "event-2" not in body
+    assert body.rstrip().split("\n\n")[-1].startswith("event: dropped")
+    assert feed.dropped_total == 1
+    assert feed.subscriber_count == 0
+
+@pytest.mark.asyncio
+async def test_stop_ends_idle_streams(test_user: User, test_patient: Patient, monkeypatch: pytest.MonkeyPatch):
+    """Test that stopping the feed ends a waiting stream without waiting for the heartbeat"""
+    monkeypatch.setattr(LiveFeedConfig, "HEARTBEAT_SECONDS", 60)
+    feed = VitalsFeed(connect_unpooled)
+    app.state.vitals_feed = feed
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            stream = asyncio.create_task(ac.get(
+                "/vitals/stream",
+                params={"patient_ids": [str(test_patient.id)]},
+                headers=_headers(test_user, "nurse")
+            ))
+            while feed.subscriber_count == 0 or not feed._listening.is_set():
+                await asyncio.sleep(0.01)
+            await feed.stop()
+            response = await asyncio.wait_for(stream, 5)
+    finally:
+        await feed.stop()
+        app.state.vitals_feed = None
+
+    last = response.text.rstrip().split("\n\n")[-1]
+    assert last.startswith("event: dropped")
+    assert "Server stopping" in last
+
+@pytest.mark.asyncio
+async def test_connection_loss_drops_subscriptions(db_session: AsyncSession, test_patient: Patient):
+    """Test that subscriptions are dropped when the listening connection is lost"""
+    feed = VitalsFeed(connect_unpooled)
+    subscription = await feed.subscribe([test_patient.id])
+    try:
+        await db_session.execute(text(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE query ILIKE 'LISTEN%' AND pid <> pg_backend_pid()"
+        ))
+        assert await asyncio.wait_for(subscription.queue.get(), 5) is None
+        assert subscription.dropped
+        assert subscription.reason == "Live feed connection lost"
+        assert feed.subscriber_count == 0
+    finally:
+        await feed.stop()